@@ -0,0 +1,221 @@
+import argparse
+import time
+import numpy as np
+import networkx as nx
+
+from BoardTables import BoardTables
+from StrategyEngine import StrategyEngine
+
+"""Runs many independent automated games on the same board in lock-step, one array operation per step for all games"""
+class BatchSimulator:
+    def __init__(self, graph, tables=None):
+        self.graph = graph
+        self.tables = tables if tables is not None else BoardTables(graph)
+
+        # Cop placement does not depend on the robber so it is the same for every game
+        engine = StrategyEngine(graph)
+        engine.cop_strategy()
+        self.start_cops = [self.tables.node_id(node) for node in engine.cop_nodes]
+        self.start_column_path = self.tables.node_id(engine.target_column_path[0])
+
+        # Cop 1 approach paths, keyed on (start node, target node) and padded with -1 into one array
+        self.path_ids = {}
+        self.path_list = []
+        self.paths = np.full((0, 1), -1, dtype=np.int32)
+
+    """Plays n_games games until every game has a capture or max_turns is reached, unfinished games get a capture turn of -1"""
+    def run(self, n_games, seed=None, max_turns=10000):
+        rng = np.random.default_rng(seed)
+        t = self.tables
+        games = np.arange(n_games)
+
+        # Player States, one row per game, column paths are stored by their head node
+        self.cops = np.tile(np.array(self.start_cops, dtype=np.int32), (n_games, 1))
+        self.cop1_pointer = np.zeros(n_games, dtype=np.int8)
+        self.target_column_path = np.full(n_games, self.start_column_path, dtype=np.int32)
+        self.target_node = np.full(n_games, -1, dtype=np.int32)
+        self.target_path = np.full(n_games, -1, dtype=np.int32)
+        self.swap_count = np.zeros(n_games, dtype=np.int32)
+
+        # Robber placement on any node not occupied by a cop
+        free_nodes = np.setdiff1d(np.arange(t.node_count), self.cops[0])
+        self.robber = free_nodes[rng.integers(len(free_nodes), size=n_games)].astype(np.int32)
+        turn_count = np.ones(n_games, dtype=np.int32)
+        capture_turn = np.full(n_games, -1, dtype=np.int32)
+
+        active = games
+        while len(active) and turn_count[active[0]] < max_turns:
+            # Cops move then capture check
+            self.cop_moves(active)
+            turn_count[active] += 1
+            active = self.remove_captured(active, turn_count, capture_turn)
+
+            # Robber picks stay, down, up, right or left, moves off the board mean staying
+            if len(active) and turn_count[active[0]] < max_turns:
+                choices = rng.integers(5, size=len(active))
+                self.robber[active] = t.neighbours[self.robber[active], choices]
+                turn_count[active] += 1
+                active = self.remove_captured(active, turn_count, capture_turn)
+
+        return {"capture_turn": capture_turn, "swap_count": self.swap_count.copy()}
+
+    """Records the capture turn of captured games and returns the games still running"""
+    def remove_captured(self, active, turn_count, capture_turn):
+        cops = self.cops[active]
+        robber = self.robber[active]
+        captured = (cops[:, 0] == robber) | (cops[:, 1] == robber)
+        capture_turn[active[captured]] = turn_count[active[captured]]
+        return active[~captured]
+
+    """Cop strategy for a set of games, mirrors StrategyEngine.cop_strategy"""
+    def cop_moves(self, games):
+        t = self.tables
+        p1 = self.cop1_pointer[games].astype(np.intp)
+        p2 = 1 - p1
+        cop1 = self.cops[games, p1]
+        cop2 = self.cops[games, p2]
+        robber = self.robber[games]
+        target = self.target_column_path[games]
+
+        # Cop 1 on the target column path, guarded if it reaches the robber's closest path node first
+        on_path = t.column_path_of[cop1] == t.column_path_of[target]
+        guarded = np.zeros(len(games), dtype=bool)
+        if on_path.any():
+            robber_target, robber_distance = self.closest_on_column_path(robber[on_path], target[on_path])
+            guarded[on_path] = t.distances[cop1[on_path], robber_target] <= robber_distance
+            guard = on_path & ~guarded
+            cop1[guard] = self.guard_moves(cop1[guard], robber[guard])
+
+        # Cop 1 off the target column path follows its path towards it
+        approach = ~on_path
+        if approach.any():
+            self.update_target_paths(games[approach], cop1[approach], target[approach])
+            paths = self.paths[self.target_path[games[approach]]]
+            on_step = paths[:, :-1] == cop1[approach, None]
+            found = on_step.any(axis=1)
+            step = on_step.argmax(axis=1) + 1
+            next_node = paths[np.arange(len(paths)), step]
+            moved = found & (next_node >= 0)
+            cop1[np.flatnonzero(approach)[moved]] = next_node[moved]
+
+        # Cop 2 keeps guarding the column path it is on
+        robber_target, robber_distance = self.closest_on_column_path(robber, t.path_head[cop2])
+        guard = ~(t.distances[cop2, robber_target] <= robber_distance)
+        cop2[guard] = self.guard_moves(cop2[guard], robber[guard])
+
+        self.cops[games, p1] = cop1
+        self.cops[games, p2] = cop2
+
+        # Guarded games move the target to the next column path in the robber's component and swap roles
+        swapped = games[guarded]
+        if len(swapped):
+            heads = self.target_column_path[swapped]
+            next_node = self.adjacent_path_nodes(heads, self.robber[swapped])
+            self.target_column_path[swapped] = np.where(next_node >= 0, t.path_head[np.maximum(next_node, 0)], heads)
+            self.cop1_pointer[swapped] = 1 - self.cop1_pointer[swapped]
+            self.swap_count[swapped] += 1
+
+    """Last node beside each column path, in the strategy's scan order, that is in the robber's component of G-P, -1 if none"""
+    def adjacent_path_nodes(self, heads, robber):
+        t = self.tables
+        path_ids = t.column_path_of[heads]
+        members = t.column_paths[path_ids]
+        robber_label = t.component_of[path_ids, robber]
+        ranks = t.path_rank(members, heads[:, None])
+
+        # Left is checked before right for each path node, so right wins on the same node
+        best_score = np.full(len(heads), -1, dtype=np.int64)
+        best_node = np.full(len(heads), -1, dtype=np.int32)
+        for option, side in ((4, 0), (3, 1)):
+            beside = t.neighbours[members, option]
+            in_component = ((members >= 0) & (beside != members) & (robber_label[:, None] >= 0)
+                            & (t.component_of[path_ids[:, None], beside] == robber_label[:, None]))
+            score = np.where(in_component, ranks * 2 + side, -1)
+            column = score.argmax(axis=1)
+            rows = np.arange(len(heads))
+            better = score[rows, column] > best_score
+            best_score[better] = score[rows, column][better]
+            best_node[better] = beside[rows, column][better]
+        return best_node
+
+    """Closest node on each column path to each node, earliest node in the path's order wins ties, and the distance to it"""
+    def closest_on_column_path(self, nodes, heads):
+        t = self.tables
+        members = t.column_paths[t.column_path_of[heads]]
+        distances = t.distances[nodes[:, None], members].astype(np.int64)
+        score = distances * t.column_paths.shape[1] + t.path_rank(members, heads[:, None])
+        score[members < 0] = np.iinfo(np.int64).max
+        closest = score.argmin(axis=1)
+        rows = np.arange(len(nodes))
+        return members[rows, closest], distances[rows, closest]
+
+    """Moves cops one row towards the robber's row when the node exists"""
+    def guard_moves(self, cops, robber):
+        t = self.tables
+        next_move = np.where(t.node_rows[cops] > t.node_rows[robber], t.up[cops],
+                             np.where(t.node_rows[cops] < t.node_rows[robber], t.down[cops], -1))
+        return np.where(next_move >= 0, next_move, cops)
+
+    """Picks a new target node and path for games whose target node is no longer on the target column path"""
+    def update_target_paths(self, games, cop1, target):
+        t = self.tables
+        target_node = self.target_node[games]
+        stale = (target_node < 0) | (t.column_path_of[np.maximum(target_node, 0)] != t.column_path_of[target])
+        if not stale.any():
+            return
+
+        new_nodes, _ = self.closest_on_column_path(cop1[stale], target[stale])
+        new_paths = np.empty(len(new_nodes), dtype=np.int32)
+        added = False
+        # Paths come from nx.shortest_path like the single game engine, only new (start, target) pairs are searched
+        for i, (start, end) in enumerate(zip(cop1[stale].tolist(), new_nodes.tolist())):
+            key = (start, end)
+            if key not in self.path_ids:
+                path = nx.shortest_path(self.graph, t.node_of(start), t.node_of(end))
+                self.path_ids[key] = len(self.path_list)
+                self.path_list.append([t.node_id(node) for node in path])
+                added = True
+            new_paths[i] = self.path_ids[key]
+
+        if added:
+            width = max(len(path) for path in self.path_list)
+            self.paths = np.full((len(self.path_list), width + 1), -1, dtype=np.int32)
+            for i, path in enumerate(self.path_list):
+                self.paths[i, :len(path)] = path
+
+        self.target_node[games[stale]] = new_nodes
+        self.target_path[games[stale]] = new_paths
+
+"""Times the batch simulator against the single game engine on the same board and prints games per second"""
+def benchmark(graph, n_games=5000, engine_games=200, seed=0, max_turns=10000):
+    start = time.perf_counter()
+    tables = BoardTables(graph)
+    table_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    engine = StrategyEngine(graph, seed=seed)
+    engine_turns = [engine.play_game(max_turns) for _ in range(engine_games)]
+    engine_rate = engine_games / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    results = BatchSimulator(graph, tables).run(n_games, seed=seed, max_turns=max_turns)
+    batch_rate = n_games / (time.perf_counter() - start)
+
+    finished = results["capture_turn"][results["capture_turn"] >= 0]
+    engine_finished = [turn for turn in engine_turns if turn is not None]
+    print(f"Board: {graph.number_of_nodes()} nodes, tables built in {table_time:.2f}s")
+    print(f"Single game engine: {engine_rate:.1f} games/sec, mean capture turn {np.mean(engine_finished):.1f}")
+    print(f"Batch simulator:    {batch_rate:.1f} games/sec, mean capture turn {finished.mean():.1f}")
+    print(f"Speed up: {batch_rate / engine_rate:.1f}x")
+    return {"engine_rate": engine_rate, "batch_rate": batch_rate}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the batched simulator against the single game engine")
+    parser.add_argument("--rows", type=int, default=20)
+    parser.add_argument("--cols", type=int, default=20)
+    parser.add_argument("--games", type=int, default=5000)
+    parser.add_argument("--engine-games", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    benchmark(nx.grid_2d_graph(args.rows, args.cols), args.games, args.engine_games, args.seed)
@@ -0,0 +1,111 @@
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+import networkx as nx
+import numpy as np
+
+from BoardTables import mask_from_graph
+
+"""Node size the graph creator gives a rows x cols grid on a canvas of width x height pixels"""
+def node_size_for(rows, cols, width, height):
+    balance_factor = min(rows, cols) / max(rows, cols)
+    scaling_base = width * height / ((rows * cols) ** 1.1)
+    return max(5, min(350, int((scaling_base * balance_factor) ** 0.5)))
+
+"""Draws game states off screen with the Agg backend, styled like the strategy windows' display_graph
+
+The figure and its artists are made once for a board size and shared by every board of that size,
+drawing a state only moves the legal move, cop and robber markers and draws them over a saved copy of the board
+"""
+class BoardRenderer:
+    def __init__(self, graph, width=640, height=480, dpi=100, highlight_moves=False, node_size=None):
+        self.highlight_moves = highlight_moves
+        self.shape = mask_from_graph(graph).shape
+        self.node_size = node_size if node_size is not None else node_size_for(*self.shape, width, height)
+
+        # Artists are made on the full grid of this size and moved onto each board with set_board
+        grid = nx.grid_2d_graph(*self.shape)
+        self.pos = {(y, x): (x, -y) for y, x in grid.nodes}
+        first = list(grid.nodes)[:1]
+
+        self.figure = Figure(figsize=(width / dpi, height / dpi), dpi=dpi)
+        self.canvas = FigureCanvasAgg(self.figure)
+        ax = self.figure.add_subplot(111)
+
+        # Set scaling of figure to make graph unit distance
+        ax.set_aspect(1, adjustable="datalim", anchor="C")
+        self.figure.tight_layout(pad=0)
+        ax.set_axis_off()
+
+        # Single colour collections like display_graph, so squares snap to the same pixels
+        self.board_artist = nx.draw_networkx_nodes(grid, self.pos, ax=ax, nodelist=first, node_color='#6699cc',
+                                                   node_size=self.node_size, node_shape='s')
+        self.edge_artist = nx.draw_networkx_edges(grid, self.pos, ax=ax, edge_color="#cccccc")
+        self.legal_artist = nx.draw_networkx_nodes(grid, self.pos, ax=ax, nodelist=first, node_color="#66cc89",
+                                                   node_size=self.node_size, node_shape='s')
+        self.cop_artist = nx.draw_networkx_nodes(grid, self.pos, ax=ax, nodelist=first,
+                                                 node_color="blue", node_size=self.node_size*0.7)
+        self.robber_artist = nx.draw_networkx_nodes(grid, self.pos, ax=ax, nodelist=first,
+                                                    node_color="red", node_size=self.node_size*0.7)
+        self.ax = ax
+        self.markers = (self.legal_artist, self.cop_artist, self.robber_artist)
+        self.background = None
+        self.set_board(graph)
+
+    """Switches the artists to another board of the same size"""
+    def set_board(self, graph):
+        shape = mask_from_graph(graph).shape
+        if shape != self.shape:
+            raise ValueError(f"Board of size {shape} given to a renderer for size {self.shape}")
+        self.graph = graph
+        self.background = None
+        points = self.offsets(list(graph.nodes))
+        self.board_artist.set_offsets(points)
+        self.edge_artist.set_segments([(self.pos[u], self.pos[v]) for u, v in graph.edges])
+
+        # Fit the view to the board the way networkx does, node positions and edges padded by 5%
+        low, high = points.min(axis=0), points.max(axis=0)
+        pad = 0.05 * (high - low)
+        self.ax.ignore_existing_data_limits = True
+        self.ax.update_datalim(points)
+        if graph.number_of_edges():
+            self.ax.update_datalim([low - pad, high + pad])
+        self.ax.autoscale_view()
+
+    """Nodes highlighted as legal moves for a state, the same nodes display_graph highlights"""
+    def legal_moves(self, state):
+        if not self.highlight_moves:
+            return []
+        if state["is_placement_phase"]:
+            return [node for node in self.graph.nodes if node not in state["cop_nodes"]]
+        if state["is_robber_turn"]:
+            return list(self.graph.neighbors(state["robber_node"])) + [state["robber_node"]]
+        return []
+
+    """Updates the artists for a state made by copy_state"""
+    def set_state(self, state):
+        self.legal_artist.set_offsets(self.offsets(self.legal_moves(state)))
+        self.cop_artist.set_offsets(self.offsets(state["cop_nodes"]))
+        robber = [] if state["robber_node"] is None else [state["robber_node"]]
+        self.robber_artist.set_offsets(self.offsets(robber))
+
+    """Draws a state and returns it as a height x width x 3 array of RGB bytes"""
+    def render(self, state):
+        # The board and edges are drawn once, later states restore them and draw just the markers
+        if self.background is None:
+            for artist in self.markers:
+                artist.set_visible(False)
+            self.canvas.draw()
+            self.background = self.canvas.copy_from_bbox(self.figure.bbox)
+            for artist in self.markers:
+                artist.set_visible(True)
+        else:
+            self.canvas.restore_region(self.background)
+
+        self.set_state(state)
+        for artist in self.markers:
+            self.ax.draw_artist(artist)
+        return np.asarray(self.canvas.buffer_rgba())[:, :, :3].copy()
+
+    """Drawing positions of nodes as an n x 2 array"""
+    def offsets(self, nodes):
+        return np.array([self.pos[node] for node in nodes], dtype=float).reshape(-1, 2)
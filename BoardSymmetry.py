@@ -0,0 +1,127 @@
+from collections import OrderedDict
+import hashlib
+import numpy as np
+
+# The 8 symmetries of the square lattice as (transpose, flip rows, flip cols), applied in that order, 0 is the identity
+TRANSFORMS = tuple((transpose, flip_rows, flip_cols)
+                   for transpose in (False, True) for flip_rows in (False, True) for flip_cols in (False, True))
+
+"""Mask with empty rows and columns around the board removed, and the row and column it started at"""
+def trim(mask):
+    mask = np.asarray(mask, dtype=bool)
+    rows = np.flatnonzero(mask.any(axis=1))
+    cols = np.flatnonzero(mask.any(axis=0))
+    return mask[rows[0]:rows[-1] + 1, cols[0]:cols[-1] + 1], (int(rows[0]), int(cols[0]))
+
+"""Mask after one of the TRANSFORMS"""
+def transform_mask(mask, transform):
+    transpose, flip_rows, flip_cols = TRANSFORMS[transform]
+    if transpose:
+        mask = mask.T
+    if flip_rows:
+        mask = mask[::-1]
+    if flip_cols:
+        mask = mask[:, ::-1]
+    return mask
+
+"""Rows and columns of nodes on a board of the given shape moved by one of the TRANSFORMS"""
+def transform_coordinates(rows, cols, shape, transform):
+    transpose, flip_rows, flip_cols = TRANSFORMS[transform]
+    height, width = shape
+    if transpose:
+        rows, cols, height, width = cols, rows, width, height
+    if flip_rows:
+        rows = height - 1 - rows
+    if flip_cols:
+        cols = width - 1 - cols
+    return rows, cols
+
+"""Canonical orientation of a board, returns the trimmed mask which is smallest over the 8 symmetries and its transform
+
+Each symmetry is one pass over the packed bitmask, so the whole search is linear in the board's area
+"""
+def canonical_form(mask):
+    mask, _ = trim(mask)
+    best, best_key, best_transform = None, None, 0
+    for transform in range(len(TRANSFORMS)):
+        candidate = transform_mask(mask, transform)
+        key = (candidate.shape, np.packbits(candidate).tobytes())
+        if best_key is None or key < best_key:
+            best, best_key, best_transform = candidate, key, transform
+    return np.ascontiguousarray(best), best_transform
+
+"""Hash shared by a board and all of its rotations, reflections and translations, the board_hash of its canonical form"""
+def canonical_hash(mask):
+    canonical, _ = canonical_form(mask)
+    digest = hashlib.sha1(np.array(canonical.shape, dtype=np.int64).tobytes())
+    digest.update(np.packbits(canonical).tobytes())
+    return digest.hexdigest()
+
+"""Node id in the canonical board of every node id in mask, node ids follow row major order like BoardTables"""
+def canonical_permutation(mask):
+    trimmed, _ = trim(mask)
+    canonical, transform = canonical_form(trimmed)
+    rows, cols = np.nonzero(trimmed)
+    rows, cols = transform_coordinates(rows, cols, trimmed.shape, transform)
+    canonical_ids = np.full(canonical.shape, -1, dtype=np.int64)
+    canonical_ids[canonical] = np.arange(int(canonical.sum()))
+    return canonical_ids[rows, cols]
+
+"""Maps a canonical board's node back to a (row, col) node of mask"""
+def node_from_canonical(node, mask):
+    trimmed, (row_offset, col_offset) = trim(mask)
+    canonical, transform = canonical_form(trimmed)
+    transpose, flip_rows, flip_cols = TRANSFORMS[transform]
+    row, col = node
+    height, width = canonical.shape
+    if flip_cols:
+        col = width - 1 - col
+    if flip_rows:
+        row = height - 1 - row
+    if transpose:
+        row, col = col, row
+    return (row + row_offset, col + col_offset)
+
+"""Reorders an array indexed by canonical node ids along its first node_axes axes to the node ids of mask"""
+def to_original(values, permutation, node_axes=1):
+    return values[np.ix_(*[permutation] * node_axes)] if node_axes > 1 else values[permutation]
+
+"""Reorders an array indexed by the node ids of mask along its first node_axes axes to canonical node ids"""
+def to_canonical(values, permutation, node_axes=1):
+    return to_original(values, np.argsort(permutation), node_axes)
+
+"""Keeps per-node results of a few recent boards in canonical orientation, so equivalent boards share one entry
+
+Only results which don't depend on the board's orientation belong here, such as distances, the cop strategy
+works along columns from the right hand side so its capture times change when a board is turned
+"""
+class SymmetricCache:
+    def __init__(self, node_axes=1, max_size=8, max_bytes=256 * 2 ** 20):
+        self.node_axes = node_axes
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    """Result for mask in its own orientation, None if no equivalent board is cached"""
+    def get(self, mask):
+        key = canonical_hash(mask)
+        if key not in self.entries:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return to_original(self.entries[key], canonical_permutation(mask), self.node_axes)
+
+    """Stores the result for mask, results bigger than max_bytes are not kept"""
+    def put(self, mask, values):
+        if values.nbytes > self.max_bytes:
+            return
+        self.entries[canonical_hash(mask)] = to_canonical(values, canonical_permutation(mask), self.node_axes)
+        self.trim()
+
+    """Drops the least recently used entries until the cache is within max_size and max_bytes"""
+    def trim(self):
+        while len(self.entries) > self.max_size or sum(v.nbytes for v in self.entries.values()) > self.max_bytes:
+            self.entries.popitem(last=False)
@@ -0,0 +1,299 @@
+import hashlib
+from collections import OrderedDict
+import numpy as np
+import networkx as nx
+
+from BoardSymmetry import SymmetricCache
+
+"""Builds a solid grid graph from a boolean mask, True cells become nodes"""
+def graph_from_mask(mask):
+    mask = np.asarray(mask, dtype=bool)
+    graph = nx.grid_2d_graph(*mask.shape)
+    graph.remove_nodes_from([(y, x) for y, x in zip(*np.nonzero(~mask))])
+    return graph
+
+"""Builds a boolean mask from a grid graph, the mask covers rows and columns 0 up to the largest node"""
+def mask_from_graph(graph):
+    rows = max(y for y, x in graph.nodes) + 1
+    cols = max(x for y, x in graph.nodes) + 1
+    mask = np.zeros((rows, cols), dtype=bool)
+    for y, x in graph.nodes:
+        mask[y, x] = True
+    return mask
+
+"""Stable hash of a board mask, used to name files cached for a board"""
+def board_hash(mask):
+    mask = np.asarray(mask, dtype=bool)
+    digest = hashlib.sha1(np.array(mask.shape, dtype=np.int64).tobytes())
+    digest.update(np.packbits(mask).tobytes())
+    return digest.hexdigest()
+
+# Distance tables of recently built boards, shared by boards which are the same up to a rotation or reflection
+DISTANCE_CACHE_BYTES = 256 * 2 ** 20
+distance_cache = SymmetricCache(node_axes=2, max_bytes=DISTANCE_CACHE_BYTES)
+
+# Bytes the distance and component tables of a board may take, None keeps both as full matrices
+memory_budget = None
+# Bytes counted against the budget besides the table data, for each table and for each row a RowCache keeps,
+# covering array headers and OrderedDict entries
+TABLE_OVERHEAD_BYTES = 4096
+ROW_OVERHEAD_BYTES = 256
+
+"""Sets the memory budget for tables built from now on
+
+Under a budget each board's component table gets up to half of it and the distance table the rest. A table whose
+full matrix doesn't fit keeps as many rows as fit, least recently used out, or computes each row when it's used.
+The shared distance cache keeps its own copy of each matrix, which the budget has no room for, so it is emptied
+and not used until the budget is lifted
+"""
+def set_memory_budget(budget):
+    global memory_budget
+    memory_budget = budget
+    distance_cache.max_bytes = DISTANCE_CACHE_BYTES if budget is None else 0
+    distance_cache.trim()
+
+"""Node rows of a table computed on demand, indexed like the full matrix with table[rows, cols]
+
+At most capacity rows are kept, least recently used out first, with a capacity of 0 every lookup computes its rows
+"""
+class RowCache:
+    def __init__(self, row_count, width, dtype, compute_row, capacity):
+        self.shape = (row_count, width)
+        self.dtype = np.dtype(dtype)
+        self.compute_row = compute_row
+        self.capacity = capacity
+        self.rows = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def row_bytes(self):
+        return self.shape[1] * self.dtype.itemsize
+
+    @property
+    def nbytes(self):
+        return len(self.rows) * self.row_bytes
+
+    """Most bytes the table is counted as against the memory budget once capacity rows are kept"""
+    @property
+    def max_bytes(self):
+        return TABLE_OVERHEAD_BYTES + self.capacity * (self.row_bytes + ROW_OVERHEAD_BYTES)
+
+    """How the table is held, rows when some are kept and bfs when every row is computed"""
+    @property
+    def mode(self):
+        return "rows" if self.capacity else "bfs"
+
+    """One row, computed if it isn't kept"""
+    def row(self, index):
+        if index in self.rows:
+            self.hits += 1
+            self.rows.move_to_end(index)
+            return self.rows[index]
+        self.misses += 1
+        values = self.compute_row(index)
+        if self.capacity:
+            self.rows[index] = values
+            if len(self.rows) > self.capacity:
+                self.rows.popitem(last=False)
+        return values
+
+    def __getitem__(self, key):
+        rows, cols = key
+        rows = np.asarray(rows)
+        # Each distinct row is found once, then the lookup indexes the block of them like the full matrix
+        unique, inverse = np.unique(rows, return_inverse=True)
+        block = np.stack([self.row(index) for index in unique.tolist()])
+        return block[inverse.reshape(rows.shape), cols]
+
+"""How a table is held: matrix, rows or bfs"""
+def table_mode(table):
+    return table.mode if isinstance(table, RowCache) else "matrix"
+
+"""Rows a table may keep under a share of the memory budget, None when the full matrix fits"""
+def budget_capacity(row_count, row_bytes, share):
+    if memory_budget is None or TABLE_OVERHEAD_BYTES + row_count * row_bytes <= share:
+        return None
+    return max(int((share - TABLE_OVERHEAD_BYTES) // (row_bytes + ROW_OVERHEAD_BYTES)), 0)
+
+"""Array form of a board so strategy lookups become indexing operations, node ids follow row major order"""
+class BoardTables:
+    # Arrays which fully describe the tables, used when saving or sharing them
+    array_names = ("mask", "node_rows", "node_cols", "neighbours", "up", "down",
+                   "column_path_of", "column_paths", "column_path_lengths",
+                   "path_head", "distances", "component_of")
+
+    def __init__(self, graph):
+        self.mask = mask_from_graph(graph)
+        self.build()
+
+    """Tables made from arrays saved with array_names, distances and components left out are built again"""
+    @classmethod
+    def from_arrays(cls, arrays):
+        tables = cls.__new__(cls)
+        for name in cls.array_names:
+            if name in arrays:
+                setattr(tables, name, np.asarray(arrays[name]))
+        tables.node_count = len(tables.node_rows)
+        tables.cell_ids = np.full(tables.mask.shape, -1, dtype=np.int32)
+        tables.cell_ids[tables.node_rows, tables.node_cols] = np.arange(tables.node_count, dtype=np.int32)
+        if "component_of" not in arrays:
+            tables.build_components()
+        if "distances" not in arrays:
+            tables.build_distances()
+        return tables
+
+    """Arrays of array_names to save or share, tables held as rows are left out"""
+    def arrays(self):
+        return {name: getattr(self, name) for name in self.array_names
+                if isinstance(getattr(self, name), np.ndarray)}
+
+    """Rebuilds every table from the mask"""
+    def build(self):
+        rows, cols = self.mask.shape
+        self.node_rows, self.node_cols = (a.astype(np.int32) for a in np.nonzero(self.mask))
+        self.node_count = len(self.node_rows)
+
+        # Grid cell to node id, -1 for removed cells, padded by one so edges never go out of range
+        cell_id = np.full((rows + 2, cols + 2), -1, dtype=np.int32)
+        cell_id[self.node_rows + 1, self.node_cols + 1] = np.arange(self.node_count, dtype=np.int32)
+        self.cell_ids = cell_id[1:-1, 1:-1]
+        r, c = self.node_rows + 1, self.node_cols + 1
+        self.down = cell_id[r + 1, c]
+        self.up = cell_id[r - 1, c]
+        right = cell_id[r, c + 1]
+        left = cell_id[r, c - 1]
+
+        # Robber move options in the same order as robber_strategy, a missing node means staying put
+        ids = np.arange(self.node_count, dtype=np.int32)
+        options = [ids, self.down, self.up, right, left]
+        self.neighbours = np.stack([np.where(o >= 0, o, ids) for o in options], axis=1)
+
+        # find_column_path lists the nodes above nearest first, so a path's order is set by its first node, the head
+        self.path_head = np.where(self.up >= 0, self.up, ids)
+
+        self.build_column_paths()
+        self.build_components()
+        self.build_distances()
+
+    """Assigns every node to its column path, paths are numbered in row major order of their top node"""
+    def build_column_paths(self):
+        tops = np.flatnonzero(self.up < 0)
+        self.column_path_of = np.empty(self.node_count, dtype=np.int32)
+        lengths = np.empty(len(tops), dtype=np.int32)
+        paths = []
+        for path_id, node in enumerate(tops):
+            path = [node]
+            while self.down[path[-1]] >= 0:
+                path.append(self.down[path[-1]])
+            self.column_path_of[path] = path_id
+            lengths[path_id] = len(path)
+            paths.append(path)
+
+        # Paths padded with -1 so they can be indexed as one array
+        self.column_path_lengths = lengths
+        self.column_paths = np.full((len(paths), lengths.max()), -1, dtype=np.int32)
+        for path_id, path in enumerate(paths):
+            self.column_paths[path_id, :len(path)] = path
+
+    """All pairs BFS distances, every source is expanded at once one level at a time"""
+    def build_distances(self):
+        n = self.node_count
+        dtype = np.int16 if n < np.iinfo(np.int16).max else np.int32
+        if memory_budget is not None:
+            component_bytes = (TABLE_OVERHEAD_BYTES + self.component_of.nbytes
+                               if isinstance(self.component_of, np.ndarray) else self.component_of.max_bytes)
+            capacity = budget_capacity(n, n * np.dtype(dtype).itemsize, memory_budget - component_bytes)
+            if capacity is not None:
+                self.distances = RowCache(n, n, dtype, self.distance_row, capacity)
+                return
+
+        # Distances don't depend on how a board is turned, so rotations and reflections of a recent board reuse them
+        cached = distance_cache.get(self.mask)
+        if cached is not None:
+            self.distances = cached
+            return
+
+        self.distances = np.full((n, n), -1, dtype=dtype)
+        sources = np.arange(n, dtype=np.int64)
+        frontier_nodes = sources.copy()
+        self.distances[sources, frontier_nodes] = 0
+
+        level = 0
+        while len(sources):
+            level += 1
+            # Step every frontier entry to its four neighbours and keep the unvisited ones
+            steps = self.neighbours[frontier_nodes, 1:]
+            sources = np.repeat(sources, 4)
+            frontier_nodes = steps.ravel().astype(np.int64)
+            keep = self.distances[sources, frontier_nodes] < 0
+            flat = np.unique(sources[keep] * n + frontier_nodes[keep])
+            sources, frontier_nodes = flat // n, flat % n
+            self.distances[sources, frontier_nodes] = level
+        distance_cache.put(self.mask, self.distances)
+
+    """BFS distances from one node, used when the distance table is held as rows"""
+    def distance_row(self, source):
+        row = np.full(self.node_count, -1, dtype=self.distances.dtype)
+        row[source] = 0
+        frontier = np.array([source])
+        level = 0
+        while len(frontier):
+            level += 1
+            steps = np.unique(self.neighbours[frontier, 1:])
+            frontier = steps[row[steps] < 0]
+            row[frontier] = level
+        return row
+
+    """Labels the components of G-P for every column path P"""
+    def build_components(self):
+        path_count = len(self.column_paths)
+        capacity = (budget_capacity(path_count, self.node_count * 4, memory_budget // 2)
+                    if memory_budget is not None else None)
+        if capacity is not None:
+            self.component_of = RowCache(path_count, self.node_count, np.int32, self.component_labels, capacity)
+            return
+        self.component_of = np.full((path_count, self.node_count), -1, dtype=np.int32)
+        for path_id in range(path_count):
+            self.component_of[path_id] = self.component_labels(path_id)
+
+    """Component labels of G-P for one column path P, -1 on the path itself"""
+    def component_labels(self, path_id):
+        labels = np.full(self.node_count, -1, dtype=np.int32)
+        removed = self.column_path_of == path_id
+        label = 0
+        for start in range(self.node_count):
+            if removed[start] or labels[start] >= 0:
+                continue
+            labels[start] = label
+            stack = [start]
+            while stack:
+                node = stack.pop()
+                for neighbour in self.neighbours[node, 1:]:
+                    if not removed[neighbour] and labels[neighbour] < 0:
+                        labels[neighbour] = label
+                        stack.append(neighbour)
+            label += 1
+        return labels
+
+    """Position of nodes in the column path listed from each head, rows above the head come first counting upwards"""
+    def path_rank(self, nodes, heads):
+        head_rows = self.node_rows[heads]
+        top_rows = self.node_rows[self.column_paths[self.column_path_of[heads], 0]]
+        rows = self.node_rows[nodes]
+        return np.where(rows <= head_rows, head_rows - rows, rows - top_rows)
+
+    """Node ids of the column path in the order find_column_path gives when it starts below the head"""
+    def ordered_column_path(self, head):
+        path = self.column_paths[self.column_path_of[head]]
+        path = path[path >= 0]
+        ranks = self.path_rank(path, np.full(len(path), head))
+        return path[np.argsort(ranks)]
+
+    """Node id of a (row, col) node"""
+    def node_id(self, node):
+        return int(self.cell_ids[node])
+
+    """(row, col) node of a node id"""
+    def node_of(self, node_id):
+        return (int(self.node_rows[node_id]), int(self.node_cols[node_id]))
@@ -0,0 +1,177 @@
+import argparse
+import time
+import numpy as np
+import networkx as nx
+import scipy.sparse as sparse
+from scipy.sparse.linalg import splu
+
+from BatchSimulator import BatchSimulator
+from BoardTables import graph_from_mask
+
+# Columns of a chain state, the board before the cops' move: cop nodes, cop 1 pointer, target column path head,
+# target node, cop 1 path id and the robber node
+STATE_COLUMNS = 7
+
+"""Every state the random robber can reach against the cop strategy, found one cop move and five robber moves at a time
+
+The cops' move is deterministic, so each state leads either to a capture or to one state for each robber choice.
+Returns the tables, the start state of each robber node, whether each state ends in capture on the cops' move,
+and the robber moves between states as a sparse matrix counting each of the five choices
+"""
+def build_chain(graph, tables=None, max_states=2000000):
+    sim = BatchSimulator(graph, tables)
+    t = sim.tables
+    start_nodes = np.setdiff1d(np.arange(t.node_count), sim.start_cops).astype(np.int32)
+    starts = np.empty((len(start_nodes), STATE_COLUMNS), dtype=np.int32)
+    starts[:, 0:2] = sim.start_cops
+    starts[:, 2] = 0
+    starts[:, 3] = sim.start_column_path
+    starts[:, 4:6] = -1
+    starts[:, 6] = start_nodes
+
+    state_ids = {}
+    states = []
+    captured = []
+    sources = []
+    targets = []
+
+    """Ids of state rows, rows not seen before are added"""
+    def lookup(rows):
+        ids = np.empty(len(rows), dtype=np.int64)
+        for i, row in enumerate(map(tuple, rows.tolist())):
+            if row not in state_ids:
+                state_ids[row] = len(states)
+                states.append(row)
+            ids[i] = state_ids[row]
+        return ids
+
+    start_ids = lookup(starts)
+    frontier = start_ids
+    while len(frontier):
+        if len(states) > max_states:
+            raise RuntimeError(f"The chain has more than {max_states} states")
+        rows = np.array([states[i] for i in frontier], dtype=np.int32)
+        sim.cops = rows[:, 0:2].copy()
+        sim.cop1_pointer = rows[:, 2].astype(np.int8)
+        sim.target_column_path = rows[:, 3].copy()
+        sim.target_node = rows[:, 4].copy()
+        sim.target_path = rows[:, 5].copy()
+        sim.robber = rows[:, 6].copy()
+        sim.swap_count = np.zeros(len(rows), dtype=np.int32)
+        sim.cop_moves(np.arange(len(rows)))
+
+        caught = (sim.cops[:, 0] == sim.robber) | (sim.cops[:, 1] == sim.robber)
+        captured.append((frontier, caught))
+        alive = np.flatnonzero(~caught)
+
+        # Each robber choice from each state still running, moves onto a cop end the game and lead nowhere
+        after = np.column_stack([sim.cops, sim.cop1_pointer, sim.target_column_path, sim.target_node,
+                                 sim.target_path, sim.robber]).astype(np.int32)[alive]
+        next_rows = np.repeat(after, 5, axis=0)
+        next_rows[:, 6] = t.neighbours[after[:, 6]].ravel()
+        escaped = (next_rows[:, 6] != next_rows[:, 0]) & (next_rows[:, 6] != next_rows[:, 1])
+        known = len(states)
+        next_ids = lookup(next_rows[escaped])
+        sources.append(np.repeat(frontier[alive], 5)[escaped])
+        targets.append(next_ids)
+        frontier = np.unique(next_ids[next_ids >= known])
+
+    count = len(states)
+    is_captured = np.zeros(count, dtype=bool)
+    for ids, caught in captured:
+        is_captured[ids] = caught
+    sources = np.concatenate(sources) if sources else np.zeros(0, dtype=np.int64)
+    targets = np.concatenate(targets) if targets else np.zeros(0, dtype=np.int64)
+    moves = sparse.csr_matrix((np.ones(len(sources)), (sources, targets)), shape=(count, count))
+    return {"tables": t, "start_nodes": start_nodes, "start_ids": start_ids, "captured": is_captured, "moves": moves,
+            "states": np.array(states, dtype=np.int32).reshape(-1, STATE_COLUMNS)}
+
+"""States with a chance of never being captured, found from the states with no way at all to a capture"""
+def uncertain_states(chain):
+    moves = chain["moves"]
+    # Backwards search from the capturing states marks every state that can reach a capture
+    reverse = moves.T.tocsr()
+    reaches = chain["captured"].copy()
+    frontier = np.flatnonzero(reaches)
+    while len(frontier):
+        previous = np.unique(reverse[frontier].indices)
+        frontier = previous[~reaches[previous]]
+        reaches[frontier] = True
+
+    # A second backwards search, from the states that never reach a capture, marks every state that can fall into them
+    uncertain = ~reaches
+    frontier = np.flatnonzero(uncertain)
+    while len(frontier):
+        previous = np.unique(reverse[frontier].indices)
+        frontier = previous[~uncertain[previous]]
+        uncertain[frontier] = True
+    return uncertain
+
+"""Expected turns from each state to capture, and the second moment when variance is set, inf where capture isn't certain
+
+A state captured on the cops' move takes one turn, otherwise two turns then a random robber choice,
+so T = 1 on capture and T = 2 + P T elsewhere, where P holds each robber choice with probability 1/5
+"""
+def solve_chain(chain, variance=False):
+    count = len(chain["captured"])
+    uncertain = uncertain_states(chain)
+    solved = np.flatnonzero(~uncertain)
+    expected = np.full(count, np.inf)
+    second = np.full(count, np.inf) if variance else None
+    if not len(solved):
+        return expected, second
+
+    # Certain states only move to certain states, so they form a system of their own
+    moves = chain["moves"][solved][:, solved] / 5
+    system = splu((sparse.identity(len(solved), format="csc") - moves).tocsc())
+    turns = np.where(chain["captured"][solved], 1.0, 2.0)
+    expected[solved] = system.solve(turns)
+    if variance:
+        # E[T^2] = 1 on capture and 4 + 4 P T + P E[T^2] elsewhere
+        running = ~chain["captured"][solved]
+        moments = np.where(running, 4.0 + 4.0 * (moves @ expected[solved]), 1.0)
+        second[solved] = system.solve(moments)
+    return expected, second
+
+"""Exact capture turn against the random robber on the batch simulator's strategy, the robber starts on a random free node
+
+Returns the mean capture turn over starts, its variance when asked for, the expected capture turn from each robber
+start node and the number of chain states. Turns are counted from 1 like BatchSimulator
+"""
+def expected_capture_time(graph, tables=None, variance=False, max_states=2000000):
+    chain = build_chain(graph, tables, max_states)
+    expected, second = solve_chain(chain, variance)
+    start_turns = 1 + expected[chain["start_ids"]]
+    result = {"mean": float(start_turns.mean()), "states": len(chain["captured"]),
+              "per_start": {chain["tables"].node_of(node): float(turns)
+                            for node, turns in zip(chain["start_nodes"].tolist(), start_turns)}}
+    if variance:
+        # Capture turns of the mixture over starts, shifting by the first turn doesn't change the variance
+        result["variance"] = float(second[chain["start_ids"]].mean() - expected[chain["start_ids"]].mean() ** 2)
+    return result
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Exact expected capture turn against the random robber")
+    parser.add_argument("--rows", type=int, default=8)
+    parser.add_argument("--cols", type=int, default=8)
+    parser.add_argument("--mask", help="Boolean .npy mask of the board, used instead of --rows and --cols")
+    parser.add_argument("--games", type=int, default=20000, help="Monte Carlo games to compare against, 0 skips them")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    graph = graph_from_mask(np.load(args.mask)) if args.mask else nx.grid_2d_graph(args.rows, args.cols)
+    start = time.perf_counter()
+    result = expected_capture_time(graph, variance=True)
+    solve_time = time.perf_counter() - start
+    print(f"Board: {graph.number_of_nodes()} nodes, {result['states']} chain states")
+    print(f"Exact:       mean capture turn {result['mean']:.3f}, standard deviation "
+          f"{np.sqrt(result['variance']):.3f} in {solve_time:.2f}s")
+    slowest = max(result["per_start"], key=result["per_start"].get)
+    print(f"Slowest start {slowest}: {result['per_start'][slowest]:.2f} turns")
+
+    if args.games:
+        start = time.perf_counter()
+        turns = BatchSimulator(graph).run(args.games, seed=args.seed)["capture_turn"]
+        finished = turns[turns >= 0]
+        print(f"Monte Carlo: mean capture turn {finished.mean():.3f} ± {finished.std(ddof=1) / np.sqrt(len(finished)):.3f} "
+              f"over {args.games} games in {time.perf_counter() - start:.2f}s")
@@ -0,0 +1,126 @@
+import argparse
+import multiprocessing
+import os
+import shutil
+import subprocess
+import numpy as np
+import networkx as nx
+from PIL import Image
+
+from BoardRenderer import BoardRenderer
+from BoardTables import graph_from_mask, mask_from_graph
+from StrategyEngine import StrategyEngine, copy_state
+
+"""Plays a headless automated game and returns the state after cop placement and after every move"""
+def record_game(graph, seed=None, max_turns=None):
+    engine = StrategyEngine(graph, seed=seed)
+    engine.cop_strategy()
+    states = [copy_state(engine)]
+    while not engine.is_game_over and (max_turns is None or engine.turn_count < max_turns):
+        if engine.is_robber_turn:
+            engine.robber_strategy()
+        else:
+            engine.cop_strategy()
+        states.append(copy_state(engine))
+    return states
+
+# Renderer built once in each worker process
+worker_renderer = None
+
+"""Builds the renderer for the board when a worker process starts"""
+def init_worker(mask, width, height, dpi, highlight_moves):
+    global worker_renderer
+    worker_renderer = BoardRenderer(graph_from_mask(mask), width, height, dpi, highlight_moves)
+
+"""Renders one chunk of states in a worker process"""
+def render_chunk(states):
+    return [worker_renderer.render(state) for state in states]
+
+"""Renders states on a process pool and yields the frames in the order of the states"""
+def render_frames(graph, states, width=640, height=480, dpi=100, highlight_moves=False, processes=None, chunk_size=16):
+    chunks = [states[i:i + chunk_size] for i in range(0, len(states), chunk_size)]
+    initargs = (mask_from_graph(graph), width, height, dpi, highlight_moves)
+    with multiprocessing.Pool(processes, initializer=init_worker, initargs=initargs) as pool:
+        for frames in pool.imap(render_chunk, chunks):
+            yield from frames
+
+"""Quantizes frames one at a time as they arrive, then repeats the last one hold times"""
+def gif_images(frames, hold):
+    image = None
+    for frame in frames:
+        image = Image.fromarray(frame).quantize(colors=64, method=Image.Quantize.FASTOCTREE)
+        yield image
+    for _ in range(hold if image is not None else 0):
+        yield image
+
+"""Encodes frames to an animated GIF, the last frame is held for a second
+
+Frames are quantized as they are passed to Pillow rather than all at once. Pillow joins identical frames into one
+longer frame, so the repeats of the last frame become a single held frame, and it only keeps the changed area of each
+frame until the file is written
+"""
+def write_gif(frames, path, fps=20):
+    images = gif_images(frames, fps - 1)
+    first = next(images, None)
+    if first is None:
+        return
+    first.save(path, save_all=True, append_images=images, duration=int(1000 / fps), loop=0)
+
+"""Streams frames to ffmpeg to encode an MP4, the last frame is held for a second"""
+def write_mp4(frames, path, fps=20):
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        raise RuntimeError("ffmpeg is needed to export MP4 files, export a GIF instead")
+
+    process = None
+    frame = None
+    for frame in frames:
+        if process is None:
+            height, width = frame.shape[:2]
+            process = subprocess.Popen(
+                [ffmpeg, "-y", "-loglevel", "error", "-f", "rawvideo", "-pix_fmt", "rgb24", "-s", f"{width}x{height}",
+                 "-r", str(fps), "-i", "-", "-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2", "-pix_fmt", "yuv420p", path],
+                stdin=subprocess.PIPE)
+        process.stdin.write(frame.tobytes())
+    if process is None:
+        return
+    for _ in range(fps):
+        process.stdin.write(frame.tobytes())
+    process.stdin.close()
+    if process.wait() != 0:
+        raise RuntimeError(f"ffmpeg failed to write {path}")
+
+"""Renders a list of game states to a .gif or .mp4 file, frames are drawn in parallel and encoded in order"""
+def export_game(graph, states, path, fps=20, width=640, height=480, dpi=100, highlight_moves=False, processes=None):
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in (".gif", ".mp4"):
+        raise ValueError(f"Can't export to {extension or 'a file without an extension'}, use .gif or .mp4")
+    if extension == ".mp4" and shutil.which("ffmpeg") is None:
+        raise RuntimeError("ffmpeg is needed to export MP4 files, export a GIF instead")
+
+    frames = render_frames(graph, states, width, height, dpi, highlight_moves, processes)
+    if extension == ".gif":
+        write_gif(frames, path, fps)
+    else:
+        write_mp4(frames, path, fps)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export a headless automated game to a GIF or MP4")
+    parser.add_argument("output", help="File to write, ending in .gif or .mp4")
+    parser.add_argument("--rows", type=int, default=10)
+    parser.add_argument("--cols", type=int, default=10)
+    parser.add_argument("--mask", help="Boolean .npy mask of the board, used instead of --rows and --cols")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--max-turns", type=int, default=1000)
+    parser.add_argument("--fps", type=int, default=20)
+    parser.add_argument("--width", type=int, default=640)
+    parser.add_argument("--height", type=int, default=480)
+    parser.add_argument("--highlight-moves", action="store_true", help="Highlight legal moves like the strategy window")
+    parser.add_argument("--processes", type=int, default=None)
+    args = parser.parse_args()
+
+    graph = graph_from_mask(np.load(args.mask)) if args.mask else nx.grid_2d_graph(args.rows, args.cols)
+    states = record_game(graph, args.seed, args.max_turns)
+    export_game(graph, states, args.output, args.fps, args.width, args.height,
+                highlight_moves=args.highlight_moves, processes=args.processes)
+    print(f"Wrote {len(states)} frames to {args.output}")
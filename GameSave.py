@@ -0,0 +1,56 @@
+import json
+import numpy as np
+
+from BoardTables import BoardTables, graph_from_mask, mask_from_graph
+
+# Bump when the layout of saved games changes
+SAVE_VERSION = 1
+
+# State fields holding a single node or a list of nodes, JSON turns their tuples into lists
+NODE_FIELDS = ("robber_node", "target_node")
+NODE_LIST_FIELDS = ("cop_nodes", "target_column_path", "target_path")
+
+"""Saves a board and a game state made by copy_state to a compressed .npz file
+
+window names the window the game belongs to, BoardTables built for the board can be saved with it so resuming
+doesn't have to build them again
+"""
+def save_game(path, graph, state, window, tables=None):
+    mask = mask_from_graph(graph)
+    meta = {"version": SAVE_VERSION, "window": window, "shape": list(mask.shape), "state": state}
+    arrays = {"meta": np.frombuffer(json.dumps(meta).encode(), dtype=np.uint8), "mask": np.packbits(mask)}
+    if tables is not None:
+        for name, array in tables.arrays().items():
+            arrays["tables_" + name] = array
+
+    # Writing through a file object stops NumPy adding .npz to the name
+    with open(path, "wb") as file:
+        np.savez_compressed(file, **arrays)
+
+"""Loads a game saved by save_game, returns a dict of the window, mask, graph, state and tables (None if not saved)"""
+def load_game(path):
+    with np.load(path) as data:
+        meta = json.loads(data["meta"].tobytes().decode())
+        if meta["version"] != SAVE_VERSION:
+            raise ValueError(f"Saved game version {meta['version']} is not supported")
+
+        rows, cols = meta["shape"]
+        mask = np.unpackbits(data["mask"], count=rows * cols).reshape(rows, cols).astype(bool)
+        tables = None
+        if "tables_mask" in data.files:
+            tables = BoardTables.from_arrays({name: data["tables_" + name] for name in BoardTables.array_names
+                                               if "tables_" + name in data.files})
+
+    return {"window": meta["window"], "mask": mask, "graph": graph_from_mask(mask),
+            "state": decode_state(meta["state"]), "tables": tables}
+
+"""Turns the node lists JSON made of a saved state back into tuples"""
+def decode_state(state):
+    state = dict(state)
+    for name in NODE_FIELDS:
+        if state.get(name) is not None:
+            state[name] = tuple(state[name])
+    for name in NODE_LIST_FIELDS:
+        if name in state:
+            state[name] = [tuple(node) for node in state[name]]
+    return state
@@ -0,0 +1,94 @@
+import argparse
+import multiprocessing
+import os
+import random
+import numpy as np
+from PIL import Image
+
+from BoardRenderer import BoardRenderer
+from BoardTables import graph_from_mask
+from GameExport import record_game
+from SolidGrids import random_solid_grid
+
+"""Picks the states a report shows from a recorded game: placement, every role swap and the capture"""
+def key_states(states):
+    # The first state with the robber placed shows where every player starts
+    picked = [("placement", next(state for state in states if state["robber_node"] is not None))]
+    for previous, state in zip(states, states[1:]):
+        if state["swap_count"] > previous["swap_count"]:
+            picked.append((f"swap{state['swap_count']}", state))
+    if states[-1]["is_game_over"]:
+        picked.append(("capture", states[-1]))
+    return picked
+
+# Renderers made in a worker process, one figure per board size
+worker_renderers = {}
+worker_options = None
+
+"""Stores the render options when a worker process starts"""
+def init_worker(width, height, dpi, highlight_moves):
+    global worker_options
+    worker_options = (width, height, dpi, highlight_moves)
+
+"""Renders one chunk of (mask, state, path) jobs in a worker process, returns the paths written"""
+def render_chunk(jobs):
+    written = []
+    for mask, state, path in jobs:
+        graph = graph_from_mask(mask)
+        renderer = worker_renderers.get(mask.shape)
+        if renderer is None:
+            renderer = worker_renderers[mask.shape] = BoardRenderer(graph, *worker_options)
+        else:
+            renderer.set_board(graph)
+        Image.fromarray(renderer.render(state)).save(path)
+        written.append(path)
+    return written
+
+"""Renders many (mask, state, path) jobs to PNG on a process pool and yields each path once it is written
+
+Jobs are sorted by board size and shared out in chunks, so each worker reuses one figure per size
+"""
+def render_snapshots(jobs, width=640, height=480, dpi=100, highlight_moves=True, processes=None, chunk_size=32):
+    jobs = sorted(jobs, key=lambda job: job[0].shape)
+    chunks = [jobs[i:i + chunk_size] for i in range(0, len(jobs), chunk_size)]
+    with multiprocessing.Pool(processes, initializer=init_worker, initargs=(width, height, dpi, highlight_moves)) as pool:
+        for written in pool.imap_unordered(render_chunk, chunks):
+            yield from written
+
+"""Plays a headless game on every board and makes snapshot jobs for its key states"""
+def game_snapshot_jobs(masks, directory, seed=None, max_turns=None):
+    jobs = []
+    for i, mask in enumerate(masks):
+        # Boards are trimmed to start at row and column 0, the same as mask_from_graph
+        mask = np.asarray(mask, dtype=bool)
+        rows, cols = np.nonzero(mask)
+        mask = mask[:rows.max() + 1, :cols.max() + 1]
+        states = record_game(graph_from_mask(mask), None if seed is None else seed + i, max_turns)
+        for label, state in key_states(states):
+            jobs.append((mask, state, os.path.join(directory, f"board{i}_{label}.png")))
+    return jobs
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render PNG snapshots of the key states of automated games")
+    parser.add_argument("directory", help="Folder to write the PNG files to")
+    parser.add_argument("--masks", nargs="*", default=[], help="Boolean .npy masks of the boards")
+    parser.add_argument("--random", type=int, default=0, help="Number of random solid grids to add")
+    parser.add_argument("--rows", type=int, default=10)
+    parser.add_argument("--cols", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-turns", type=int, default=1000)
+    parser.add_argument("--width", type=int, default=640)
+    parser.add_argument("--height", type=int, default=480)
+    parser.add_argument("--processes", type=int, default=None)
+    args = parser.parse_args()
+
+    masks = [np.load(path) for path in args.masks]
+    rng = random.Random(args.seed)
+    # Random boards left with no room for both cops and the robber are skipped
+    random_masks = [random_solid_grid(args.rows, args.cols, rng) for _ in range(args.random)]
+    masks += [mask for mask in random_masks if mask.sum() >= 3]
+    os.makedirs(args.directory, exist_ok=True)
+
+    jobs = game_snapshot_jobs(masks, args.directory, args.seed, args.max_turns)
+    count = sum(1 for _ in render_snapshots(jobs, args.width, args.height, processes=args.processes))
+    print(f"Wrote {count} snapshots of {len(masks)} boards to {args.directory}")
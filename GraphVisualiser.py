@@ -1,10 +1,25 @@
-from PyQt5.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QWidget, QLineEdit, QPushButton, QLabel, QStackedWidget, QSizePolicy, QHBoxLayout
-from PyQt5.QtCore import QTimer
-from PyQt5.QtGui import QIcon
+from PyQt5.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QWidget, QLineEdit, QPushButton, QLabel, QStackedWidget, QSizePolicy, QHBoxLayout, QFileDialog, QShortcut, QGridLayout, QCheckBox
+from PyQt5.QtCore import QTimer, QObject, QThread, pyqtSignal
+from PyQt5.QtGui import QIcon, QKeySequence, QImage, QPixmap
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
+from matplotlib.colors import to_rgba
+from matplotlib.transforms import Bbox
 import networkx as nx
+import numpy as np
+import math
 import random
+import time
+from collections import deque
+
+from BoardRenderer import BoardRenderer, node_size_for
+from BoardTables import graph_from_mask, mask_from_graph
+from GameSave import load_game, save_game
+from PolicyTable import PolicyTable
+from RobberTerritory import RobberTerritory
+from SimulationStats import RunningStats, run_simulations
+from SolidGrids import is_solid, random_solid_grid
+from StrategyEngine import StrategyEngine, copy_state, restore_state
 
 class MainApp(QMainWindow):
     def __init__(self):
@@ -29,6 +44,12 @@ class MainApp(QMainWindow):
         self.auto_strategy_window = AutomatedStrategyWindow(self)
         self.stacked_widget.addWidget(self.auto_strategy_window)
 
+        self.dashboard_window = DashboardWindow(self)
+        self.stacked_widget.addWidget(self.dashboard_window)
+
+        # F3 shows or hides the performance overlay on every window
+        QShortcut(QKeySequence("F3"), self, self.toggle_performance_hud)
+
         self.setStyleSheet("""
         QWidget {
             background-color: #f9f9f9;
@@ -87,7 +108,9 @@ class MainApp(QMainWindow):
 
     """Switch to the Player Vs. Strategy window"""
     def switch_to_strategy_window(self, graph, pos, node_size):
+        self.strategy_window.reset_state()
         self.strategy_window.update_graph(graph, pos, node_size)
+        self.strategy_window.policy_table = PolicyTable.find(graph)
         self.strategy_window.display_graph()
         self.strategy_window.cop_strategy()
         self.stacked_widget.setCurrentIndex(2)
@@ -96,14 +119,123 @@ class MainApp(QMainWindow):
     def switch_to_auto_strategy_window(self, graph, pos, node_size):
         self.auto_strategy_window.reset_state()
         self.auto_strategy_window.update_graph(graph, pos, node_size)
+        self.auto_strategy_window.policy_table = PolicyTable.find(graph)
         self.auto_strategy_window.display_graph()
         self.auto_strategy_window.cop_strategy()
         self.stacked_widget.setCurrentIndex(3)
 
+    """Switch to the dashboard of many automated games on random rows x cols boards"""
+    def switch_to_dashboard(self, rows, cols):
+        self.dashboard_window.rows = rows
+        self.dashboard_window.cols = cols
+        self.stacked_widget.setCurrentIndex(4)
+
+    """Switch to the window a saved game was played in and carry on from its saved state"""
+    def switch_to_saved_game(self, saved):
+        graph = saved["graph"]
+        pos = {(x, y): (y, -x) for x, y in graph.nodes}
+        rows, cols = saved["mask"].shape
+        canvas = self.graph_creator_window.canvas
+        node_size = node_size_for(rows, cols, canvas.width(), canvas.height())
+
+        if saved["window"] == "game":
+            self.game_window.resume(graph, pos, node_size, saved["state"])
+            self.stacked_widget.setCurrentIndex(1)
+        else:
+            self.strategy_window.resume(graph, pos, node_size, saved["state"])
+            self.stacked_widget.setCurrentIndex(2)
+
     """Switch to Graph Creator window"""
     def switch_to_starting_window(self):
         self.stacked_widget.setCurrentIndex(0)
-        
+
+    """Shows or hides the performance overlay on every window"""
+    def toggle_performance_hud(self):
+        enabled = not self.graph_creator_window.hud.enabled
+        for window in (self.graph_creator_window, self.game_window, self.strategy_window, self.auto_strategy_window):
+            window.hud.set_enabled(enabled)
+
+"""Overlay on a window's canvas with rolling logic, artist and paint times, the node count and cache hit rates
+
+Sections of a frame are timed between begin and end calls, nothing is timed or drawn while the overlay is hidden
+"""
+class PerformanceHUD:
+    sections = ("logic", "artists", "paint")
+
+    def __init__(self, canvas, window_size=60, update_interval=0.25):
+        self.label = QLabel(canvas)
+        self.label.setStyleSheet("background-color: rgba(255, 255, 255, 210); font-family: monospace;"
+                                 "font-size: 9pt; font-weight: normal; padding: 4px;")
+        self.label.move(4, 4)
+        self.label.hide()
+        self.enabled = False
+
+        # Times of the last window_size frames of each section
+        self.times = {name: deque(maxlen=window_size) for name in self.sections}
+        self.section = None
+        self.section_start = 0
+
+        # The text is only updated a few times a second so the overlay stays cheap during fast play
+        self.update_interval = update_interval
+        self.last_update = 0
+
+    """Shows or hides the overlay"""
+    def set_enabled(self, enabled):
+        self.enabled = enabled
+        self.section = None
+        self.label.setVisible(enabled)
+        if enabled:
+            self.label.raise_()
+
+    """Starts timing a section, logic starts a new frame and drops a section left open by an event that drew nothing"""
+    def begin(self, name):
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if self.section is not None and name != "logic":
+            self.times[self.section].append(now - self.section_start)
+        self.section = name
+        self.section_start = now
+
+    """Stops timing the open section"""
+    def end(self):
+        if self.section is not None:
+            self.times[self.section].append(time.perf_counter() - self.section_start)
+            self.section = None
+
+    """Drops the open section without recording it, used when work carries on off the main thread"""
+    def discard(self):
+        self.section = None
+
+    """Adds a time measured somewhere else, such as on a worker thread"""
+    def record(self, name, seconds):
+        if self.enabled:
+            self.times[name].append(seconds)
+
+    """Updates the overlay text, hit_rates maps a cache name to its hits and lookups and counts a name to a number"""
+    def refresh(self, node_count, hit_rates=None, counts=None):
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if now - self.last_update < self.update_interval:
+            return
+        self.last_update = now
+
+        lines = []
+        for name in self.sections:
+            times = self.times[name]
+            if times:
+                lines.append(f"{name:<8}{1000 * sum(times) / len(times):7.1f} ms avg {1000 * max(times):7.1f} ms max")
+            else:
+                lines.append(f"{name:<8}      -")
+        lines.append(f"nodes   {node_count}")
+        for name, (hits, lookups) in (hit_rates or {}).items():
+            lines.append(f"{name} hits {100 * hits / lookups:.0f}% of {lookups}" if lookups else f"{name} hits -")
+        for name, count in (counts or {}).items():
+            lines.append(f"{name} {count}")
+        self.label.setText("\n".join(lines))
+        self.label.adjustSize()
+
 class GraphCreator(QWidget):
     def __init__(self, parent):
         super().__init__(parent)
@@ -129,6 +261,28 @@ class GraphCreator(QWidget):
         self.button.clicked.connect(self.generate_graph)
         layout.addWidget(self.button)
 
+        # Button to carry on a game saved from the Vs. Player or Vs. Strategy window
+        self.button_load = QPushButton("Load Game", self)
+        self.button_load.clicked.connect(self.load_saved_game)
+        layout.addWidget(self.button_load)
+
+        # Erase tools, rectangle and brush remove every border reachable node in the selection at once
+        tool_layout = QHBoxLayout()
+        self.erase_mode = "click"
+        self.tool_buttons = {}
+        for mode, text in (("click", "Click Erase"), ("rectangle", "Rectangle Erase"), ("brush", "Brush Erase")):
+            button = QPushButton(text, self)
+            button.setCheckable(True)
+            button.clicked.connect(lambda checked, mode=mode: self.set_erase_mode(mode))
+            tool_layout.addWidget(button)
+            self.tool_buttons[mode] = button
+        self.tool_buttons["click"].setChecked(True)
+
+        self.input_brush = QLineEdit(self)
+        self.input_brush.setPlaceholderText("Brush radius (default 1)")
+        tool_layout.addWidget(self.input_brush)
+        layout.addLayout(tool_layout)
+
         # Submit Buttons
         submit_layout = QHBoxLayout()
 
@@ -146,17 +300,24 @@ class GraphCreator(QWidget):
         self.button_submit = QPushButton("Submit (Vs. Auto Strategy)", self)
         self.button_submit.clicked.connect(self.submit_graph_auto_strategy)
         submit_layout.addWidget(self.button_submit)
+
+        # Button to watch many automated games on random boards of the entered size
+        self.button_dashboard = QPushButton("Dashboard", self)
+        self.button_dashboard.clicked.connect(self.open_dashboard)
+        submit_layout.addWidget(self.button_dashboard)
         layout.addLayout(submit_layout)
 
         # Matplotlib Figure
         self.canvas = FigureCanvas(Figure())
         self.canvas.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         layout.addWidget(self.canvas)
+        self.hud = PerformanceHUD(self.canvas)
 
         # Connect mouse click and hover event
         self.mouse_click_cid = self.canvas.mpl_connect("button_press_event", self.on_click)
         self.last_hovered_node = None
         self.mouse_hover_cid = self.canvas.mpl_connect("motion_notify_event", self.on_hover)
+        self.mouse_release_cid = self.canvas.mpl_connect("button_release_event", self.on_release)
         self.canvas.mpl_connect("figure_leave_event", self.on_mouse_leave)
 
         # Instance variables for storing the graph
@@ -164,14 +325,29 @@ class GraphCreator(QWidget):
         self.pos = {}  
         self.node_size = None
 
+        # Drawn nodes and edges are kept so changes only redraw the area around them
+        self.ax = None
+        self.node_list = []
+        self.node_index = {}
+        self.node_colors = None
+        self.node_artist = None
+        self.edge_artist = None
+        self.background = None
+        self.highlighted_node = None
+        self.highlight_safe = False
+
+        # Selection made by the rectangle or brush tool while the mouse is held down
+        self.selection = set()
+        self.drag_start = None
+
     """Generate a grid graph based on user input and display it."""
     def generate_graph(self):
         try:
             rows = int(self.input_rows.text())
             cols = int(self.input_cols.text())
 
-            if not (2 <= rows <= 50 and 2 <= cols <= 50):
-                self.label.setText("Error: Rows & Columns must be between 1 and 50.")
+            if not (2 <= rows <= 200 and 2 <= cols <= 200):
+                self.label.setText("Error: Rows & Columns must be between 2 and 200.")
                 return
             
             self.label.setText(f"Grid {rows} × {cols}")
@@ -212,105 +388,296 @@ class GraphCreator(QWidget):
         # Ignore clicks outside the plot
         if event.xdata is None or event.ydata is None:
             return  
+        self.hud.begin("logic")
+
+        # Rectangle and brush tools collect a selection until the mouse is released
+        if self.erase_mode != "click":
+            self.drag_start = (event.xdata, event.ydata)
+            self.set_highlight(None)
+            self.update_selection(event.xdata, event.ydata)
+            return
 
         # Define a threshold distance to decide on which clicks to count
         click_threshold = 0.25
 
-        # Find the nearest node
-        closest_node, min_distance = self.find_closest_node(event.xdata, event.ydata)
-
-        # Only proceed if the click is within the threshold distance
-        if min_distance > click_threshold:
+        # Only proceed if the click is within the threshold distance of a node
+        closest_node = self.find_closest_node(event.xdata, event.ydata, click_threshold)
+        if closest_node is None:
             return 
             
         # Check if the node is a border node
         if self.is_border_node(closest_node):
             if self.is_removal_safe(closest_node):
-                self.graph.remove_node(closest_node)
-                self.redraw_graph()  
+                self.remove_nodes([closest_node])
+
+    """Handle mouse release to erase the rectangle or brush selection"""
+    def on_release(self, event):
+        if self.drag_start is None:
+            return
+        self.hud.begin("logic")
+        self.drag_start = None
+        selection, self.selection = self.selection, set()
+
+        # Only nodes connected to the outside through the selection can go without leaving a hole
+        removable = self.border_reachable(selection)
+        if removable and self.is_batch_removal_safe(removable):
+            self.remove_nodes(removable)
+            self.label.setText(f"Removed {len(removable)} nodes")
+        elif selection:
+            self.label.setText("Error: Removing the selection would disconnect the graph or leave a hole.")
+
+        # Put the colour back on selected nodes which were not removed
+        kept = [node for node in selection if node in self.node_index]
+        for node in kept:
+            self.node_colors[self.node_index[node]] = to_rgba(self.node_colour(node))
+        self.refresh_nodes(kept)
+
+    """Switches between the click, rectangle and brush erase tools"""
+    def set_erase_mode(self, mode):
+        self.erase_mode = mode
+        for button_mode, button in self.tool_buttons.items():
+            button.setChecked(button_mode == mode)
+        if self.graph:
+            self.set_highlight(None)
+
+    """Brush radius in nodes from the input field, 1 if it isn't a valid integer"""
+    def brush_radius(self):
+        try:
+            return max(0, min(20, int(self.input_brush.text())))
+        except ValueError:
+            return 1
+
+    """Updates the selection for the mouse at x and y, only the nodes whose selection changed are redrawn"""
+    def update_selection(self, xdata, ydata):
+        # Node (row, col) is drawn at (col, -row)
+        if self.erase_mode == "rectangle":
+            x0, y0 = self.drag_start
+            rows = range(math.ceil(-max(y0, ydata)), math.floor(-min(y0, ydata)) + 1)
+            cols = range(math.ceil(min(x0, xdata)), math.floor(max(x0, xdata)) + 1)
+            selection = {(row, col) for row in rows for col in cols if (row, col) in self.node_index}
+        else:
+            radius = self.brush_radius()
+            centre_row, centre_col = round(-ydata), round(xdata)
+            selection = set(self.selection)
+            for row in range(centre_row - radius, centre_row + radius + 1):
+                for col in range(centre_col - radius, centre_col + radius + 1):
+                    if (row - centre_row) ** 2 + (col - centre_col) ** 2 <= radius ** 2 and (row, col) in self.node_index:
+                        selection.add((row, col))
+
+        changed = selection ^ self.selection
+        self.selection = selection
+        for node in changed:
+            self.node_colors[self.node_index[node]] = to_rgba(self.node_colour(node))
+        self.refresh_nodes(changed)
+
+    """Selected nodes reachable from outside the graph through other selected nodes"""
+    def border_reachable(self, selection):
+        queue = deque(node for node in selection if self.is_border_node(node))
+        reached = set(queue)
+        while queue:
+            y, x = queue.popleft()
+            for neighbour in [(y-1, x), (y+1, x), (y, x-1), (y, x+1)]:
+                if neighbour in selection and neighbour not in reached:
+                    reached.add(neighbour)
+                    queue.append(neighbour)
+        return reached
+
+    """Check removing a batch of nodes leaves a connected graph with no holes, one pass over the board for the whole batch"""
+    def is_batch_removal_safe(self, nodes):
+        if len(nodes) >= self.graph.number_of_nodes():
+            return False
+        mask = mask_from_graph(self.graph)
+        for y, x in nodes:
+            mask[y, x] = False
+        return is_solid(mask)
     
     """Handle mouse hovering over nodes for highlighting"""
     def on_hover(self, event):
+        self.hud.begin("logic")
+        # A held down rectangle or brush tool grows the selection instead of highlighting
+        if self.drag_start is not None:
+            if event.xdata is not None and event.ydata is not None:
+                self.update_selection(event.xdata, event.ydata)
+            return
+        if self.erase_mode != "click":
+            return
+
         # Ignore hovering when mouse outside plot or when no graph exists
         if event.xdata is None or event.ydata is None:
             if self.graph:
-                self.redraw_graph()
+                self.set_highlight(None)
             return  
         
         # Define a threshold distance to decide on which clicks to count
         click_threshold = 0.25
 
-        # Find the nearest node
-        closest_node, min_distance = self.find_closest_node(event.xdata, event.ydata)
-
-        # Check if the node is a border node
-        is_safe = False
-        if self.is_border_node(closest_node):
-            if self.is_removal_safe(closest_node):
-                is_safe = True
-
-        # Only proceed if the click is within the threshold distance
-        if min_distance > click_threshold:
+        # Only proceed if the mouse is within the threshold distance of a node
+        closest_node = self.find_closest_node(event.xdata, event.ydata, click_threshold)
+        if closest_node is None:
             if self.last_hovered_node is not None:
                 self.last_hovered_node = None
-                self.redraw_graph()
+                self.set_highlight(None)
             return
         
-        # Highlight node when different to last node, to only highlight nodes once
+        # Highlight node when different to last node, safety is only worked out once per node
         if closest_node != self.last_hovered_node:
             self.last_hovered_node = closest_node
-            self.redraw_graph(closest_node, is_safe)
+            is_safe = self.is_border_node(closest_node) and self.is_removal_safe(closest_node)
+            self.set_highlight(closest_node, is_safe)
 
     """Handle mouse leaving a figure to stop hovering"""
     def on_mouse_leave(self, event):
         if self.last_hovered_node is not None:
             self.last_hovered_node = None
-            self.redraw_graph()
-
-    """Finds the closest node to given x and y data"""
-    def find_closest_node(self, xdata, ydata):
-        # Find the nearest node
-        closest_node, min_distance = None, float('inf')
-        for node in self.graph.nodes:
-            dist = (self.pos[node][0] - xdata) ** 2 + (self.pos[node][1] - ydata) ** 2
-            if dist < min_distance:
-                min_distance = dist
-                closest_node = node
-        # Convert squared distance to actual distance for comparison
-        min_distance = min_distance ** 0.5  
-        return closest_node, min_distance
+            self.set_highlight(None)
+
+    """Finds the node within threshold of given x and y data, None if there isn't one"""
+    def find_closest_node(self, xdata, ydata, threshold):
+        # Node (row, col) is drawn at (col, -row), nodes are a unit apart so only the nearest grid point can be within
+        # a threshold under half a unit
+        node = (round(-ydata), round(xdata))
+        if node not in self.node_index:
+            return None
+        x, y = self.pos[node]
+        return node if (x - xdata) ** 2 + (y - ydata) ** 2 <= threshold ** 2 else None
         
     """Redraws the graph"""
     def redraw_graph(self, highlight_node=None, is_safe=None):
+        self.hud.begin("artists")
         # Clear the figure to handle changes to graph structure
         self.canvas.figure.clear()
-        ax = self.canvas.figure.add_subplot(111)
+        self.ax = self.canvas.figure.add_subplot(111)
 
         # Set scaling of figure to make graphs unit distance
-        ax.set_aspect(1, adjustable="datalim")
+        self.ax.set_aspect(1, adjustable="datalim")
         self.canvas.figure.tight_layout(pad=0)
-        ax.set_axis_off()
+        self.ax.set_axis_off()
 
         # Set node colour depending on how and if it should be highlighted
-        nodes = list(self.graph.nodes)
-        node_colors = []
-        for node in nodes:
-            if node == highlight_node:
-                if is_safe:
-                    node_colors.append('#66cc89')
-                elif not is_safe:
-                    node_colors.append('#cc6666')
-                else:
-                    node_colors.append('#66CCCC')
-            else:
-                node_colors.append('#6699cc')
+        self.highlighted_node = highlight_node
+        self.highlight_safe = is_safe
+        self.node_list = list(self.graph.nodes)
+        self.node_index = {node: i for i, node in enumerate(self.node_list)}
+        self.node_colors = np.array([to_rgba(self.node_colour(node)) for node in self.node_list])
 
         # Draw nodes and edges seperately for performance
-        nx.draw_networkx_nodes(self.graph, self.pos, ax=ax,
-                                nodelist=nodes, node_color=node_colors, node_size=self.node_size)
-        nx.draw_networkx_edges(self.graph, self.pos, ax=ax, edge_color="#cccccc")
-     
+        self.node_artist = nx.draw_networkx_nodes(self.graph, self.pos, ax=self.ax,
+                                nodelist=self.node_list, node_color=self.node_colors, node_size=self.node_size)
+        self.edge_artist = nx.draw_networkx_edges(self.graph, self.pos, ax=self.ax, edge_color="#cccccc")
+
+        self.edge_list = list(self.graph.edges)
+
+        # Keep the empty background so later changes can be drawn over just the area they touch
+        self.hud.begin("paint")
+        self.node_artist.set_visible(False)
+        self.edge_artist.set_visible(False)
         self.canvas.draw()
+        self.background = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+        self.node_artist.set_visible(True)
+        self.edge_artist.set_visible(True)
+        self.ax.draw_artist(self.edge_artist)
+        self.ax.draw_artist(self.node_artist)
+        self.canvas.blit(self.canvas.figure.bbox)
+        self.hud.end()
+        self.hud.refresh(len(self.node_list))
+
+        # Nodes and edges drawn over an area later must not move the view
+        self.ax.set_autoscale_on(False)
+
+    """Colour of a node for its highlight and selection state"""
+    def node_colour(self, node):
+        if node == self.highlighted_node:
+            return '#66cc89' if self.highlight_safe else '#cc6666'
+        if node in self.selection:
+            return '#66CCCC'
+        return '#6699cc'
+
+    """Moves the hover highlight to a node, None clears it, only the old and new node are redrawn"""
+    def set_highlight(self, node, is_safe=None):
+        if node == self.highlighted_node and is_safe == self.highlight_safe:
+            return
+        changed = [n for n in (self.highlighted_node, node) if n in self.node_index]
+        self.highlighted_node = node
+        self.highlight_safe = is_safe
+        for n in changed:
+            self.node_colors[self.node_index[n]] = to_rgba(self.node_colour(n))
+        self.refresh_nodes(changed)
+
+    """Removes nodes from the graph, only the area around them is redrawn"""
+    def remove_nodes(self, nodes):
+        nodes = set(nodes)
+        # Edges of removed nodes reach as far as their neighbours, so the redrawn area covers those too
+        area = nodes.union(*(self.graph.neighbors(node) for node in nodes))
+        self.graph.remove_nodes_from(nodes)
+        if self.highlighted_node in nodes:
+            self.highlighted_node = None
+
+        keep = [i for i, node in enumerate(self.node_list) if node not in nodes]
+        self.node_list = [self.node_list[i] for i in keep]
+        self.node_index = {node: i for i, node in enumerate(self.node_list)}
+        self.node_colors = self.node_colors[keep]
+        self.node_artist.set_offsets(np.array([self.pos[node] for node in self.node_list]).reshape(-1, 2))
+
+        # get_paths is the collection's own list, dropping paths from it avoids rebuilding every edge
+        keep = [i for i, (u, v) in enumerate(self.edge_list) if u not in nodes and v not in nodes]
+        paths = self.edge_artist.get_paths()
+        paths[:] = [paths[i] for i in keep]
+        self.edge_list = [self.edge_list[i] for i in keep]
+        self.edge_artist.stale = True
+        self.refresh_nodes(area)
+
+    """Redraws only the part of the canvas covering the given nodes"""
+    def refresh_nodes(self, nodes):
+        nodes = list(nodes)
+        if not nodes or self.background is None:
+            return
+        self.hud.begin("artists")
+        self.node_artist.set_facecolor(self.node_colors)
+
+        # Pad by a node's radius in pixels so whole nodes are covered
+        points = self.ax.transData.transform(np.array([self.pos[node] for node in nodes]))
+        pad = math.sqrt(self.node_size) / 2 * self.canvas.figure.dpi / 72 + 2
+        area = Bbox.from_extents(points[:, 0].min() - pad, points[:, 1].min() - pad,
+                                 points[:, 0].max() + pad, points[:, 1].max() + pad)
+        area = Bbox.intersection(area, self.canvas.figure.bbox)
+        if area is None:
+            return
+        area = Bbox.from_extents(math.floor(area.x0), math.floor(area.y0), math.ceil(area.x1), math.ceil(area.y1))
+
+        # Only nodes overlapping the area and edges with an end within one edge length of it are drawn again
+        offsets = self.ax.transData.transform(self.node_artist.get_offsets())
+        unit = self.ax.transData.transform([(1, 0)])[0, 0] - self.ax.transData.transform([(0, 0)])[0, 0]
+        def near(margin):
+            return np.flatnonzero((offsets[:, 0] >= area.x0 - margin) & (offsets[:, 0] <= area.x1 + margin)
+                                  & (offsets[:, 1] >= area.y0 - margin) & (offsets[:, 1] <= area.y1 + margin))
+        area_nodes = near(pad)
+        area_edges = list(self.graph.edges(self.node_list[i] for i in near(pad + unit)))
+
+        # Matplotlib draws one item collections another way which snaps to pixels differently, so add a second item
+        if len(area_nodes) == 1 and len(self.node_list) > 1:
+            area_nodes = np.append(area_nodes, 1 if area_nodes[0] == 0 else 0)
+        if len(area_edges) == 1 and len(self.edge_list) > 1:
+            area_edges.append(self.edge_list[1] if set(area_edges[0]) == set(self.edge_list[0]) else self.edge_list[0])
+
+        # Temporary artists with just those nodes and edges, drawing the full ones clipped still goes over the whole board
+        artists = []
+        if area_edges:
+            artists.append(nx.draw_networkx_edges(self.graph, self.pos, ax=self.ax, edgelist=area_edges, edge_color="#cccccc"))
+        if len(area_nodes):
+            artists.append(nx.draw_networkx_nodes(self.graph, self.pos, ax=self.ax, nodelist=[self.node_list[i] for i in area_nodes],
+                                                  node_color=self.node_colors[area_nodes], node_size=self.node_size))
+
+        # The saved background is indexed from the top of the canvas and the restored rectangle includes its last row and column
+        self.hud.begin("paint")
+        height = self.canvas.figure.bbox.height
+        self.canvas.restore_region(self.background, bbox=(area.x0, height - area.y1, area.x1 - 1, height - area.y0 - 1), xy=(0, 0))
+        for artist in artists:
+            artist.set_clip_box(area)
+            self.ax.draw_artist(artist)
+            artist.remove()
+        self.canvas.blit(area)
+        self.hud.end()
+        self.hud.refresh(len(self.node_list))
 
     """Check if a node is on the border (has a missing neighbor)."""
     def is_border_node(self, node):
@@ -321,21 +688,19 @@ class GraphCreator(QWidget):
                 return True
         return False
 
-    """Check if removing a node would split the graph making it disconnected"""
+    """Check if removing a border node would split the graph making it disconnected, only its 8 neighbours are looked at"""
     def is_removal_safe(self, node):
-        
-        # Count connected components before removal
-        initial_components = nx.number_connected_components(self.graph)
-
-        # Simulate removal
-        graph_copy = self.graph.copy()
-        graph_copy.remove_node(node)
-
-        # Count components after simulated removal
-        new_components = nx.number_connected_components(graph_copy)
-
-        # If the number of components increased, removing this node is unsafe
-        return new_components == initial_components
+        # The board has no holes, so gaps around the node all lie outside it and two neighbours can only stay
+        # connected around the node's own ring. Walking the ring, the neighbours must form a single run
+        x, y = node
+        ring = [(x-1, y), (x-1, y+1), (x, y+1), (x+1, y+1), (x+1, y), (x+1, y-1), (x, y-1), (x-1, y-1)]
+        present = [n in self.node_index for n in ring]
+        runs = 0
+        for i in range(0, 8, 2):
+            # Count each run at the first direct neighbour in it, corners join the direct neighbours either side
+            if present[i] and not (present[i - 1] and present[i - 2]):
+                runs += 1
+        return runs == 1
 
     """Handle submit button functionality to change window to Player vs Player"""
     def submit_graph(self):
@@ -345,6 +710,7 @@ class GraphCreator(QWidget):
         # Disconnect the mouse click event
         self.canvas.mpl_disconnect(self.mouse_click_cid)
         self.canvas.mpl_disconnect(self.mouse_hover_cid)
+        self.canvas.mpl_disconnect(self.mouse_release_cid)
 
         self.parent.switch_to_game_window(self.graph, self.pos, self.node_size)
 
@@ -356,6 +722,7 @@ class GraphCreator(QWidget):
         # Disconnect the mouse events
         self.canvas.mpl_disconnect(self.mouse_click_cid)
         self.canvas.mpl_disconnect(self.mouse_hover_cid)
+        self.canvas.mpl_disconnect(self.mouse_release_cid)
 
         self.parent.switch_to_strategy_window(self.graph, self.pos, self.node_size)
     
@@ -367,9 +734,37 @@ class GraphCreator(QWidget):
         # Disconnect the mouse events
         self.canvas.mpl_disconnect(self.mouse_click_cid)
         self.canvas.mpl_disconnect(self.mouse_hover_cid)
+        self.canvas.mpl_disconnect(self.mouse_release_cid)
 
         self.parent.switch_to_auto_strategy_window(self.graph, self.pos, self.node_size)
 
+    """Handle dashboard button functionality, boards use the entered size or 10 x 10"""
+    def open_dashboard(self):
+        try:
+            rows = min(max(int(self.input_rows.text()), 2), 30)
+            cols = min(max(int(self.input_cols.text()), 2), 30)
+        except ValueError:
+            rows, cols = 10, 10
+        self.parent.switch_to_dashboard(rows, cols)
+
+    """Handle load button functionality to pick a saved game and change to the window it was saved from"""
+    def load_saved_game(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Load Game", "", "Saved games (*.npz)")
+        if not path:
+            return
+        try:
+            saved = load_game(path)
+        except (OSError, ValueError, KeyError):
+            self.label.setText("Error: Could not load the saved game.")
+            return
+
+        # Disconnect the mouse events
+        self.canvas.mpl_disconnect(self.mouse_click_cid)
+        self.canvas.mpl_disconnect(self.mouse_hover_cid)
+        self.canvas.mpl_disconnect(self.mouse_release_cid)
+
+        self.parent.switch_to_saved_game(saved)
+
 class GameWindow(QWidget):
     def __init__(self, parent):
         super().__init__(parent)
@@ -397,9 +792,15 @@ class GameWindow(QWidget):
         self.turn_label = QLabel("Cop's Placement Phase", self)
         layout.addWidget(self.turn_label)
 
+        # Button to save the game so it can be loaded from the graph creation window
+        self.button_save = QPushButton("Save Game", self)
+        self.button_save.clicked.connect(self.save_current_game)
+        layout.addWidget(self.button_save)
+
         self.canvas = FigureCanvas(Figure())
         self.canvas.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         layout.addWidget(self.canvas)
+        self.hud = PerformanceHUD(self.canvas)
 
         # Connect mouse click event
         self.mouse_click_cid = self.canvas.mpl_connect("button_press_event", self.on_click)
@@ -410,8 +811,37 @@ class GameWindow(QWidget):
         self.pos = pos
         self.node_size = node_size
 
+    """Button function to save the board and game state to a file"""
+    def save_current_game(self):
+        if not self.graph:
+            return
+        path, _ = QFileDialog.getSaveFileName(self, "Save Game", "game.npz", "Saved games (*.npz)")
+        if path:
+            save_game(path, self.graph, copy_state(self), "game")
+
+    """Carries on a saved game on its board from the saved state"""
+    def resume(self, graph, pos, node_size, state):
+        self.update_graph(graph, pos, node_size)
+        self.cop_moved = [False, False]
+        self.robber_moved = False
+        restore_state(self, state)
+
+        # Clicks are disconnected at the end of a game so connect them again
+        self.canvas.mpl_disconnect(self.mouse_click_cid)
+        self.mouse_click_cid = self.canvas.mpl_connect("button_press_event", self.on_click)
+
+        if self.is_placement_phase and self.is_robber_turn:
+            self.turn_label.setText("Robber's Placement Phase")
+        elif self.is_placement_phase:
+            self.turn_label.setText("Cop's Placement Phase 2" if True in self.cop_moved else "Cop's Placement Phase")
+        else:
+            self.turn_label.setText("Robber's Turn" if self.is_robber_turn else "Cop's Turn")
+        self.display_graph()
+        self.check_game_over()
+
     """Display the graph."""
     def display_graph(self):
+        self.hud.begin("artists")
         # Clear the figure to handle changes to graph structure
         self.canvas.figure.clear()
         ax = self.canvas.figure.add_subplot(111)
@@ -455,7 +885,10 @@ class GameWindow(QWidget):
         if self.robber_node is not None:
             nx.draw_networkx_nodes(self.graph, self.pos, nodelist=[self.robber_node], node_color="red", ax=ax, node_size=self.node_size*0.7)
 
+        self.hud.begin("paint")
         self.canvas.draw()
+        self.hud.end()
+        self.hud.refresh(self.graph.number_of_nodes())
     
     """Resize event"""
     def resizeEvent(self, event):
@@ -509,6 +942,7 @@ class GameWindow(QWidget):
 
     """Make a move for the robber or cop"""
     def make_move(self, closest_node, player):         
+        self.hud.begin("logic")
         if self.is_placement_phase:
             # Set starting posistion to clicked node
             if player == "robber":
@@ -602,7 +1036,36 @@ class GameWindow(QWidget):
                 self.turn_label.setText("Game Over, Cops captured the robber")
                 self.canvas.mpl_disconnect(self.mouse_click_cid)
 
+"""Works out the live strategy's cop moves off the Qt main thread, results are sent back through a signal"""
+class StrategyWorker(QObject):
+    move_ready = pyqtSignal(int, object)
+
+    def __init__(self):
+        super().__init__()
+        self.engine = StrategyEngine()
+
+        # Requests older than this were cancelled and are skipped, set from the main thread
+        self.latest_generation = 0
+        # Time taken by the last move, read by the window's performance overlay
+        self.compute_time = 0
+
+    """Computes the cops' move for a snapshot of the window's state"""
+    def compute_move(self, generation, graph, state):
+        if generation != self.latest_generation:
+            return
+        start = time.perf_counter()
+        # The board is kept between moves so its column paths stay cached
+        if self.engine.graph is not graph:
+            self.engine.update_graph(graph)
+        restore_state(self.engine, state)
+        self.engine.move_cops()
+        self.compute_time = time.perf_counter() - start
+        self.move_ready.emit(generation, self.engine.get_decision())
+
 class StrategyWindow(QWidget):
+    # Sends a move request to the worker thread
+    request_move = pyqtSignal(int, object, object)
+
     def __init__(self, parent):
         super().__init__(parent)
         self.parent = parent
@@ -623,9 +1086,28 @@ class StrategyWindow(QWidget):
         self.target_node = None
         self.target_path = []
         self.cop1_guarded = False
+
+        # Compiled policy table for the board, used instead of the live strategy when loaded
+        self.policy_table = None
+        self.cross_check_policy = False
+        self.policy_lookups = 0
+        self.policy_hits = 0
+        self.policy_mismatches = 0
         # Game States
         self.is_robber_turn = False
         self.is_placement_phase = True
+
+        # Cop moves are computed on a worker thread, the generation is bumped to cancel pending moves
+        self.is_thinking = False
+        self.move_generation = 0
+        self.pending_response = None
+        self.worker_thread = QThread(self)
+        self.worker = StrategyWorker()
+        self.worker.moveToThread(self.worker_thread)
+        self.request_move.connect(self.worker.compute_move)
+        self.worker.move_ready.connect(self.on_cop_move_ready)
+        self.worker_thread.start()
+        QApplication.instance().aboutToQuit.connect(self.stop_worker)
      
         # Set up layout and canvas
         layout = QVBoxLayout(self)
@@ -633,9 +1115,30 @@ class StrategyWindow(QWidget):
         self.turn_label = QLabel("Cop's Placement Phase", self)
         layout.addWidget(self.turn_label)
 
+        # Robber's territory in G-P and the column paths left to clear, kept up to date as the game goes on
+        self.territory = None
+        self.territory_label = QLabel("", self)
+        layout.addWidget(self.territory_label)
+
+        # Button to return to graph creation window
+        self.button_restart = QPushButton("Restart", self)
+        self.button_restart.clicked.connect(self.restart)
+        layout.addWidget(self.button_restart)
+
+        # Button to save the game so it can be loaded from the graph creation window
+        self.button_save = QPushButton("Save Game", self)
+        self.button_save.clicked.connect(self.save_current_game)
+        layout.addWidget(self.button_save)
+
+        # Runs the live strategy next to a loaded policy table, disagreements are shown by the performance overlay
+        self.check_cross_check = QCheckBox("Cross check policy table", self)
+        self.check_cross_check.toggled.connect(self.set_cross_check_policy)
+        layout.addWidget(self.check_cross_check)
+
         self.canvas = FigureCanvas(Figure())
         self.canvas.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         layout.addWidget(self.canvas)
+        self.hud = PerformanceHUD(self.canvas)
 
         # Connect mouse click event
         self.mouse_click_cid = self.canvas.mpl_connect("button_press_event", self.on_click)
@@ -645,9 +1148,20 @@ class StrategyWindow(QWidget):
         self.graph = graph
         self.pos = pos
         self.node_size = node_size
+        self.territory = RobberTerritory(graph)
+
+    """Shows the robber's territory once both cops and the robber are placed"""
+    def update_territory(self):
+        if self.territory is None or self.robber_node is None or len(self.cop_nodes) < 2:
+            self.territory_label.setText("")
+            return
+        self.territory.update(self.cop_nodes[self.cop2_pointer], self.robber_node)
+        self.territory_label.setText(self.territory.describe())
 
     """Display the graph."""
     def display_graph(self):
+        self.update_territory()
+        self.hud.begin("artists")
         # Clear the figure to handle changes to graph structure
         self.canvas.figure.clear()
         ax = self.canvas.figure.add_subplot(111)
@@ -690,7 +1204,10 @@ class StrategyWindow(QWidget):
         if self.robber_node is not None:
             nx.draw_networkx_nodes(self.graph, self.pos, nodelist=[self.robber_node], node_color="red", ax=ax, node_size=self.node_size*0.7)
 
+        self.hud.begin("paint")
         self.canvas.draw()
+        self.hud.end()
+        self.hud.refresh(self.graph.number_of_nodes(), self.cache_hit_rates(), self.policy_check_counts())
 
     """Handle mouse click events."""
     def on_click(self, event):
@@ -721,6 +1238,7 @@ class StrategyWindow(QWidget):
 
     """Make a move for the robber or cop"""
     def make_move(self, closest_node):         
+        self.hud.begin("logic")
         if self.is_placement_phase:
             if closest_node not in self.cop_nodes:
                 self.robber_node = closest_node
@@ -792,84 +1310,143 @@ class StrategyWindow(QWidget):
                 self.turn_label.setText("Robber's Placement Phase")
                 self.is_robber_turn = not self.is_robber_turn
         else:
-            # Cop 1 Move
-            cop1 = self.cop_nodes[self.cop1_pointer]
-            # Check if C1 is on the target column path
-            if(cop1 in self.target_column_path):
+            self.request_cop_move()
+            return
 
-                # Since Cop 1 is on column path, Check if guarded based on robber posistion 
-                # Find the closest node on target path to robber, compare distance from cop and robber to that node
-                robber_target, robber_target_path = self.shortest_path_to_column_path(self.robber_node, self.target_column_path)
-                cop_to_robber_target = nx.shortest_path_length(self.graph, self.cop_nodes[self.cop1_pointer], robber_target)
+        self.display_graph()
+        self.check_game_over()
 
-                # If Cop 1 can get to that node quicker than the column path is gaureded
-                if (cop_to_robber_target < len(robber_target_path)):
-                    self.cop1_guarded = True
+    """Starts working out the cops' move, table lookups are done straight away and live moves on the worker thread"""
+    def request_cop_move(self):
+        self.hud.begin("logic")
+        self.pending_response = None
+        if self.policy_table is not None:
+            self.pending_response = self.lookup_policy()
+            if self.pending_response is not None and not self.cross_check_policy:
+                self.policy_table.apply(self, self.pending_response)
+                self.finish_cop_move()
+                return
 
-                # If Cop 1 doesn't guard column at current posistion must move closer node closer to robber on the column path
-                else:
-                    self.guard_column_path(self.cop1_pointer)
-        
-            # If Cop 1 not on target column path make move towards it
-            else:
+        self.is_thinking = True
+        self.turn_label.setText("Cop's Turn (thinking...)")
+        # The worker times the move itself, the wait for its result isn't logic
+        self.hud.discard()
+        self.move_generation += 1
+        self.worker.latest_generation = self.move_generation
+        self.request_move.emit(self.move_generation, self.graph, copy_state(self))
+
+    """Applies a cop move from the worker thread unless it was cancelled"""
+    def on_cop_move_ready(self, generation, decision):
+        if generation != self.move_generation:
+            return
+        self.is_thinking = False
+        self.hud.record("logic", self.worker.compute_time)
+        cop_nodes, self.cop1_pointer, self.cop2_pointer, self.target_column_path, self.target_node, self.target_path = decision
+        self.cop_nodes = list(cop_nodes)
+
+        # Cross check the table against the live strategy
+        if self.pending_response is not None and not self.policy_table.matches(self, self.pending_response):
+            self.policy_mismatches += 1
+        self.finish_cop_move()
+
+    """Hands the turn back to the robber once the cops have moved"""
+    def finish_cop_move(self):
+        self.is_robber_turn = not self.is_robber_turn
+        self.turn_label.setText("Robber's Turn")
+        self.display_graph()
+        self.check_game_over()
 
-                # Check if we have a target node to aim for on the target column path
-                if self.target_node not in self.target_column_path:
+    """Drops any cop move still being worked out so its result is ignored"""
+    def cancel_pending_move(self):
+        self.move_generation += 1
+        self.worker.latest_generation = self.move_generation
+        self.is_thinking = False
 
-                    # target node on target column path and path from cop1 to that target node
-                    self.target_node, self.target_path = self.shortest_path_to_column_path(cop1, self.target_column_path)
-    
-                # Find Cop 1 on the target path and interate it to follow the path to the target node
-                for i in range(0, len(self.target_path)):
-                    if self.cop_nodes[self.cop1_pointer] == self.target_path[i]:
-                        self.cop_nodes[self.cop1_pointer] = self.target_path[i+1]
-                        break
+    """Stops the worker thread when the application closes"""
+    def stop_worker(self):
+        self.cancel_pending_move()
+        self.worker_thread.quit()
+        self.worker_thread.wait()
 
-            # Cop 2 Move
-            cop2_column = self.cop_nodes[self.cop2_pointer][1]
-            cop2_row = self.cop_nodes[self.cop2_pointer][0]
-            cop2_column_path = self.find_column_path(self.cop_nodes[self.cop2_pointer])
-            robber_target, robber_target_path = self.shortest_path_to_column_path(self.robber_node, cop2_column_path)
-            cop_to_robber_target = nx.shortest_path_length(self.graph, self.cop_nodes[self.cop2_pointer], robber_target)
-
-            # Check if Cop 2 based on their current posistion still guards the column path they are on
-            if not (cop_to_robber_target < len(robber_target_path)):
-                self.guard_column_path(self.cop2_pointer)
-
-            # Cop 1 and Cop 2 swap roles if Cop 1 sucessfully guards their column path, as it frees up Cop 2 to find a new column path to guard
-            if self.cop1_guarded:
-                # Find Connected Components after G-P and of them the connected component the robber is in
-                graph_modified = self.graph.copy()
-                graph_modified.remove_nodes_from(self.target_column_path)
-                components = list(nx.connected_components(graph_modified))
-                for component in components:
-                    if self.robber_node in component:
-                        robber_component = component
-
-                # Check for nodes which reside on the adjacent column path in the robber's component
-                adjacent_path_node = None
-                for node in self.target_column_path:
-                    y, x = node
-                    test_nodes = [(y, x-1), (y, x+1)]
-                    for test_node in test_nodes:
-                        if(test_node in self.graph.nodes):
-                            if ((node, test_node) in self.graph.edges):
-                                if test_node in robber_component:
-                                    adjacent_path_node = test_node
-                if adjacent_path_node:
-                    self.target_column_path = self.find_column_path(adjacent_path_node)
-                # Swap the Cop 1 and Cop 2 pointers
-                temp = self.cop1_pointer
-                self.cop1_pointer = self.cop2_pointer
-                self.cop2_pointer = temp
-                self.cop1_guarded = False
-
-            self.is_robber_turn = not self.is_robber_turn
-            self.turn_label.setText("Robber's Turn")
+    """Button function to switch window to graph creation window"""
+    def restart(self):
+        self.cancel_pending_move()
+        self.parent.switch_to_starting_window()
+
+    """Button function to save the board and game state to a file"""
+    def save_current_game(self):
+        if not self.graph:
+            return
+        path, _ = QFileDialog.getSaveFileName(self, "Save Game", "game.npz", "Saved games (*.npz)")
+        if path:
+            save_game(path, self.graph, copy_state(self), "strategy")
 
+    """Carries on a saved game on its board from the saved state"""
+    def resume(self, graph, pos, node_size, state):
+        self.reset_state()
+        self.update_graph(graph, pos, node_size)
+        self.policy_table = PolicyTable.find(graph)
+        restore_state(self, state)
+
+        if self.is_placement_phase:
+            self.turn_label.setText("Robber's Placement Phase" if self.is_robber_turn else "Cop's Placement Phase")
+        else:
+            self.turn_label.setText("Robber's Turn" if self.is_robber_turn else "Cop's Turn")
         self.display_graph()
         self.check_game_over()
 
+        # A game saved before the cops moved, or while they were thinking, carries on by working out their move
+        if not self.is_robber_turn and self.robber_node not in self.cop_nodes:
+            self.cop_strategy()
+
+    """Clears the state variables so fresh game can be started when window is re switched into"""
+    def reset_state(self):
+        self.cancel_pending_move()
+
+        self.cop_nodes = []
+        self.robber_node = None
+        self.cop1_pointer = 0
+        self.cop2_pointer = 1
+        self.guarding = [False, False]
+        self.target_column_path = []
+        self.target_node = None
+        self.target_path = []
+        self.cop1_guarded = False
+        self.policy_table = None
+        self.policy_lookups = 0
+        self.policy_hits = 0
+        self.policy_mismatches = 0
+
+        self.is_robber_turn = False
+        self.is_placement_phase = True
+        self.turn_label.setText("Cop's Placement Phase")
+
+        # Clicks are disconnected at the end of a game so connect them again
+        self.canvas.mpl_disconnect(self.mouse_click_cid)
+        self.mouse_click_cid = self.canvas.mpl_connect("button_press_event", self.on_click)
+
+    """Turns cross checking a loaded policy table against the live strategy on or off, disagreements are counted again"""
+    def set_cross_check_policy(self, enabled):
+        self.cross_check_policy = enabled
+        self.policy_mismatches = 0
+
+    """Moves the policy table and live strategy disagreed on while cross checking, shown by the performance overlay"""
+    def policy_check_counts(self):
+        return {"policy table mismatches": self.policy_mismatches} if self.cross_check_policy else None
+
+    """Looks the state up in the policy table, counting hits for the performance overlay"""
+    def lookup_policy(self):
+        response = self.policy_table.lookup(self)
+        self.policy_lookups += 1
+        self.policy_hits += response is not None
+        return response
+
+    """Hits and lookups of the policy table and the worker's column path cache, shown by the performance overlay"""
+    def cache_hit_rates(self):
+        engine = self.worker.engine
+        return {"policy table": (self.policy_hits, self.policy_lookups),
+                "column paths": (engine.column_path_hits, engine.column_path_hits + engine.column_path_misses)}
+
     """Finds a column path that a given node resides in"""
     def find_column_path(self, node):
         # Get the y and x of the node
@@ -924,49 +1501,191 @@ class StrategyWindow(QWidget):
         column_path.extend(lower_list)
         return column_path
 
-    """Finds the cloest node in a column path to a given node and the path of ndoes to it"""
-    def shortest_path_to_column_path(self, node, column_path):
-        # Defaults the cloest node and shortest path to be first node in column path
-        shortest_path = nx.shortest_path_length(self.graph, node, column_path[0])
-        target_node = column_path[0]
-        target_path = nx.shortest_path(self.graph, node, target_node)
+"""Owns the timer which drives an automated game, each tick plays one robber or cop move"""
+class GameScheduler(QObject):
+    def __init__(self, window, interval=50, history_size=200):
+        super().__init__(window)
+        self.window = window
+
+        # A single repeating timer, Qt merges timeouts that come in while a tick is still running
+        self.timer = QTimer(self)
+        self.timer.setInterval(interval)
+        self.timer.timeout.connect(self.tick)
+        self.is_ticking = False
+
+        # Recent states for stepping back, the oldest are dropped once full
+        self.history = deque(maxlen=history_size)
+
+    """Starts or resumes automatic play"""
+    def start(self):
+        if not self.window.is_game_over:
+            self.timer.start()
+
+    """Pauses automatic play, the game can be resumed or stepped"""
+    def pause(self):
+        self.timer.stop()
+
+    """Whether automatic play is running"""
+    def is_running(self):
+        return self.timer.isActive()
+
+    """Plays a single move while paused"""
+    def step(self):
+        self.pause()
+        self.tick()
+
+    """Goes back to the state before the last move"""
+    def step_back(self):
+        self.pause()
+        if self.history:
+            restore_state(self.window, self.history.pop())
+            self.window.show_state()
+
+    """Stops play and forgets the history, used when the game is thrown away"""
+    def cancel(self):
+        self.timer.stop()
+        self.history.clear()
+
+    """Plays the next move of the game"""
+    def tick(self):
+        if self.is_ticking:
+            return
+        if self.window.is_game_over or self.window.graph is None:
+            self.timer.stop()
+            return
 
-        # Loops through to check rest of column path
-        for i in range(1, len(column_path)):
-            
-            # If current node has a shorter path, it becomes the target node and shortest path
-            test_path = nx.shortest_path_length(self.graph, node, column_path[i])
-            if(shortest_path > test_path):
-                shortest_path = test_path
-                target_node = column_path[i]
-                target_path = nx.shortest_path(self.graph, node, target_node)
-        
-        return target_node, target_path
+        self.is_ticking = True
+        try:
+            self.history.append(copy_state(self.window))
+            self.window.play_next_move()
+        finally:
+            self.is_ticking = False
 
-    """Moves cop up or down to be closer to robber's row"""
-    def guard_column_path(self, cop_pointer):
-        # Given cop information
-        cop_column = self.cop_nodes[cop_pointer][1]
-        cop_row = self.cop_nodes[cop_pointer][0]
+        if self.window.is_game_over:
+            self.timer.stop()
 
-        # Robber information
-        robber_row = self.robber_node[0]
+"""Runs headless games on a process pool from a worker thread, each finished chunk of games is sent back through a signal"""
+class SimulationRunner(QObject):
+    chunk_ready = pyqtSignal(object)
+    finished = pyqtSignal()
 
-        # Check if robber is above cop
-        if(cop_row > robber_row):
+    def __init__(self, mask, n_games):
+        super().__init__()
+        self.mask = mask
+        self.n_games = n_games
+        self.is_stopped = False
+
+    """Streams chunks of capture turns until all games are played or the runner is stopped"""
+    def run(self):
+        results = run_simulations(self.mask, self.n_games)
+        for capture_turns in results:
+            if self.is_stopped:
+                break
+            self.chunk_ready.emit(capture_turns)
+        # Closing the generator terminates the process pool
+        results.close()
+        self.finished.emit()
+
+"""Panel showing a live capture time histogram of many headless games on the submitted board"""
+class SimulationStatsPanel(QWidget):
+    def __init__(self, window, n_games=20000):
+        super().__init__(window)
+        self.window = window
+        self.n_games = n_games
+        self.stats = RunningStats()
+        self.runner = None
+        self.runner_thread = None
+        self.is_dirty = False
+
+        # Stopped runs are kept until their thread ends so Qt doesn't delete them while running
+        self.stopping_runs = []
 
-            # Move towards them if possible move exists
-            next_move = (cop_row-1, cop_column)
-            if (next_move in self.graph.nodes):
-                self.cop_nodes[cop_pointer] = next_move 
-        
-        # Check if robber is below cop
-        elif(cop_row < robber_row):
+        layout = QVBoxLayout(self)
+        controls = QHBoxLayout()
+
+        # Buttons to start and stop the background simulations
+        self.button_run = QPushButton("Run Simulations", self)
+        self.button_run.clicked.connect(self.start)
+        controls.addWidget(self.button_run)
 
-            # Move towards them if possible move exists
-            next_move  = (cop_row+1, cop_column)
-            if (next_move in self.graph.nodes):
-                self.cop_nodes[cop_pointer] = next_move 
+        self.button_stop = QPushButton("Stop", self)
+        self.button_stop.clicked.connect(self.stop)
+        controls.addWidget(self.button_stop)
+
+        self.summary_label = QLabel("Games: 0", self)
+        controls.addWidget(self.summary_label)
+        layout.addLayout(controls)
+
+        # Histogram bars are made once and only their heights and widths change
+        self.canvas = FigureCanvas(Figure())
+        self.canvas.setFixedHeight(150)
+        layout.addWidget(self.canvas)
+        ax = self.canvas.figure.add_subplot(111)
+        self.bars = ax.bar(self.stats.bin_edges(), self.stats.histogram, width=1, align="edge", color="#6699cc")
+        self.histogram_ax = ax
+
+        # Redraws are limited to a few times a second however fast results arrive
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(250)
+        self.refresh_timer.timeout.connect(self.refresh)
+
+    """Starts the headless workers on the window's board"""
+    def start(self):
+        if self.window.graph is None:
+            return
+        self.stop()
+        self.stats = RunningStats(len(self.stats.histogram))
+        self.is_dirty = True
+
+        self.runner = SimulationRunner(mask_from_graph(self.window.graph), self.n_games)
+        self.runner_thread = QThread(self)
+        self.runner.moveToThread(self.runner_thread)
+        self.runner_thread.started.connect(self.runner.run)
+        self.runner.chunk_ready.connect(self.add_results)
+        self.runner.finished.connect(self.runner_thread.quit)
+        self.runner_thread.finished.connect(self.forget_stopped_runs)
+        self.runner_thread.start()
+        self.refresh_timer.start()
+
+    """Stops the workers, any chunks still arriving are ignored"""
+    def stop(self, wait=False):
+        if self.runner is not None:
+            self.runner.is_stopped = True
+            self.stopping_runs.append((self.runner, self.runner_thread))
+        if wait:
+            for runner, thread in self.stopping_runs:
+                thread.wait()
+        self.runner = None
+        self.runner_thread = None
+        self.refresh()
+        self.refresh_timer.stop()
+
+    """Drops stopped runs whose threads have ended"""
+    def forget_stopped_runs(self):
+        self.stopping_runs = [(runner, thread) for runner, thread in self.stopping_runs if thread.isRunning()]
+
+    """Adds a chunk of finished games to the running totals"""
+    def add_results(self, capture_turns):
+        # Chunks already queued by a stopped run are ignored
+        if self.sender() is not self.runner:
+            return
+        self.stats.add_many(capture_turns)
+        self.is_dirty = True
+
+    """Updates the summary label and histogram if new results came in"""
+    def refresh(self):
+        if not self.is_dirty:
+            return
+        self.is_dirty = False
+        stats = self.stats
+        self.summary_label.setText(f"Games: {stats.count}  Mean: {stats.mean:.1f}  Max: {stats.max or 0}")
+        for bar, edge, height in zip(self.bars, stats.bin_edges(), stats.histogram):
+            bar.set_x(edge)
+            bar.set_width(stats.bin_width)
+            bar.set_height(height)
+        self.histogram_ax.set_xlim(0, stats.bin_width * len(stats.histogram))
+        self.histogram_ax.set_ylim(0, max(1, stats.histogram.max()) * 1.05)
+        self.canvas.draw_idle()
 
 class AutomatedStrategyWindow(StrategyWindow):
     def __init__(self, parent):
@@ -989,6 +1708,15 @@ class AutomatedStrategyWindow(StrategyWindow):
         self.target_node = None
         self.target_path = []
         self.cop1_guarded = False
+
+        # Compiled policy table for the board, used instead of the live strategy when loaded
+        self.policy_table = None
+        self.cross_check_policy = False
+        self.policy_lookups = 0
+        self.policy_hits = 0
+        self.policy_mismatches = 0
+        # Live cop moves are played on a headless engine, the same strategy code the worker thread and simulations run
+        self.engine = StrategyEngine()
         # Game States
         self.is_game_over = False
         self.is_robber_turn = False
@@ -1005,25 +1733,77 @@ class AutomatedStrategyWindow(StrategyWindow):
         self.turn_count_label = QLabel(f"Turn: {self.turn_count}", self)
         layout.addWidget(self.turn_count_label)
 
+        # Robber's territory in G-P and the column paths left to clear, kept up to date as the game goes on
+        self.territory = None
+        self.territory_label = QLabel("", self)
+        layout.addWidget(self.territory_label)
+
+        # Scheduler which plays the moves of the automated game
+        self.scheduler = GameScheduler(self)
+
         submit_layout = QHBoxLayout()
         # Button to start automation
         self.button_submit = QPushButton("Start", self)
         self.button_submit.clicked.connect(self.automation)
         submit_layout.addWidget(self.button_submit)
 
+        # Buttons to pause, play a single move and go back a move
+        self.button_pause = QPushButton("Pause", self)
+        self.button_pause.clicked.connect(self.scheduler.pause)
+        submit_layout.addWidget(self.button_pause)
+
+        self.button_step = QPushButton("Step", self)
+        self.button_step.clicked.connect(self.scheduler.step)
+        submit_layout.addWidget(self.button_step)
+
+        self.button_step_back = QPushButton("Step Back", self)
+        self.button_step_back.clicked.connect(self.scheduler.step_back)
+        submit_layout.addWidget(self.button_step_back)
+
         # Button to return to graph creation window
         self.button_restart = QPushButton("Restart", self)
         self.button_restart.clicked.connect(self.restart)
         submit_layout.addWidget(self.button_restart)
+
+        # Runs the live strategy next to a loaded policy table, disagreements are shown by the performance overlay
+        self.check_cross_check = QCheckBox("Cross check policy table", self)
+        self.check_cross_check.toggled.connect(self.set_cross_check_policy)
+        submit_layout.addWidget(self.check_cross_check)
         layout.addLayout(submit_layout)
 
         self.canvas = FigureCanvas(Figure())
         self.canvas.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         layout.addWidget(self.canvas)
+        self.hud = PerformanceHUD(self.canvas)
+
+        # Capture time statistics from background simulations on the same board
+        self.stats_panel = SimulationStatsPanel(self)
+        layout.addWidget(self.stats_panel)
+        QApplication.instance().aboutToQuit.connect(lambda: self.stats_panel.stop(wait=True))
     
     """Handles the start of the automated game"""
     def automation(self):
-        self.robber_strategy()
+        self.scheduler.start()
+
+    """Plays whichever of the robber or cops is due to move"""
+    def play_next_move(self):
+        self.hud.begin("logic")
+        if self.is_robber_turn:
+            self.robber_strategy()
+        else:
+            self.auto_cop_strategy()
+
+    """Updates the labels and graph to show the current state, used after stepping back"""
+    def show_state(self):
+        self.turn_count_label.setText(f"Turn: {self.turn_count}")
+        if self.is_placement_phase:
+            self.turn_label.setText("Robber's Placement Phase")
+        elif self.is_robber_turn:
+            self.turn_label.setText("Robber's Turn")
+        else:
+            self.turn_label.setText("Cop's Turn")
+        self.display_graph()
+        self.check_game_over()
 
     """Handles randomized movement for robber"""
     def robber_strategy(self):
@@ -1049,7 +1829,6 @@ class AutomatedStrategyWindow(StrategyWindow):
         self.turn_label.setText("Cop's Turn")
         self.display_graph()
         self.check_game_over()
-        QTimer.singleShot(50, self.auto_cop_strategy)
 
     """Handles logic for deciding cops moves to implement strategy of capturing robber"""
     def auto_cop_strategy(self):
@@ -1096,76 +1875,7 @@ class AutomatedStrategyWindow(StrategyWindow):
                 self.check_game_over()
         else:
             if not self.is_game_over:
-                # Cop 1 Move
-                cop1 = self.cop_nodes[self.cop1_pointer]
-                # Check if C1 is on the target column path
-                if(cop1 in self.target_column_path):
-
-                    # Since Cop 1 is on column path, Check if guarded based on robber posistion 
-                    # Find the closest node on target path to robber, compare distance from cop and robber to that node
-                    robber_target, robber_target_path = self.shortest_path_to_column_path(self.robber_node, self.target_column_path)
-                    cop_to_robber_target = nx.shortest_path_length(self.graph, self.cop_nodes[self.cop1_pointer], robber_target)
-
-                    # If Cop 1 can get to that node quicker than the column path is gaureded
-                    if (cop_to_robber_target < len(robber_target_path)):
-                        self.cop1_guarded = True
-
-                    # If Cop 1 doesn't guard column at current posistion must move closer node closer to robber on the column path
-                    else:
-                        self.guard_column_path(self.cop1_pointer)
-            
-                # If Cop 1 not on target column path make move towards it
-                else:
-
-                    # Check if we have a target node to aim for on the target column path
-                    if self.target_node not in self.target_column_path:
-
-                        # target node on target column path and path from cop1 to that target node
-                        self.target_node, self.target_path = self.shortest_path_to_column_path(cop1, self.target_column_path)
-        
-                    # Find Cop 1 on the target path and interate it to follow the path to the target node
-                    for i in range(0, len(self.target_path)):
-                        if self.cop_nodes[self.cop1_pointer] == self.target_path[i]:
-                            self.cop_nodes[self.cop1_pointer] = self.target_path[i+1]
-                            break
-
-                # Cop 2 Move
-                cop2_column = self.cop_nodes[self.cop2_pointer][1]
-                cop2_row = self.cop_nodes[self.cop2_pointer][0]
-                cop2_column_path = self.find_column_path(self.cop_nodes[self.cop2_pointer])
-                robber_target, robber_target_path = self.shortest_path_to_column_path(self.robber_node, cop2_column_path)
-                cop_to_robber_target = nx.shortest_path_length(self.graph, self.cop_nodes[self.cop2_pointer], robber_target)
-
-                # Check if Cop 2 based on their current posistion still guards the column path they are on
-                if not (cop_to_robber_target < len(robber_target_path)):
-                    self.guard_column_path(self.cop2_pointer)
-
-                # Cop 1 and Cop 2 swap roles if Cop 1 sucessfully guards their column path, as it frees up Cop 2 to find a new column path to guard
-                if self.cop1_guarded:
-                    # Find Connected Components after G-P and of them the connected component the robber is in
-                    graph_modified = self.graph.copy()
-                    graph_modified.remove_nodes_from(self.target_column_path)
-                    components = list(nx.connected_components(graph_modified))
-                    for component in components:
-                        if self.robber_node in component:
-                            robber_component = component
-
-                    # Check for nodes which reside on the adjacent column path in the robber's component
-                    adjacent_path_node = None
-                    for node in self.target_column_path:
-                        y, x = node
-                        test_nodes = [(y, x-1), (y, x+1)]
-                        for test_node in test_nodes:
-                            if(test_node in self.graph.nodes):
-                                if ((node, test_node) in self.graph.edges):
-                                    if test_node in robber_component:
-                                        adjacent_path_node = test_node
-                    self.target_column_path = self.find_column_path(adjacent_path_node)
-                    # Swap the Cop 1 and Cop 2 pointers
-                    temp = self.cop1_pointer
-                    self.cop1_pointer = self.cop2_pointer
-                    self.cop2_pointer = temp
-                    self.cop1_guarded = False
+                self.move_cops()
 
                 self.turn_count += 1
                 self.turn_count_label.setText(f"Turn: {self.turn_count}")
@@ -1173,7 +1883,6 @@ class AutomatedStrategyWindow(StrategyWindow):
                 self.turn_label.setText("Robber's Turn")
                 self.display_graph()
                 self.check_game_over()
-                QTimer.singleShot(50, self.robber_strategy)
             
     """Check for if cop has captured robber"""
     def check_game_over(self):
@@ -1182,12 +1891,47 @@ class AutomatedStrategyWindow(StrategyWindow):
                 self.turn_label.setText("Game Over, Cops captured the robber")
                 self.is_game_over = True
 
+    """Moves the cops, looking the move up in the compiled policy table when one is loaded for the board"""
+    def move_cops(self):
+        response = None
+        if self.policy_table is not None:
+            response = self.lookup_policy()
+            if response is not None and not self.cross_check_policy:
+                self.policy_table.apply(self, response)
+                return
+
+        self.live_move_cops()
+
+        # Cross check the table against the live strategy, the live move is kept if they disagree
+        if response is not None and not self.policy_table.matches(self, response):
+            self.policy_mismatches += 1
+
+    """Moves the cops with the live strategy, played on the window's engine from a copy of the game state"""
+    def live_move_cops(self):
+        # The board is kept between moves so its column paths stay cached
+        if self.engine.graph is not self.graph:
+            self.engine.update_graph(self.graph)
+        restore_state(self.engine, copy_state(self))
+        self.engine.move_cops()
+        cop_nodes, self.cop1_pointer, self.cop2_pointer, self.target_column_path, self.target_node, self.target_path = \
+            self.engine.get_decision()
+        self.cop_nodes = list(cop_nodes)
+        self.cop1_guarded = self.engine.cop1_guarded
+
+    """Hits and lookups of the policy table, shown by the performance overlay"""
+    def cache_hit_rates(self):
+        return {"policy table": (self.policy_hits, self.policy_lookups)}
+
     """Button function to switch window to graph creation window"""
     def restart(self):
+        self.scheduler.cancel()
+        self.stats_panel.stop()
         self.parent.switch_to_starting_window()
 
     """Clears the state variables so fresh game can be started when window is re switched into"""
     def reset_state(self):
+        self.scheduler.cancel()
+        self.stats_panel.stop()
         self.graph = None
         self.pos = {}
         self.node_size = None
@@ -1202,6 +1946,10 @@ class AutomatedStrategyWindow(StrategyWindow):
         self.target_node = None
         self.target_path = []
         self.cop1_guarded = False
+        self.policy_table = None
+        self.policy_lookups = 0
+        self.policy_hits = 0
+        self.policy_mismatches = 0
 
         self.is_game_over = False
         self.is_robber_turn = False
@@ -1211,7 +1959,196 @@ class AutomatedStrategyWindow(StrategyWindow):
         self.turn_count = 0
         self.turn_count_label.setText(f"Turn: {self.turn_count}")
 
-app = QApplication([])
-window = MainApp()
-window.show()
-app.exec_()
\ No newline at end of file
+"""One automated game on its own random solid grid, drawn off screen by a BoardRenderer into a label"""
+class DashboardTile(QLabel):
+    def __init__(self, parent, rows, cols, width, height, rng, restart_ticks=20):
+        super().__init__(parent)
+        self.rows = rows
+        self.cols = cols
+        self.rng = rng
+        self.restart_ticks = restart_ticks
+        self.setFixedSize(width, height)
+        self.renderer = None
+        self.capture_turns = []
+        self.new_game()
+
+    """Starts a new game on a new random board"""
+    def new_game(self):
+        # A board needs room for both cops and the robber, rows and cols are at least 2 so a full grid always has it
+        mask = random_solid_grid(self.rows, self.cols, self.rng)
+        while mask.sum() < 3:
+            mask = random_solid_grid(self.rows, self.cols, self.rng)
+        graph = graph_from_mask(mask)
+        # Boards of the same size reuse the figure, a board with empty edge rows or columns needs a new one
+        if self.renderer is None or self.renderer.shape != mask_from_graph(graph).shape:
+            self.renderer = BoardRenderer(graph, self.width(), self.height())
+        else:
+            self.renderer.set_board(graph)
+        self.engine = StrategyEngine(graph, seed=self.rng.randrange(2 ** 32))
+        self.engine.cop_strategy()
+        self.idle_ticks = 0
+        self.dirty = True
+
+    """Plays the next move, a finished game is shown for restart_ticks ticks before a new one starts"""
+    def step(self):
+        if self.engine.is_game_over:
+            self.idle_ticks += 1
+            if self.idle_ticks >= self.restart_ticks:
+                self.new_game()
+            return
+
+        if self.engine.is_robber_turn:
+            self.engine.robber_strategy()
+        else:
+            self.engine.cop_strategy()
+        self.dirty = True
+        if self.engine.is_game_over:
+            self.capture_turns.append(self.engine.turn_count)
+
+    """Draws the current state into the label"""
+    def repaint_tile(self):
+        frame = self.renderer.render(copy_state(self.engine))
+        height, width = frame.shape[:2]
+        image = QImage(frame.data, width, height, 3 * width, QImage.Format_RGB888)
+        self.setPixmap(QPixmap.fromImage(image))
+        self.dirty = False
+
+"""Plays a move on every dashboard tile from one timer, repaints of changed tiles share a time budget each frame
+
+The timer interval caps the frame rate, tiles left over when the budget runs out are painted first next frame
+"""
+class DashboardScheduler(QObject):
+    def __init__(self, window, max_fps=20, frame_budget=0.025):
+        super().__init__(window)
+        self.window = window
+        self.frame_budget = frame_budget
+        self.timer = QTimer(self)
+        self.timer.setInterval(int(1000 / max_fps))
+        self.timer.timeout.connect(self.tick)
+        self.next_tile = 0
+
+        # Frames and repaints since the status was last shown
+        self.frames = 0
+        self.repaints = 0
+        self.last_status = time.perf_counter()
+
+    """Starts or resumes the games"""
+    def start(self):
+        self.timer.start()
+
+    """Pauses the games"""
+    def pause(self):
+        self.timer.stop()
+
+    """Plays one move on every tile then repaints changed tiles until the frame budget is spent"""
+    def tick(self):
+        tiles = self.window.tiles
+        for tile in tiles:
+            tile.step()
+
+        start = time.perf_counter()
+        count = len(tiles)
+        for i in range(count):
+            index = (self.next_tile + i) % count
+            if not tiles[index].dirty:
+                continue
+            if time.perf_counter() - start > self.frame_budget:
+                self.next_tile = index
+                break
+            tiles[index].repaint_tile()
+            self.repaints += 1
+
+        self.frames += 1
+        now = time.perf_counter()
+        if now - self.last_status >= 1:
+            self.window.show_status(self.frames / (now - self.last_status), self.repaints / (now - self.last_status))
+            self.frames = 0
+            self.repaints = 0
+            self.last_status = now
+
+"""Dashboard tiling many small boards, each playing its own automated game"""
+class DashboardWindow(QWidget):
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.parent = parent
+        self.rows = 10
+        self.cols = 10
+        self.tiles = []
+        self.scheduler = DashboardScheduler(self)
+
+        layout = QVBoxLayout(self)
+        controls = QHBoxLayout()
+
+        self.input_tiles = QLineEdit(self)
+        self.input_tiles.setPlaceholderText("Boards, 16-64 (default 16)")
+        controls.addWidget(self.input_tiles)
+
+        # Buttons to start the boards, pause them and return to graph creation window
+        self.button_start = QPushButton("Start", self)
+        self.button_start.clicked.connect(self.start)
+        controls.addWidget(self.button_start)
+
+        self.button_pause = QPushButton("Pause", self)
+        self.button_pause.clicked.connect(self.scheduler.pause)
+        controls.addWidget(self.button_pause)
+
+        self.button_restart = QPushButton("Restart", self)
+        self.button_restart.clicked.connect(self.restart)
+        controls.addWidget(self.button_restart)
+        layout.addLayout(controls)
+
+        self.status_label = QLabel("Press start to run the boards", self)
+        layout.addWidget(self.status_label)
+
+        self.grid_widget = QWidget(self)
+        self.grid_widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.grid_layout = QGridLayout(self.grid_widget)
+        self.grid_layout.setSpacing(2)
+        layout.addWidget(self.grid_widget)
+
+    """Button function to lay out new tiles, sized to fit the window, and start their games"""
+    def start(self):
+        try:
+            count = min(max(int(self.input_tiles.text()), 16), 64)
+        except ValueError:
+            count = 16
+        self.clear_tiles()
+
+        columns = math.ceil(math.sqrt(count))
+        grid_rows = math.ceil(count / columns)
+        width = max(60, self.grid_widget.width() // columns - 4)
+        height = max(45, self.grid_widget.height() // grid_rows - 4)
+        rng = random.Random()
+        for i in range(count):
+            tile = DashboardTile(self.grid_widget, self.rows, self.cols, width, height, random.Random(rng.random()))
+            self.grid_layout.addWidget(tile, i // columns, i % columns)
+            self.tiles.append(tile)
+        self.scheduler.start()
+
+    """Removes the tiles of the last start"""
+    def clear_tiles(self):
+        self.scheduler.pause()
+        for tile in self.tiles:
+            self.grid_layout.removeWidget(tile)
+            tile.deleteLater()
+        self.tiles = []
+        self.scheduler.next_tile = 0
+
+    """Shows the frame rate, repaint rate and capture times so far"""
+    def show_status(self, fps, repaints):
+        capture_turns = [turn for tile in self.tiles for turn in tile.capture_turns]
+        mean = sum(capture_turns) / len(capture_turns) if capture_turns else 0
+        self.status_label.setText(f"{len(self.tiles)} boards  {fps:.0f} frames/s  {repaints:.0f} tile repaints/s  "
+                                  f"Games: {len(capture_turns)}  Mean capture turn: {mean:.1f}")
+
+    """Button function to stop the boards and switch window to graph creation window"""
+    def restart(self):
+        self.clear_tiles()
+        self.status_label.setText("Press start to run the boards")
+        self.parent.switch_to_starting_window()
+
+if __name__ == "__main__":
+    app = QApplication([])
+    window = MainApp()
+    window.show()
+    app.exec_()
\ No newline at end of file
@@ -0,0 +1,108 @@
+import argparse
+import sys
+import time
+import types
+import numpy as np
+import networkx as nx
+
+import BoardTables as board_tables
+from BatchSimulator import BatchSimulator
+from BoardTables import BoardTables, RowCache, graph_from_mask, table_mode
+from GameExport import record_game
+from StrategyEngine import StrategyEngine
+
+# Functions, classes and modules are shared code rather than data a board holds, so they are not followed
+SKIPPED_TYPES = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.MethodType)
+
+"""Bytes held by an object and everything it refers to, objects already in seen are not counted again
+
+NumPy arrays count their data, memory mapped arrays count nothing as their pages belong to the file
+"""
+def deep_size(obj, seen=None):
+    seen = set() if seen is None else seen
+    total = 0
+    stack = [obj]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, SKIPPED_TYPES):
+            continue
+        seen.add(id(obj))
+        if isinstance(obj, np.ndarray):
+            total += 0 if isinstance(obj, np.memmap) or isinstance(obj.base, np.memmap) else obj.nbytes
+            continue
+        total += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif hasattr(obj, "__dict__"):
+            stack.append(obj.__dict__)
+    return total
+
+"""Bytes a board holds in each part, every object is counted once in the first part that refers to it
+
+Parts left as None are reported as 0, games is a list of games recorded as lists of states
+"""
+def board_memory(graph, pos=None, tables=None, engine=None, games=None):
+    seen = set()
+    report = {"board": deep_size(graph, seen), "positions": deep_size(pos, seen) if pos is not None else 0}
+    if tables is not None:
+        report["distances"] = deep_size(tables.distances, seen)
+        report["components"] = deep_size(tables.component_of, seen)
+        report["tables"] = deep_size(tables, seen)
+    else:
+        report.update({"distances": 0, "components": 0, "tables": 0})
+    report["engine caches"] = deep_size(engine, seen) if engine is not None else 0
+    report["recorded games"] = deep_size(games, seen) if games is not None else 0
+    report["total"] = sum(report.values())
+    return report
+
+"""Writes a byte count with a binary unit"""
+def format_bytes(count):
+    for unit in ("B", "KiB", "MiB"):
+        if count < 1024:
+            return f"{count:.0f} {unit}" if unit == "B" else f"{count:.1f} {unit}"
+        count /= 1024
+    return f"{count:.1f} GiB"
+
+"""Reads a byte count written with an optional K, M or G suffix"""
+def parse_bytes(text):
+    text = text.strip().upper().rstrip("B")
+    scale = {"K": 2 ** 10, "M": 2 ** 20, "G": 2 ** 30}.get(text[-1:], 1)
+    return int(float(text.rstrip("KMG")) * scale)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Report where the memory of one board goes")
+    parser.add_argument("--rows", type=int, default=50)
+    parser.add_argument("--cols", type=int, default=50)
+    parser.add_argument("--mask", help="Boolean .npy mask of the board, used instead of --rows and --cols")
+    parser.add_argument("--budget", type=parse_bytes, help="Memory budget for the tables such as 64M")
+    parser.add_argument("--games", type=int, default=3, help="Games recorded on the single game engine")
+    parser.add_argument("--batch-games", type=int, default=200, help="Games run on the tables before they are measured")
+    parser.add_argument("--max-turns", type=int, default=2000)
+    args = parser.parse_args()
+
+    board_tables.set_memory_budget(args.budget)
+    graph = graph_from_mask(np.load(args.mask)) if args.mask else nx.grid_2d_graph(args.rows, args.cols)
+    pos = {(x, y): (y, -x) for x, y in graph.nodes}
+    start = time.perf_counter()
+    tables = BoardTables(graph)
+    table_time = time.perf_counter() - start
+    # A batch fills the rows kept under a budget, as a simulation would
+    BatchSimulator(graph, tables).run(args.batch_games, seed=0, max_turns=args.max_turns)
+
+    engine = StrategyEngine(graph, seed=0)
+    for _ in range(args.games):
+        engine.play_game(args.max_turns)
+    games = [record_game(graph, seed, args.max_turns) for seed in range(args.games)]
+
+    print(f"Board: {graph.number_of_nodes()} nodes, tables built in {table_time:.2f}s, "
+          f"budget {'none' if args.budget is None else format_bytes(args.budget)}")
+    for part, count in board_memory(graph, pos, tables, engine, games).items():
+        print(f"{part:<15} {format_bytes(count):>12}")
+    for name, table in (("distances", tables.distances), ("components", tables.component_of)):
+        detail = ""
+        if isinstance(table, RowCache):
+            detail = f", {table.capacity} of {table.shape[0]} rows kept, {table.hits} hits {table.misses} misses"
+        print(f"{name} held as {table_mode(table)}{detail}")
@@ -0,0 +1,123 @@
+import argparse
+import hashlib
+import itertools
+import json
+import multiprocessing
+import os
+import random
+import time
+import numpy as np
+
+from BoardSymmetry import canonical_hash
+from BoardTables import board_hash, graph_from_mask
+from SolidGrids import random_solid_grid
+from StrategyEngine import StrategyEngine
+from StrategyFuzzer import ROBBER_POLICIES, crop
+
+# Bump when a change to the strategy means cached results should not be reused
+SWEEP_VERSION = 2
+CACHE_DIRECTORY = "sweep_cache"
+
+"""Full rows x cols grid, the generator is not used"""
+def full_grid(rows, cols, rng):
+    return np.ones((rows, cols), dtype=bool)
+
+# Board generators, each makes a mask from a size and a seeded random generator
+SHAPES = {"full": full_grid, "random": random_solid_grid}
+
+"""Every combination of the sweep parameters, sizes are (rows, cols) pairs"""
+def sweep_cells(sizes, shapes=("full",), policies=("random",), seeds=(0,)):
+    return [{"rows": rows, "cols": cols, "shape": shape, "policy": policy, "seed": seed}
+            for (rows, cols), shape, policy, seed in itertools.product(sizes, shapes, policies, seeds)]
+
+"""Board of a cell, trimmed so the same board always gets the same hash"""
+def cell_board(cell):
+    return crop(SHAPES[cell["shape"]](cell["rows"], cell["cols"], random.Random(cell["seed"])))
+
+"""Cache key of a cell, a hash of its board and the parameters its games depend on
+
+The shape and size are left out, so cells which make the same board share one result. The strategy works along
+columns from the right hand side, so a rotated or reflected board gets its own result rather than the canonical one
+"""
+def cell_key(mask, cell, games, max_turns):
+    params = json.dumps({"version": SWEEP_VERSION, "policy": cell["policy"], "seed": cell["seed"],
+                         "games": games, "max_turns": max_turns}, sort_keys=True)
+    return hashlib.sha1((board_hash(mask) + params).encode()).hexdigest()
+
+"""Plays the games of one cell on the headless engine, unfinished games get a capture turn of -1
+
+A board needs room for both cops and the robber, smaller ones are recorded as not playable with no games
+"""
+def play_cell(mask, policy, seed, games, max_turns):
+    if mask.sum() < 3:
+        return {"board_hash": board_hash(mask), "canonical_hash": canonical_hash(mask), "nodes": int(mask.sum()),
+                "playable": False, "capture_turns": [], "swap_counts": [], "seconds": 0.0}
+    engine = StrategyEngine(graph_from_mask(mask), seed=seed, robber_policy=ROBBER_POLICIES[policy])
+    capture_turns = []
+    swap_counts = []
+    start = time.perf_counter()
+    for _ in range(games):
+        capture_turn = engine.play_game(max_turns)
+        capture_turns.append(-1 if capture_turn is None else capture_turn)
+        swap_counts.append(engine.swap_count)
+    return {"board_hash": board_hash(mask), "canonical_hash": canonical_hash(mask), "nodes": int(mask.sum()),
+            "playable": True, "capture_turns": capture_turns, "swap_counts": swap_counts, "seconds": time.perf_counter() - start}
+
+"""Runs one cell in a worker process, returns (cell, result, cached) where cached says the result was read from disk"""
+def run_cell(task):
+    cell, games, max_turns, directory = task
+    mask = cell_board(cell)
+    path = os.path.join(directory, cell_key(mask, cell, games, max_turns) + ".json")
+    if os.path.exists(path):
+        with open(path) as file:
+            return cell, json.load(file), True
+
+    result = play_cell(mask, cell["policy"], cell["seed"], games, max_turns)
+    # Written under a temporary name first so an interrupted sweep never leaves half a result behind
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, "w") as file:
+        json.dump(result, file)
+    os.replace(temporary, path)
+    return cell, result, False
+
+"""Runs every cell on a process pool and yields (cell, result, cached) as each one finishes
+
+Results are cached in directory, so a sweep which was interrupted or extended only plays the cells it is missing
+"""
+def run_sweep(cells, games=20, max_turns=2000, directory=CACHE_DIRECTORY, processes=None):
+    os.makedirs(directory, exist_ok=True)
+    tasks = [(cell, games, max_turns, directory) for cell in cells]
+    with multiprocessing.Pool(processes) as pool:
+        yield from pool.imap_unordered(run_cell, tasks)
+
+"""Reads a size written as ROWSxCOLS"""
+def parse_size(text):
+    rows, cols = text.lower().split("x")
+    return int(rows), int(cols)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the headless strategy over every combination of sweep parameters")
+    parser.add_argument("--sizes", type=parse_size, nargs="+", default=[(10, 10)], help="Board sizes such as 8x8 12x16")
+    parser.add_argument("--shapes", choices=list(SHAPES), nargs="+", default=["full"])
+    parser.add_argument("--policies", choices=list(ROBBER_POLICIES), nargs="+", default=["random"])
+    parser.add_argument("--seeds", type=int, default=5, help="Seeds 0 to SEEDS-1 are swept")
+    parser.add_argument("--games", type=int, default=20, help="Games played in each cell")
+    parser.add_argument("--max-turns", type=int, default=2000)
+    parser.add_argument("--cache", default=CACHE_DIRECTORY, help="Folder results are cached in")
+    parser.add_argument("--processes", type=int, default=None)
+    args = parser.parse_args()
+
+    cells = sweep_cells(args.sizes, args.shapes, args.policies, range(args.seeds))
+    cached_count = 0
+    boards = set()
+    for cell, result, cached in run_sweep(cells, args.games, args.max_turns, args.cache, args.processes):
+        cached_count += cached
+        boards.add(result["canonical_hash"])
+        finished = [turn for turn in result["capture_turns"] if turn >= 0]
+        mean = f"{np.mean(finished):.1f}" if finished else "-"
+        timing = "cached" if cached else f"{result['seconds']:.2f}s"
+        if not result.get("playable", True):
+            timing = "not playable"
+        print(f"{cell['rows']}x{cell['cols']} {cell['shape']:<6} {cell['policy']:<7} seed {cell['seed']:<4} "
+              f"nodes {result['nodes']:<5} mean capture {mean:<7} max {max(finished, default='-'):<5} {timing}")
+    print(f"{len(cells)} cells on {len(boards)} boards distinct up to symmetry, {cached_count} read from {args.cache}")
@@ -0,0 +1,220 @@
+import argparse
+import json
+import os
+import numpy as np
+import networkx as nx
+
+from BoardTables import BoardTables, board_hash, graph_from_mask, mask_from_graph
+from BatchSimulator import BatchSimulator
+
+# Bump when the files written by compile_policy change
+POLICY_VERSION = 1
+POLICY_DIRECTORY = "policies"
+
+# Key columns: cop 0, cop 1, robber, cop 1 pointer, target column path head, target node, target path
+KEY_FIELDS = 7
+HASH_MULTIPLIERS = (0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9, 0xD6E8FEB86659FD93,
+                    0xFF51AFD7ED558CCD, 0xC4CEB9FE1A85EC53, 0x94D049BB133111EB)
+MASK_64 = (1 << 64) - 1
+
+"""Hashes rows of state keys, must give the same result as hash_key"""
+def hash_keys(keys):
+    h = np.zeros(len(keys), dtype=np.uint64)
+    for i, multiplier in enumerate(HASH_MULTIPLIERS):
+        h = (h ^ (keys[:, i].astype(np.int64) + 1).astype(np.uint64)) * np.uint64(multiplier)
+    return h ^ (h >> np.uint64(32))
+
+"""Hashes a single state key given as a tuple of ints"""
+def hash_key(key):
+    h = 0
+    for value, multiplier in zip(key, HASH_MULTIPLIERS):
+        h = ((h ^ (value + 1)) * multiplier) & MASK_64
+    return h ^ (h >> 32)
+
+"""Enumerates every state reachable after cop placement and stores the cops' response to each, returns the arrays to save"""
+def compile_policy(graph, tables=None):
+    tables = tables if tables is not None else BoardTables(graph)
+    sim = BatchSimulator(graph, tables)
+
+    # The robber can be placed on any node the cops are not on
+    free_nodes = np.setdiff1d(np.arange(tables.node_count), sim.start_cops).astype(np.int32)
+    frontier = np.empty((len(free_nodes), KEY_FIELDS), dtype=np.int32)
+    frontier[:, 0:2] = sim.start_cops
+    frontier[:, 2] = free_nodes
+    frontier[:, 3] = 0
+    frontier[:, 4] = sim.start_column_path
+    frontier[:, 5:7] = -1
+
+    visited = set(map(tuple, frontier.tolist()))
+    key_chunks = []
+    response_chunks = []
+    while len(frontier):
+        # Load the frontier into the simulator as one game per state and move every cop at once
+        games = np.arange(len(frontier))
+        sim.cops = frontier[:, 0:2].copy()
+        sim.robber = frontier[:, 2].copy()
+        sim.cop1_pointer = frontier[:, 3].astype(np.int8)
+        sim.target_column_path = frontier[:, 4].copy()
+        sim.target_node = frontier[:, 5].copy()
+        sim.target_path = frontier[:, 6].copy()
+        sim.swap_count = np.zeros(len(frontier), dtype=np.int32)
+        sim.cop_moves(games)
+
+        responses = np.stack([sim.cops[:, 0], sim.cops[:, 1], sim.cop1_pointer.astype(np.int32),
+                              sim.target_column_path, sim.target_node, sim.target_path], axis=1)
+        key_chunks.append(frontier)
+        response_chunks.append(responses)
+
+        # Robber moves from every state where it was not captured, moving onto a cop ends the game
+        alive = (sim.cops[:, 0] != sim.robber) & (sim.cops[:, 1] != sim.robber)
+        next_states = []
+        for option in range(5):
+            robber = tables.neighbours[sim.robber[alive], option]
+            states = np.column_stack([responses[alive, 0:2], robber, responses[alive, 2:6]])
+            next_states.append(states[(states[:, 0] != robber) & (states[:, 1] != robber)])
+        next_states = np.unique(np.concatenate(next_states), axis=0)
+
+        new_states = [state for state in map(tuple, next_states.tolist()) if state not in visited]
+        visited.update(new_states)
+        frontier = np.array(new_states, dtype=np.int32).reshape(-1, KEY_FIELDS)
+
+    keys = np.concatenate(key_chunks)
+    responses = np.concatenate(response_chunks)
+
+    # Open addressing hash table of row indices, at most half full so probes stay short
+    slot_count = 1 << max(4, (2 * len(keys) - 1).bit_length())
+    slots = np.full(slot_count, -1, dtype=np.int32)
+    slot_of = (hash_keys(keys) & np.uint64(slot_count - 1)).astype(np.int64)
+    for row, slot in enumerate(slot_of.tolist()):
+        while slots[slot] >= 0:
+            slot = (slot + 1) & (slot_count - 1)
+        slots[slot] = row
+
+    width = max([len(path) for path in sim.path_list] + [1])
+    paths = np.full((len(sim.path_list), width), -1, dtype=np.int32)
+    for i, path in enumerate(sim.path_list):
+        paths[i, :len(path)] = path
+
+    return {"mask": tables.mask, "cell_ids": tables.cell_ids, "paths": paths, "keys": keys,
+            "responses": responses, "slots": slots}
+
+"""Compiles the policy for a board and saves it as .npy files in the board's folder, returns the folder"""
+def save_policy(graph, directory=POLICY_DIRECTORY):
+    arrays = compile_policy(graph)
+    folder = os.path.join(directory, board_hash(arrays["mask"]))
+    os.makedirs(folder, exist_ok=True)
+    for name, array in arrays.items():
+        np.save(os.path.join(folder, name + ".npy"), array)
+    with open(os.path.join(folder, "meta.json"), "w") as file:
+        json.dump({"version": POLICY_VERSION, "states": len(arrays["keys"])}, file)
+    return folder
+
+"""Compiled cop responses for one board, memory mapped from disk"""
+class PolicyTable:
+    def __init__(self, folder):
+        with open(os.path.join(folder, "meta.json")) as file:
+            meta = json.load(file)
+        if meta["version"] != POLICY_VERSION:
+            raise ValueError(f"Policy table version {meta['version']} is not supported")
+
+        for name in ("mask", "cell_ids", "paths", "keys", "responses", "slots"):
+            setattr(self, name, np.load(os.path.join(folder, name + ".npy"), mmap_mode="r"))
+        self.slot_mask = len(self.slots) - 1
+        self.nodes = list(zip(*(a.tolist() for a in np.nonzero(self.mask))))
+
+        # Target paths are stored by id, look them up by (start, target)
+        self.path_ids = {}
+        for path_id, path in enumerate(self.paths):
+            path = path[path >= 0]
+            self.path_ids[(int(path[0]), int(path[-1]))] = path_id
+
+    """Loads the compiled table for a graph if one exists"""
+    @classmethod
+    def find(cls, graph, directory=POLICY_DIRECTORY):
+        folder = os.path.join(directory, board_hash(mask_from_graph(graph)))
+        if not os.path.exists(os.path.join(folder, "meta.json")):
+            return None
+        return cls(folder)
+
+    """Packs the strategy state of a window or engine into a key tuple, None if the state can't be in the table"""
+    def pack_state(self, strategy):
+        if not strategy.target_column_path:
+            return None
+        cop0, cop1 = (self.node_id(node) for node in strategy.cop_nodes)
+        target_node = -1 if strategy.target_node is None else self.node_id(strategy.target_node)
+        target_path = -1
+        if strategy.target_path:
+            key = (self.node_id(strategy.target_path[0]), self.node_id(strategy.target_path[-1]))
+            if key not in self.path_ids:
+                return None
+            target_path = self.path_ids[key]
+        # The first node of a column path sets the order of the rest of it
+        head = self.node_id(strategy.target_column_path[0])
+        return (cop0, cop1, self.node_id(strategy.robber_node), strategy.cop1_pointer, head, target_node, target_path)
+
+    """Response row for the current state, None when the state is not in the table"""
+    def lookup(self, strategy):
+        key = self.pack_state(strategy)
+        if key is None:
+            return None
+        slot = hash_key(key) & self.slot_mask
+        while True:
+            row = self.slots[slot]
+            if row < 0:
+                return None
+            if tuple(self.keys[row].tolist()) == key:
+                return self.responses[row]
+            slot = (slot + 1) & self.slot_mask
+
+    """Applies a response row to a window or engine"""
+    def apply(self, strategy, response):
+        (strategy.cop_nodes, strategy.cop1_pointer, strategy.cop2_pointer, strategy.target_column_path,
+         strategy.target_node, strategy.target_path) = self.decision(response)
+
+    """Checks a window or engine is in the state a response row describes"""
+    def matches(self, strategy, response):
+        return (strategy.cop_nodes, strategy.cop1_pointer, strategy.cop2_pointer, strategy.target_column_path,
+                strategy.target_node, strategy.target_path) == self.decision(response)
+
+    """Unpacks a response row into cop nodes, pointers, target column path, target node and target path"""
+    def decision(self, response):
+        cop0, cop1, cop1_pointer, head, target_node, target_path = response.tolist()
+        return ([self.node_of(cop0), self.node_of(cop1)], cop1_pointer, 1 - cop1_pointer,
+                self.column_path(head),
+                None if target_node < 0 else self.node_of(target_node),
+                [] if target_path < 0 else self.node_list(self.paths[target_path]))
+
+    """Node id of a (row, col) node"""
+    def node_id(self, node):
+        return int(self.cell_ids[node])
+
+    """(row, col) node of a node id"""
+    def node_of(self, node_id):
+        return self.nodes[node_id]
+
+    """Column path listed from its head, nodes above the head nearest first and then the nodes below it"""
+    def column_path(self, head):
+        row, col = self.node_of(head)
+        top = row
+        while top > 0 and self.mask[top - 1, col]:
+            top -= 1
+        bottom = row
+        while bottom + 1 < self.mask.shape[0] and self.mask[bottom + 1, col]:
+            bottom += 1
+        return [(y, col) for y in range(row, top - 1, -1)] + [(y, col) for y in range(row + 1, bottom + 1)]
+
+    """Nodes of a -1 padded row of node ids"""
+    def node_list(self, ids):
+        return [self.node_of(node_id) for node_id in ids.tolist() if node_id >= 0]
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compile the cop strategy into a policy table for a board")
+    parser.add_argument("--rows", type=int, default=8)
+    parser.add_argument("--cols", type=int, default=8)
+    parser.add_argument("--mask", help="Boolean .npy mask of the board, used instead of --rows and --cols")
+    parser.add_argument("--directory", default=POLICY_DIRECTORY)
+    args = parser.parse_args()
+
+    graph = graph_from_mask(np.load(args.mask)) if args.mask else nx.grid_2d_graph(args.rows, args.cols)
+    folder = save_policy(graph, args.directory)
+    print(f"Saved policy table to {folder}")
@@ -0,0 +1,110 @@
+import glob
+import os
+import numpy as np
+
+"""Streams records to a folder of compressed .npz chunks, one array per column, so memory use is bounded by chunk_rows
+
+The first record sets the columns, every later record needs the same ones. Writing to a folder which already
+has chunks carries on after them
+"""
+class ResultsWriter:
+    def __init__(self, directory, chunk_rows=65536):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.chunk_rows = chunk_rows
+        self.chunk_index = len(chunk_paths(directory))
+        self.columns = {}
+        self.rows = 0
+
+    """Adds one record, a dict of column name to a number or string"""
+    def append(self, record):
+        self.check_columns(record)
+        for name, values in self.columns.items():
+            values.append(record[name])
+        self.rows += 1
+        if self.rows >= self.chunk_rows:
+            self.flush()
+
+    """Adds many records at once from a dict of column name to equal length arrays, a single value fills its column"""
+    def append_columns(self, columns):
+        length = max(np.size(values) for values in columns.values())
+        self.check_columns(columns)
+        columns = {name: np.broadcast_to(values, (length,)) for name, values in columns.items()}
+        start = 0
+        while start < length:
+            end = min(length, start + self.chunk_rows - self.rows)
+            for name, values in self.columns.items():
+                values.extend(columns[name][start:end].tolist())
+            self.rows += end - start
+            start = end
+            if self.rows >= self.chunk_rows:
+                self.flush()
+
+    """Sets the columns from the first record, later ones must have exactly the same names so no column falls behind"""
+    def check_columns(self, record):
+        if not self.columns:
+            self.columns = {name: [] for name in record}
+        elif set(record) != set(self.columns):
+            missing = sorted(set(self.columns) - set(record))
+            extra = sorted(set(record) - set(self.columns))
+            raise ValueError(f"Record columns don't match the results, missing {missing} and unexpected {extra}")
+
+    """Writes the buffered records as a chunk"""
+    def flush(self):
+        if not self.rows:
+            return
+        path = os.path.join(self.directory, f"chunk_{self.chunk_index:06d}.npz")
+        # Written under a temporary name first so readers never see half a chunk
+        temporary = path + ".tmp"
+        with open(temporary, "wb") as file:
+            np.savez_compressed(file, **{name: np.asarray(values) for name, values in self.columns.items()})
+        os.replace(temporary, path)
+        self.chunk_index += 1
+        for values in self.columns.values():
+            values.clear()
+        self.rows = 0
+
+    """Writes any records still buffered"""
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+"""Chunk files of a results folder in the order they were written"""
+def chunk_paths(directory):
+    return sorted(glob.glob(os.path.join(directory, "chunk_*.npz")))
+
+"""Reads a folder written by ResultsWriter one chunk at a time, only the columns asked for are decompressed"""
+class ResultsReader:
+    def __init__(self, directory):
+        self.directory = directory
+
+    """Yields a dict of column arrays for each chunk, columns defaults to all of them"""
+    def chunks(self, columns=None):
+        for path in chunk_paths(self.directory):
+            with np.load(path) as data:
+                yield {name: data[name] for name in (columns or data.files)}
+
+    """One column of every chunk joined into one array"""
+    def column(self, name):
+        arrays = [chunk[name] for chunk in self.chunks([name])]
+        return np.concatenate(arrays) if arrays else np.array([])
+
+    """Yields every record as a dict"""
+    def __iter__(self):
+        for chunk in self.chunks():
+            names = list(chunk)
+            for row in zip(*(chunk[name].tolist() for name in names)):
+                yield dict(zip(names, row))
+
+    """Number of records, only the first column of each chunk is read"""
+    def __len__(self):
+        count = 0
+        for path in chunk_paths(self.directory):
+            with np.load(path) as data:
+                count += len(data[data.files[0]])
+        return count
@@ -0,0 +1,152 @@
+from collections import deque
+
+"""The robber's territory, its component of G-P where P is the column path Cop 2 guards, and the column paths left in it
+
+The territory only changes when the guarded path does, and then the new path lies inside the old territory and splits
+it. Rather than search G-P again, floods started from the robber and from each side of the new path take turns growing
+one node at a time, and whichever of the robber's side or the parts cut off is finished first gives the new territory.
+The work is about the size of the smaller of the two. A guarded path outside the territory, such as after stepping
+back, or a robber that left it falls back to one search from the robber
+"""
+class RobberTerritory:
+    def __init__(self, graph):
+        self.graph = graph
+        self.column_path_cache = {}
+        self.reset()
+
+    """Forgets the territory so the next update searches from the robber"""
+    def reset(self):
+        self.guarded_path = None
+        self.nodes = set()
+        self.paths_left = 0
+
+    """Number of nodes in the territory"""
+    @property
+    def size(self):
+        return len(self.nodes)
+
+    """Updates the territory for the column path guard_node is on and the robber's node, returns its size and paths left"""
+    def update(self, guard_node, robber_node):
+        path = self.column_path(guard_node)
+        if path == self.guarded_path and robber_node in self.nodes:
+            return self.size, self.paths_left
+
+        if robber_node in path:
+            # A robber on the guarded path is about to be caught, it has no territory
+            self.guarded_path = path
+            self.nodes = set()
+            self.paths_left = 0
+        elif (self.guarded_path is None or path == self.guarded_path or robber_node not in self.nodes
+              or not self.split(path, robber_node)):
+            self.search(path, robber_node)
+        return self.size, self.paths_left
+
+    """Short description for the turn label"""
+    def describe(self):
+        return f"Robber territory: {self.size} nodes, {self.paths_left} column paths left"
+
+    """Finds the territory with one search of G-P from the robber"""
+    def search(self, path, robber_node):
+        removed = set(path)
+        self.nodes = {robber_node}
+        queue = deque([robber_node])
+        while queue:
+            for neighbour in self.graph.neighbors(queue.popleft()):
+                if neighbour not in removed and neighbour not in self.nodes:
+                    self.nodes.add(neighbour)
+                    queue.append(neighbour)
+        self.guarded_path = path
+        self.paths_left = sum(self.is_path_top(node) for node in self.nodes)
+
+    """Shrinks the territory to the robber's side of a new guarded path inside it, False if that side reaches the old path"""
+    def split(self, path, robber_node):
+        removed = set(path)
+        if not removed <= self.nodes:
+            return False
+
+        # Territory nodes beside the old path, the robber's side must not keep any of them
+        old_path = set(self.guarded_path)
+        old_border = {neighbour for node in old_path for neighbour in self.graph.neighbors(node)
+                      if neighbour in self.nodes and neighbour not in removed}
+
+        # Flood 0 starts from the robber, the rest from beside the new path, floods that meet are joined
+        seeds = [robber_node] + [neighbour for node in path for neighbour in self.graph.neighbors(node)
+                                 if neighbour in self.nodes and neighbour not in removed]
+        parent = list(range(len(seeds)))
+
+        def find(flood):
+            while parent[flood] != flood:
+                parent[flood] = parent[parent[flood]]
+                flood = parent[flood]
+            return flood
+
+        owner = {}
+        frontiers = []
+        for flood, seed in enumerate(seeds):
+            if seed in owner:
+                parent[find(flood)] = find(owner[seed])
+                frontiers.append([])
+            else:
+                owner[seed] = flood
+                frontiers.append([seed])
+
+        active = [flood for flood in range(len(seeds)) if frontiers[flood]]
+        while True:
+            robber_root = find(0)
+            robber_active = [flood for flood in active if find(flood) == robber_root]
+            if not robber_active:
+                # The robber's side is complete
+                territory = {node for node, flood in owner.items() if find(flood) == robber_root}
+                if territory & old_border:
+                    return False
+                self.nodes = territory
+                self.paths_left = sum(self.is_path_top(node) for node in territory)
+                break
+            if len(robber_active) == len(active):
+                # Every part cut off is complete, the robber's side is what is left
+                cut_off = {node for node, flood in owner.items() if find(flood) != robber_root}
+                if not old_border <= cut_off:
+                    return False
+                self.nodes -= cut_off
+                self.nodes -= removed
+                self.paths_left -= sum(self.is_path_top(node) for node in cut_off) + 1
+                break
+
+            # Each active flood grows by one node
+            for flood in active:
+                node = frontiers[flood].pop()
+                for neighbour in self.graph.neighbors(node):
+                    if neighbour in removed or neighbour not in self.nodes:
+                        continue
+                    if neighbour in owner:
+                        first, second = find(flood), find(owner[neighbour])
+                        if first != second:
+                            parent[second] = first
+                    else:
+                        owner[neighbour] = flood
+                        frontiers[flood].append(neighbour)
+            active = [flood for flood in active if frontiers[flood]]
+
+        self.guarded_path = path
+        return True
+
+    """Column path a node is on as a tuple, nodes are listed top to bottom"""
+    def column_path(self, node):
+        if node in self.column_path_cache:
+            return self.column_path_cache[node]
+        y, x = node
+        top = y
+        while self.graph.has_edge((top, x), (top - 1, x)):
+            top -= 1
+        bottom = y
+        while self.graph.has_edge((bottom, x), (bottom + 1, x)):
+            bottom += 1
+        path = tuple((row, x) for row in range(top, bottom + 1))
+        for path_node in path:
+            self.column_path_cache[path_node] = path
+        return path
+
+    """Whether a node is the top of its column path, so each column path is counted once"""
+    def is_path_top(self, node):
+        y, x = node
+        return not self.graph.has_edge(node, (y - 1, x))
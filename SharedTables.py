@@ -0,0 +1,39 @@
+import os
+import shutil
+import tempfile
+import numpy as np
+
+from BoardTables import BoardTables
+
+# Memory backed folder on Linux, so mapped tables never touch the disk
+SHARED_DIRECTORY = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+"""BoardTables written once to memory mapped files, worker processes attach to them without copying
+
+Workers map the same pages read only. Closing removes the files, the memory is freed once the last
+worker that still has them mapped exits
+"""
+class SharedTables:
+    def __init__(self, tables, directory=SHARED_DIRECTORY):
+        self.path = tempfile.mkdtemp(prefix="board_tables_", dir=directory)
+        for name, array in tables.arrays().items():
+            np.save(os.path.join(self.path, name + ".npy"), array)
+
+    """Removes the files, workers which already attached keep their mapping"""
+    def close(self):
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+"""BoardTables backed by the files of a SharedTables, the arrays are read only views of the shared pages
+
+Tables the main process held as rows under a memory budget aren't shared, each worker keeps its own rows
+"""
+def attach_tables(path):
+    return BoardTables.from_arrays({name: np.load(os.path.join(path, name + ".npy"), mmap_mode="r")
+                                    for name in BoardTables.array_names
+                                    if os.path.exists(os.path.join(path, name + ".npy"))})
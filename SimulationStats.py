@@ -0,0 +1,127 @@
+import argparse
+import multiprocessing
+import time
+import numpy as np
+import networkx as nx
+
+from BoardTables import BoardTables, board_hash, graph_from_mask, mask_from_graph
+from BatchSimulator import BatchSimulator
+from ResultsSink import ResultsWriter
+from SharedTables import SharedTables, attach_tables
+
+"""Streaming summary of capture times, memory use stays the same however many games are added"""
+class RunningStats:
+    def __init__(self, bin_count=50):
+        # Bins are merged in pairs when the width doubles
+        if bin_count < 2 or bin_count % 2:
+            raise ValueError(f"bin_count must be an even number of at least 2, got {bin_count}")
+        self.count = 0
+        self.unfinished = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = None
+        self.max = None
+
+        # Fixed number of bins, the bin width doubles whenever a capture time lands past the last bin
+        self.bin_width = 1
+        self.histogram = np.zeros(bin_count, dtype=np.int64)
+
+    """Adds an array of capture turns, -1 marks a game which hit the turn limit"""
+    def add_many(self, capture_turns):
+        capture_turns = np.asarray(capture_turns)
+        self.unfinished += int(np.count_nonzero(capture_turns < 0))
+        values = capture_turns[capture_turns >= 0]
+        if not len(values):
+            return
+
+        # Chan et al. parallel update of the mean and sum of squared differences
+        count = len(values)
+        mean = values.mean()
+        m2 = ((values - mean) ** 2).sum()
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta ** 2 * self.count * count / total
+        self.count = total
+
+        low, high = int(values.min()), int(values.max())
+        self.min = low if self.min is None else min(self.min, low)
+        self.max = high if self.max is None else max(self.max, high)
+
+        while high >= self.bin_width * len(self.histogram):
+            self.merge_bins()
+        self.histogram += np.bincount(values // self.bin_width, minlength=len(self.histogram))
+
+    """Doubles the bin width by adding neighbouring bins together"""
+    def merge_bins(self):
+        merged = self.histogram.reshape(-1, 2).sum(axis=1)
+        self.histogram[:] = 0
+        self.histogram[:len(merged)] = merged
+        self.bin_width *= 2
+
+    """Variance of the capture times"""
+    def variance(self):
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    """Lower edge of every histogram bin"""
+    def bin_edges(self):
+        return np.arange(len(self.histogram)) * self.bin_width
+
+# Simulator built once in each worker process
+worker_simulator = None
+
+"""Builds the simulator for the board when a worker process starts, on the tables shared by the main process"""
+def init_worker(tables_path):
+    global worker_simulator
+    tables = attach_tables(tables_path)
+    worker_simulator = BatchSimulator(graph_from_mask(tables.mask), tables)
+
+"""Plays one chunk of games in a worker process and returns their capture turns
+
+With details the chunk's seed, swap counts and time per game are returned with them in a dict
+"""
+def simulate_chunk(task):
+    seed, n_games, max_turns, details = task
+    start = time.perf_counter()
+    results = worker_simulator.run(n_games, seed=seed, max_turns=max_turns)
+    if not details:
+        return results["capture_turn"]
+    return dict(results, seed=seed, seconds=(time.perf_counter() - start) / n_games)
+
+"""Runs games on a process pool and yields the capture turns of each chunk as it finishes, or simulate_chunk's dicts"""
+def run_simulations(mask, n_games, chunk_size=500, processes=None, seed=0, max_turns=10000, details=False):
+    tasks = []
+    for chunk, start in enumerate(range(0, n_games, chunk_size)):
+        tasks.append((seed * 1000003 + chunk, min(chunk_size, n_games - start), max_turns, details))
+
+    # The tables are built once and mapped by every worker, leaving the generator early terminates the pool
+    with SharedTables(BoardTables(graph_from_mask(mask))) as shared, \
+            multiprocessing.Pool(processes, initializer=init_worker, initargs=(shared.path,)) as pool:
+        for capture_turns in pool.imap_unordered(simulate_chunk, tasks):
+            yield capture_turns
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Summarise capture times of many automated games")
+    parser.add_argument("--rows", type=int, default=20)
+    parser.add_argument("--cols", type=int, default=20)
+    parser.add_argument("--games", type=int, default=20000)
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--results", help="Folder every game is streamed to as ResultsSink chunks")
+    args = parser.parse_args()
+
+    stats = RunningStats()
+    mask = mask_from_graph(nx.grid_2d_graph(args.rows, args.cols))
+    writer = ResultsWriter(args.results) if args.results else None
+    for chunk in run_simulations(mask, args.games, processes=args.processes, details=writer is not None):
+        if writer is None:
+            stats.add_many(chunk)
+            continue
+        stats.add_many(chunk["capture_turn"])
+        # Games of a chunk are told apart by their index, the chunk's seed replays them all
+        writer.append_columns({"board_hash": board_hash(mask), "seed": chunk["seed"],
+                               "game": np.arange(len(chunk["capture_turn"])), "capture_turn": chunk["capture_turn"],
+                               "swap_count": chunk["swap_count"], "seconds": chunk["seconds"]})
+    if writer is not None:
+        writer.close()
+    print(f"Games: {stats.count}, mean capture turn {stats.mean:.2f}, std {stats.variance() ** 0.5:.2f}, "
+          f"max {stats.max}, unfinished {stats.unfinished}")
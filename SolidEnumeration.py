@@ -0,0 +1,160 @@
+import argparse
+import itertools
+import multiprocessing
+import os
+import sys
+from collections import Counter, deque
+import numpy as np
+
+from BoardSymmetry import TRANSFORMS
+from BoardTables import graph_from_mask
+from CaptureTime import expected_capture_time
+from SolidGrids import is_solid, mask_to_text
+from StrategyFuzzer import ROBBER_POLICIES, check_game
+
+"""Every fixed polyomino up to max_cells cells by Redelmeier's algorithm, each yielded once as a list of (row, col) cells
+
+Growth starts at (0, 0) and only adds cells above row 0 or right of it on row 0, so every polyomino is found from its
+first cell in row major order. The yielded list is changed as growth goes on, copy it to keep it
+"""
+def fixed_polyominoes(max_cells):
+    cells = []
+    # Cells that have been offered to the current polyomino, each is offered at most once down a branch
+    reached = {(0, 0)}
+
+    def grow(untried):
+        untried = list(untried)
+        while untried:
+            cell = untried.pop()
+            cells.append(cell)
+            yield cells
+            if len(cells) < max_cells:
+                row, col = cell
+                new = [(r, c) for r, c in ((row + 1, col), (row - 1, col), (row, col + 1), (row, col - 1))
+                       if (r > 0 or (r == 0 and c >= 0)) and (r, c) not in reached]
+                reached.update(new)
+                yield from grow(untried + new)
+                reached.difference_update(new)
+            cells.pop()
+
+    yield from grow([(0, 0)])
+
+"""Whether cells are in the orientation BoardSymmetry.canonical_form picks, the smallest shape then the smallest bitmask
+
+A bitmask is smaller when its first set bit in row major order comes later, so the keys negate the sorted cell indices
+"""
+def is_canonical(cells):
+    top = min(r for r, c in cells)
+    left = min(c for r, c in cells)
+    cells = [(r - top, c - left) for r, c in cells]
+    height = max(r for r, c in cells) + 1
+    width = max(c for r, c in cells) + 1
+    own_key = None
+    for transpose, flip_rows, flip_cols in TRANSFORMS:
+        rows, cols = (width, height) if transpose else (height, width)
+        indices = []
+        for r, c in cells:
+            if transpose:
+                r, c = c, r
+            if flip_rows:
+                r = rows - 1 - r
+            if flip_cols:
+                c = cols - 1 - c
+            indices.append(-(r * cols + c))
+        key = (rows, cols, tuple(sorted(indices, reverse=True)))
+        if own_key is None:
+            own_key = key
+        elif key < own_key:
+            return False
+    return True
+
+"""Mask of a list of (row, col) cells, trimmed to their bounding box"""
+def cells_to_mask(cells):
+    top = min(r for r, c in cells)
+    left = min(c for r, c in cells)
+    mask = np.zeros((max(r for r, c in cells) - top + 1, max(c for r, c in cells) - left + 1), dtype=bool)
+    for r, c in cells:
+        mask[r - top, c - left] = True
+    return mask
+
+"""Every solid grid of min_cells to max_cells nodes once up to rotation and reflection, in its canonical orientation
+
+Boards are yielded as they are found, sizes mixed, so none of them are held once the consumer is done with them
+"""
+def enumerate_solid_grids(max_cells, min_cells=1):
+    for cells in fixed_polyominoes(max_cells):
+        if len(cells) >= min_cells and is_canonical(cells):
+            mask = cells_to_mask(cells)
+            if is_solid(mask):
+                yield mask
+
+"""Runs function on a chunk of boards in a worker process"""
+def run_chunk(function, boards):
+    return [function(mask) for mask in boards]
+
+"""Runs function on every board on a process pool and yields the results in the order of the boards
+
+Boards are sent in chunks and only a few chunks are in flight at once, so a generator of boards is never held in memory
+"""
+def map_boards(function, boards, processes=None, chunk_size=256):
+    boards = iter(boards)
+    in_flight = 2 * (processes or os.cpu_count() or 1)
+    with multiprocessing.Pool(processes) as pool:
+        pending = deque()
+        for chunk in iter(lambda: list(itertools.islice(boards, chunk_size)), []):
+            pending.append(pool.apply_async(run_chunk, (function, chunk)))
+            if len(pending) >= in_flight:
+                yield from pending.popleft().get()
+        while pending:
+            yield from pending.popleft().get()
+
+"""Checks one board, the exact expected capture turn against the random robber and checked games with every robber policy
+
+Boards with fewer than 3 nodes have no room for both cops and the robber and are only counted
+"""
+def check_board(mask, games=3, max_turns=2000):
+    report = {"mask": mask, "nodes": int(mask.sum()), "expected": None, "failures": []}
+    if report["nodes"] < 3:
+        return report
+    report["expected"] = expected_capture_time(graph_from_mask(mask))["mean"]
+    for policy in ROBBER_POLICIES:
+        for seed in range(games):
+            failure = check_game(mask, seed, policy, max_turns)
+            if failure is not None:
+                report["failures"].append(dict(failure, policy=policy))
+    return report
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Enumerate every solid grid up to a number of nodes")
+    parser.add_argument("--max-cells", type=int, default=10)
+    parser.add_argument("--min-cells", type=int, default=1)
+    parser.add_argument("--check", action="store_true",
+                        help="Solve the exact capture time and play checked games on every board")
+    parser.add_argument("--processes", type=int, default=None)
+    args = parser.parse_args()
+
+    boards = enumerate_solid_grids(args.max_cells, args.min_cells)
+    if not args.check:
+        counts = Counter(int(mask.sum()) for mask in boards)
+        for size in sorted(counts):
+            print(f"{size:>3} nodes: {counts[size]} boards")
+        sys.exit(0)
+
+    counts = Counter()
+    slowest = {}
+    failures = 0
+    for report in map_boards(check_board, boards, args.processes):
+        size = report["nodes"]
+        counts[size] += 1
+        if report["expected"] is not None and report["expected"] > slowest.get(size, (-1, None))[0]:
+            slowest[size] = (report["expected"], report["mask"])
+        for failure in report["failures"]:
+            failures += 1
+            print(f"{failure['policy']} robber: {failure['invariant']} on turn {failure['turn']} "
+                  f"with seed {failure['seed']}, {failure['detail']}")
+            print(mask_to_text(report["mask"]) + "\n")
+    for size in sorted(counts):
+        worst = f", slowest expected capture turn {slowest[size][0]:.2f}" if size in slowest else ""
+        print(f"{size:>3} nodes: {counts[size]} boards{worst}")
+    print(f"{sum(counts.values())} boards checked, {failures} failed games")
+    sys.exit(1 if failures else 0)
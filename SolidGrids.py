@@ -0,0 +1,61 @@
+import random
+import numpy as np
+
+"""Number of cells reachable from start through cells where open is True, moving up, down, left and right"""
+def flood_count(open_cells, start):
+    # A padded flat list needs no bounds checks and indexes much faster than a NumPy array
+    width = open_cells.shape[1] + 2
+    cells = np.pad(np.asarray(open_cells, dtype=bool), 1).ravel().tolist()
+    first = (start[0] + 1) * width + start[1] + 1
+    cells[first] = False
+    stack = [first]
+    count = 0
+    while stack:
+        cell = stack.pop()
+        count += 1
+        for neighbour in (cell - width, cell + width, cell - 1, cell + 1):
+            if cells[neighbour]:
+                cells[neighbour] = False
+                stack.append(neighbour)
+    return count
+
+"""Checks a mask is a solid grid, connected with no holes, in one linear pass over the nodes and one over the gaps"""
+def is_solid(mask):
+    mask = np.asarray(mask, dtype=bool)
+    total = int(mask.sum())
+    if total == 0:
+        return False
+
+    # Connected, every node is reached from the first one
+    first = tuple(int(v) for v in np.argwhere(mask)[0])
+    if flood_count(mask, first) != total:
+        return False
+
+    # No holes, every gap is reached from outside the board through a border of gaps
+    gaps = ~np.pad(mask, 1)
+    return flood_count(gaps, (0, 0)) == int(gaps.sum())
+
+"""Random solid grid made by peeling border nodes off a full rows x cols grid"""
+def random_solid_grid(rows, cols, rng=None, removals=None):
+    rng = rng if rng is not None else random.Random()
+    mask = np.ones((rows, cols), dtype=bool)
+    removals = removals if removals is not None else rng.randint(0, rows * cols // 2)
+
+    for _ in range(removals):
+        # Nodes next to a gap or the edge of the grid can be removed without making a hole
+        padded = np.pad(mask, 1)
+        border = mask & ~(padded[:-2, 1:-1] & padded[2:, 1:-1] & padded[1:-1, :-2] & padded[1:-1, 2:])
+        candidates = [tuple(int(v) for v in cell) for cell in np.argwhere(border)]
+        rng.shuffle(candidates)
+        for cell in candidates:
+            mask[cell] = False
+            if mask.any() and is_solid(mask):
+                break
+            mask[cell] = True
+        else:
+            break
+    return mask
+
+"""Text drawing of a mask, # for nodes and . for gaps"""
+def mask_to_text(mask):
+    return "\n".join("".join("#" if cell else "." for cell in row) for row in np.asarray(mask, dtype=bool))
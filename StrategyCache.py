@@ -0,0 +1,82 @@
+from collections import OrderedDict
+
+from BoardTables import board_hash, mask_from_graph
+
+"""LRU cache of cop decisions for one board, keyed on the packed strategy state"""
+class DecisionCache:
+    def __init__(self, max_size=100000):
+        self.max_size = max_size
+        self.entries = OrderedDict()
+
+        # Board the cached decisions belong to
+        self.board_signature = None
+        self.cols = 0
+        self.node_bits = 0
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    """Points the cache at a board, cached decisions are dropped if the board is different to the last one"""
+    def set_board(self, graph):
+        mask = mask_from_graph(graph)
+        signature = board_hash(mask)
+        if signature != self.board_signature:
+            self.invalidate()
+            self.board_signature = signature
+            rows, self.cols = mask.shape
+            # One extra value so a missing node packs as zero
+            self.node_bits = (rows * self.cols + 1).bit_length()
+
+    """Drops every cached decision"""
+    def invalidate(self):
+        self.entries.clear()
+
+    """Packs the state a cop decision depends on into a single integer"""
+    def pack_state(self, strategy):
+        # The target path is always nx.shortest_path from its first node, so its first node identifies it
+        fields = [strategy.cop_nodes[0], strategy.cop_nodes[1], strategy.robber_node,
+                  strategy.target_column_path[0] if strategy.target_column_path else None,
+                  strategy.target_node,
+                  strategy.target_path[0] if strategy.target_path else None]
+        # Whether Cop 1 already guards decides if the cops swap roles, so it is part of the key too
+        key = (bool(strategy.cop1_guarded) << 1) | strategy.cop1_pointer
+        for node in fields:
+            node_id = 0 if node is None else node[0] * self.cols + node[1] + 1
+            key = (key << self.node_bits) | node_id
+        return key
+
+    """Cached decision for a packed state or None, counts towards the hit rate"""
+    def get(self, key):
+        decision = self.entries.get(key)
+        if decision is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return decision
+
+    """Stores a decision, evicting the least recently used one when full"""
+    def put(self, key, decision):
+        self.entries[key] = decision
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    """Fraction of lookups answered from the cache"""
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    """Summary of the cache statistics"""
+    def stats(self):
+        return {"size": len(self.entries), "max_size": self.max_size, "hits": self.hits,
+                "misses": self.misses, "evictions": self.evictions, "hit_rate": self.hit_rate()}
+
+    """Resets the statistics without dropping cached decisions"""
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
@@ -0,0 +1,191 @@
+import argparse
+import multiprocessing
+import os
+import random
+import time
+import numpy as np
+import networkx as nx
+
+from BoardTables import board_hash, graph_from_mask
+from ResultsSink import ResultsWriter
+from SimulationStats import RunningStats
+from SolidGrids import random_solid_grid
+from StrategyEngine import StrategyEngine
+from StrategyFuzzer import ROBBER_POLICIES
+
+"""Baseline where both cops step along nx.shortest_path towards the robber"""
+def chase_cops(engine):
+    return [nx.shortest_path(engine.graph, cop, engine.robber_node)[1] if cop != engine.robber_node else cop
+            for cop in engine.cop_nodes]
+
+# Cop policies take the engine and return both cops' next nodes, None keeps the engine's column path strategy
+COP_POLICIES = {"column": None, "chase": chase_cops}
+
+"""Plays one game, returns the capture turn (None if max_turns is reached), the time spent on cop turns and their number
+
+Each cop turn's time is also appended to turn_times when a list is given
+"""
+def play_timed(engine, max_turns, turn_times=None):
+    engine.reset_state()
+    engine.cop_strategy()
+    cop_time = 0.0
+    cop_turns = 0
+    while not engine.is_game_over:
+        if engine.turn_count >= max_turns:
+            return None, cop_time, cop_turns
+        engine.robber_strategy()
+        if not engine.is_game_over:
+            start = time.perf_counter()
+            engine.cop_strategy()
+            elapsed = time.perf_counter() - start
+            cop_time += elapsed
+            cop_turns += 1
+            if turn_times is not None:
+                turn_times.append(elapsed)
+    return engine.turn_count, cop_time, cop_turns
+
+"""Plays one board and seed with every cop policy in a worker process, each policy meets a robber with the same seed
+
+Returns the board hash, the seed and each policy's game, cop turn times are kept only when per_turn is set
+"""
+def run_pair(task):
+    mask, seed, policies, robber, max_turns, per_turn = task
+    graph = graph_from_mask(mask)
+    games = {}
+    for policy in policies:
+        engine = StrategyEngine(graph, seed=seed, robber_policy=ROBBER_POLICIES[robber], cop_policy=COP_POLICIES[policy])
+        turn_times = [] if per_turn else None
+        capture_turn, cop_time, cop_turns = play_timed(engine, max_turns, turn_times)
+        games[policy] = {"capture_turn": capture_turn, "cop_time": cop_time, "cop_turns": cop_turns,
+                         "swap_count": engine.swap_count, "turn_times": turn_times}
+    return {"board_hash": board_hash(mask), "seed": seed, "games": games}
+
+"""Plays every policy on the same random boards and seeds on a process pool, yields each result of run_pair"""
+def compare(policies=tuple(COP_POLICIES), boards=50, games=5, max_size=12, robber="random",
+            max_turns=2000, processes=None, seed=0, per_turn=False):
+    rng = random.Random(seed)
+    tasks = []
+    for _ in range(boards):
+        mask = random_solid_grid(rng.randint(2, max_size), rng.randint(2, max_size), rng)
+        # A board needs room for both cops and the robber
+        if mask.sum() < 3:
+            continue
+        tasks += [(mask, rng.randrange(2 ** 32), policies, robber, max_turns, per_turn) for _ in range(games)]
+    with multiprocessing.Pool(processes) as pool:
+        yield from pool.imap_unordered(run_pair, tasks)
+
+"""Per policy capture times and cop turn cost, and capture time differences paired against the first policy
+
+Results are added one at a time and only running totals are kept, so memory use stays the same however many games
+are added
+"""
+class ComparisonSummary:
+    def __init__(self, policies):
+        self.policies = tuple(policies)
+        self.count = 0
+        self.captures = {policy: RunningStats() for policy in self.policies}
+        self.cop_time = dict.fromkeys(self.policies, 0.0)
+        self.cop_turns = dict.fromkeys(self.policies, 0)
+        # Paired differences against the first policy, a running mean and sum of squared differences
+        self.paired = {policy: {"games": 0, "mean": 0.0, "m2": 0.0, "faster": 0, "slower": 0, "tied": 0}
+                       for policy in self.policies[1:]}
+
+    """Adds one result of run_pair"""
+    def add(self, result):
+        self.count += 1
+        games = result["games"]
+        for policy in self.policies:
+            game = games[policy]
+            self.captures[policy].add_many([-1 if game["capture_turn"] is None else game["capture_turn"]])
+            self.cop_time[policy] += game["cop_time"]
+            self.cop_turns[policy] += game["cop_turns"]
+
+        # Only games both policies finished are paired, a positive difference means the policy took longer
+        baseline = games[self.policies[0]]["capture_turn"]
+        for policy, paired in self.paired.items():
+            capture_turn = games[policy]["capture_turn"]
+            if capture_turn is None or baseline is None:
+                continue
+            difference = capture_turn - baseline
+            paired["games"] += 1
+            delta = difference - paired["mean"]
+            paired["mean"] += delta / paired["games"]
+            paired["m2"] += delta * (difference - paired["mean"])
+            paired["faster" if difference < 0 else "slower" if difference > 0 else "tied"] += 1
+
+    """Summary of every result added so far by policy"""
+    def summary(self):
+        summary = {}
+        for policy in self.policies:
+            captures = self.captures[policy]
+            turns = self.cop_turns[policy]
+            summary[policy] = {"mean_capture": float(captures.mean) if captures.count else None,
+                               "unfinished": captures.unfinished,
+                               "us_per_cop_turn": 1e6 * self.cop_time[policy] / turns if turns else 0.0}
+        for policy, paired in self.paired.items():
+            games = paired["games"]
+            summary[policy]["paired"] = {
+                "games": games, "mean_difference": paired["mean"],
+                "standard_error": float(np.sqrt(paired["m2"] / (games - 1) / games)) if games > 1 else 0.0,
+                "faster": paired["faster"], "slower": paired["slower"], "tied": paired["tied"]}
+        return summary
+
+"""Summary of a collection of run_pair results, see ComparisonSummary"""
+def summarise(results, policies):
+    summary = ComparisonSummary(policies)
+    for result in results:
+        summary.add(result)
+    return summary.summary()
+
+"""Writes one record per policy of a run_pair result, and one per cop turn to turn_writer when it is given
+
+Unfinished games get a capture turn of -1
+"""
+def write_result(result, game_index, writer, turn_writer=None):
+    for policy, game in result["games"].items():
+        writer.append({"game": game_index, "board_hash": result["board_hash"], "seed": result["seed"],
+                       "policy": policy, "capture_turn": -1 if game["capture_turn"] is None else game["capture_turn"],
+                       "swap_count": game["swap_count"], "cop_turns": game["cop_turns"], "cop_time": game["cop_time"]})
+        if turn_writer is not None and game["turn_times"] is not None:
+            for turn, elapsed in enumerate(game["turn_times"]):
+                turn_writer.append({"game": game_index, "policy": policy, "cop_turn": turn, "cop_time": elapsed})
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare cop policies on identical boards and robber seeds")
+    parser.add_argument("--policies", choices=list(COP_POLICIES), nargs="+", default=list(COP_POLICIES),
+                        help="Policies to compare, differences are paired against the first")
+    parser.add_argument("--boards", type=int, default=50)
+    parser.add_argument("--games", type=int, default=5, help="Games played on each board")
+    parser.add_argument("--max-size", type=int, default=12)
+    parser.add_argument("--robber", choices=list(ROBBER_POLICIES), default="random")
+    parser.add_argument("--max-turns", type=int, default=2000)
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--results", help="Folder every game is streamed to as ResultsSink chunks")
+    parser.add_argument("--per-turn", action="store_true", help="Also stream each cop turn's time to RESULTS/turns")
+    args = parser.parse_args()
+
+    writer = ResultsWriter(args.results) if args.results else None
+    turn_writer = ResultsWriter(os.path.join(args.results, "turns")) if args.results and args.per_turn else None
+    # Results are summarised and written as they arrive, none of them are kept
+    running = ComparisonSummary(args.policies)
+    for result in compare(tuple(args.policies), args.boards, args.games, args.max_size, args.robber,
+                          args.max_turns, args.processes, args.seed, args.per_turn and writer is not None):
+        if writer is not None:
+            write_result(result, running.count, writer, turn_writer)
+        running.add(result)
+    for sink in (writer, turn_writer):
+        if sink is not None:
+            sink.close()
+    summary = running.summary()
+    print(f"{running.count} games against the {args.robber} robber")
+    for policy in args.policies:
+        stats = summary[policy]
+        mean = "-" if stats["mean_capture"] is None else f"{stats['mean_capture']:.1f}"
+        print(f"{policy:<8} mean capture turn {mean:<7} unfinished {stats['unfinished']:<5} "
+              f"{stats['us_per_cop_turn']:.1f} us per cop turn")
+        if "paired" in stats:
+            paired = stats["paired"]
+            print(f"         vs {args.policies[0]}: {paired['mean_difference']:+.2f} ± {paired['standard_error']:.2f} turns "
+                  f"over {paired['games']} paired games, faster in {paired['faster']}, slower in {paired['slower']}, "
+                  f"tied in {paired['tied']}")
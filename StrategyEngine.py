@@ -0,0 +1,300 @@
+import random
+import networkx as nx
+
+from RobberTerritory import RobberTerritory
+
+# Attributes which together make up a game state, shared by the engine and the strategy windows
+STATE_FIELDS = ("cop_nodes", "robber_node", "cop1_pointer", "cop2_pointer", "target_column_path",
+                "target_node", "target_path", "cop1_guarded", "is_game_over", "is_robber_turn",
+                "is_placement_phase", "turn_count", "swap_count", "cop_moved", "robber_moved")
+
+"""Copies the game state attributes of an engine or window into a dict, attributes it doesn't have are skipped"""
+def copy_state(source):
+    state = {}
+    for name in STATE_FIELDS:
+        if hasattr(source, name):
+            value = getattr(source, name)
+            state[name] = list(value) if isinstance(value, list) else value
+    return state
+
+"""Sets the game state attributes of an engine or window from a dict made by copy_state"""
+def restore_state(target, state):
+    for name, value in state.items():
+        setattr(target, name, list(value) if isinstance(value, list) else value)
+
+"""Headless version of the automated strategy game, runs without any Qt widgets"""
+class StrategyEngine:
+    def __init__(self, graph=None, seed=None, decision_cache=None, robber_policy=None, cop_policy=None,
+                 track_territory=False):
+        self.rng = random.Random(seed)
+        self.decision_cache = decision_cache
+        # Keeps the robber's territory up to date after every move and records it in territory_stats
+        self.track_territory = track_territory
+        self.territory = None
+
+        # Optional function of the engine returning the robber's next node, the random robber is used when None
+        self.robber_policy = robber_policy
+        # Optional function of the engine returning both cops' next nodes, the column path strategy is used when None
+        self.cop_policy = cop_policy
+
+        # Initialize graph info
+        self.graph = None
+        self.column_path_cache = {}
+        self.column_path_hits = 0
+        self.column_path_misses = 0
+
+        self.reset_state()
+        if graph is not None:
+            self.update_graph(graph)
+
+    """Update the stored graph and clear anything computed for the previous graph"""
+    def update_graph(self, graph):
+        self.graph = graph
+        self.column_path_cache = {}
+        self.column_path_hits = 0
+        self.column_path_misses = 0
+        if self.decision_cache is not None:
+            self.decision_cache.set_board(graph)
+        if self.track_territory:
+            self.territory = RobberTerritory(graph)
+        self.reset_state()
+
+    """Clears the state variables so a fresh game can be started on the same graph"""
+    def reset_state(self):
+        # Player States
+        self.cop_nodes = []
+        self.robber_node = None
+        self.cop1_pointer = 0
+        self.cop2_pointer = 1
+        self.guarding = [False, False]
+        self.target_column_path = []
+        self.target_node = None
+        self.target_path = []
+        self.cop1_guarded = False
+
+        # Game States
+        self.is_game_over = False
+        self.is_robber_turn = False
+        self.is_placement_phase = True
+        self.turn_count = 0
+        self.swap_count = 0
+
+        # Per turn (turn, territory size, column paths left) once the robber is placed, kept when tracking territory
+        self.territory_stats = []
+        if self.territory is not None:
+            self.territory.reset()
+
+    """Plays a full game from cop placement until capture, returns the capture turn or None if max_turns is reached"""
+    def play_game(self, max_turns=None):
+        self.reset_state()
+        self.cop_strategy()
+        while not self.is_game_over:
+            if max_turns is not None and self.turn_count >= max_turns:
+                return None
+            self.robber_strategy()
+            if not self.is_game_over:
+                self.cop_strategy()
+        return self.turn_count
+
+    """Handles randomized movement for robber"""
+    def robber_strategy(self):
+        if self.is_placement_phase:
+            # Choose random move from any node on the graph not currently occupied
+            avaible_nodes = [node for node in self.graph.nodes if node not in self.cop_nodes]
+            if not avaible_nodes:
+                raise ValueError("The board has no free node to place the robber on, it needs at least 3 nodes")
+            self.robber_node = self.rng.choice(avaible_nodes)
+            self.is_placement_phase = False
+        elif self.robber_policy is not None:
+            self.robber_node = self.robber_policy(self)
+        else:
+            # Choose random move from neighbouring nodes and node currenly at
+            y, x = self.robber_node
+            potential_moves = [(y, x), (y+1, x), (y-1, x), (y, x+1), (y, x-1)]
+            random_node = self.rng.choice(potential_moves)
+            if random_node in self.graph:
+                self.robber_node = random_node
+
+        self.turn_count += 1
+        self.is_robber_turn = not self.is_robber_turn
+        self.check_game_over()
+        self.record_territory()
+
+    """Handles logic for deciding cops moves to implement strategy of capturing robber"""
+    def cop_strategy(self):
+        if self.is_placement_phase:
+            if not self.is_robber_turn:
+                self.place_cops()
+                self.is_robber_turn = not self.is_robber_turn
+            return
+
+        if self.cop_policy is not None:
+            self.cop_nodes = list(self.cop_policy(self))
+        # Reuse the decision made the last time this exact state came up
+        elif self.decision_cache is not None:
+            key = self.decision_cache.pack_state(self)
+            decision = self.decision_cache.get(key)
+            if decision is not None:
+                self.apply_decision(decision)
+            else:
+                self.move_cops()
+                self.decision_cache.put(key, self.get_decision())
+        else:
+            self.move_cops()
+
+        self.turn_count += 1
+        self.is_robber_turn = not self.is_robber_turn
+        self.check_game_over()
+        self.record_territory()
+
+    """Records the robber's territory and the column paths left in it for this turn"""
+    def record_territory(self):
+        if self.territory is not None and self.robber_node is not None and len(self.cop_nodes) == 2:
+            size, paths_left = self.territory.update(self.cop_nodes[self.cop2_pointer], self.robber_node)
+            self.territory_stats.append((self.turn_count, size, paths_left))
+
+    """Moves both cops one step of the column path strategy"""
+    def move_cops(self):
+        # Cop 1 Move
+        cop1 = self.cop_nodes[self.cop1_pointer]
+        # Check if C1 is on the target column path
+        if cop1 in self.target_column_path:
+
+            # Find the closest node on target path to robber, compare distance from cop and robber to that node
+            robber_target, robber_target_path = self.shortest_path_to_column_path(self.robber_node, self.target_column_path)
+            cop_to_robber_target = nx.shortest_path_length(self.graph, cop1, robber_target)
+
+            # If Cop 1 can get to that node quicker than the column path is gaureded
+            if cop_to_robber_target < len(robber_target_path):
+                self.cop1_guarded = True
+            else:
+                self.guard_column_path(self.cop1_pointer)
+
+        # If Cop 1 not on target column path make move towards it
+        else:
+            if self.target_node not in self.target_column_path:
+                self.target_node, self.target_path = self.shortest_path_to_column_path(cop1, self.target_column_path)
+
+            # Find Cop 1 on the target path and follow the path to the target node
+            for i in range(0, len(self.target_path) - 1):
+                if cop1 == self.target_path[i]:
+                    self.cop_nodes[self.cop1_pointer] = self.target_path[i+1]
+                    break
+
+        # Cop 2 Move, keep guarding the column path it is on
+        cop2 = self.cop_nodes[self.cop2_pointer]
+        cop2_column_path = self.find_column_path(cop2)
+        robber_target, robber_target_path = self.shortest_path_to_column_path(self.robber_node, cop2_column_path)
+        cop_to_robber_target = nx.shortest_path_length(self.graph, cop2, robber_target)
+        if not (cop_to_robber_target < len(robber_target_path)):
+            self.guard_column_path(self.cop2_pointer)
+
+        # Cop 1 and Cop 2 swap roles once Cop 1 guards the target column path
+        if self.cop1_guarded:
+            self.swap_roles()
+
+    """The part of the state changed by a cop move"""
+    def get_decision(self):
+        return (tuple(self.cop_nodes), self.cop1_pointer, self.cop2_pointer,
+                self.target_column_path, self.target_node, self.target_path)
+
+    """Applies a cop move stored by get_decision"""
+    def apply_decision(self, decision):
+        cop_nodes, cop1_pointer, cop2_pointer, self.target_column_path, self.target_node, self.target_path = decision
+        if cop1_pointer != self.cop1_pointer:
+            self.swap_count += 1
+        self.cop_nodes = list(cop_nodes)
+        self.cop1_pointer = cop1_pointer
+        self.cop2_pointer = cop2_pointer
+
+    """Places C1 in the centre of the rightmost column path and C2 in the centre of the column path next to it"""
+    def place_cops(self):
+        # Find far right node in the highest row, which has the lowest y
+        rightmost_column = max(x for (y, x) in self.graph.nodes)
+        rightmost_nodes = [(y, x) for (y, x) in self.graph.nodes if x == rightmost_column]
+        top_right_node = min(rightmost_nodes, key=lambda node: node[0])
+
+        c1_column_path = self.find_column_path(top_right_node)
+        self.cop_nodes.append(c1_column_path[len(c1_column_path) // 2])
+
+        # Find a node in the adjacent column which has an edge to C1 column path
+        c2_column_path = c1_column_path
+        for node in c1_column_path:
+            y, x = node
+            test_node = (y, x-1)
+            if self.graph.has_edge(node, test_node):
+                c2_column_path = self.find_column_path(test_node)
+                break
+        self.cop_nodes.append(c2_column_path[len(c2_column_path) // 2])
+
+        self.target_column_path = c1_column_path
+        self.guarding = [False, True]
+
+    """Picks the next target column path from the robber's component of G-P and swaps the cop roles"""
+    def swap_roles(self):
+        robber_component = nx.node_connected_component(
+            self.graph.subgraph(set(self.graph.nodes) - set(self.target_column_path)), self.robber_node)
+
+        # Check for nodes which reside on the adjacent column path in the robber's component
+        adjacent_path_node = None
+        for node in self.target_column_path:
+            y, x = node
+            for test_node in [(y, x-1), (y, x+1)]:
+                if test_node in robber_component and self.graph.has_edge(node, test_node):
+                    adjacent_path_node = test_node
+        if adjacent_path_node:
+            self.target_column_path = self.find_column_path(adjacent_path_node)
+
+        # Swap the Cop 1 and Cop 2 pointers
+        self.cop1_pointer, self.cop2_pointer = self.cop2_pointer, self.cop1_pointer
+        self.cop1_guarded = False
+        self.swap_count += 1
+
+    """Check for if cop has captured robber"""
+    def check_game_over(self):
+        if self.robber_node in self.cop_nodes:
+            self.is_game_over = True
+
+    """Finds the column path a node resides in, ordered like the GUI's find_column_path: nearest above first, then the node, then below"""
+    def find_column_path(self, node):
+        if node in self.column_path_cache:
+            self.column_path_hits += 1
+            return self.column_path_cache[node]
+        self.column_path_misses += 1
+
+        # The order decides ties in shortest_path_to_column_path and which node the batch simulator and tables identify
+        # a column path by, so it has to match the GUI. It depends on the start node, so only that node is cached
+        y, x = node
+        upper_list = []
+        while self.graph.has_edge((y - len(upper_list), x), (y - len(upper_list) - 1, x)):
+            upper_list.append((y - len(upper_list) - 1, x))
+        lower_list = []
+        while self.graph.has_edge((y + len(lower_list), x), (y + len(lower_list) + 1, x)):
+            lower_list.append((y + len(lower_list) + 1, x))
+
+        column_path = upper_list + [node] + lower_list
+        self.column_path_cache[node] = column_path
+        return column_path
+
+    """Finds the cloest node in a column path to a given node and the path of nodes to it"""
+    def shortest_path_to_column_path(self, node, column_path):
+        # Single BFS from the node, earliest node in the column path wins ties
+        distances = nx.single_source_shortest_path_length(self.graph, node)
+        target_node = min(column_path, key=lambda path_node: distances[path_node])
+        target_path = nx.shortest_path(self.graph, node, target_node)
+        return target_node, target_path
+
+    """Moves cop up or down to be closer to robber's row"""
+    def guard_column_path(self, cop_pointer):
+        cop_row, cop_column = self.cop_nodes[cop_pointer]
+        robber_row = self.robber_node[0]
+
+        # Move towards the robber's row if possible move exists
+        if cop_row > robber_row:
+            next_move = (cop_row-1, cop_column)
+        elif cop_row < robber_row:
+            next_move = (cop_row+1, cop_column)
+        else:
+            return
+        if next_move in self.graph.nodes:
+            self.cop_nodes[cop_pointer] = next_move
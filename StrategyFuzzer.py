@@ -0,0 +1,193 @@
+import argparse
+import multiprocessing
+import random
+import sys
+import numpy as np
+import networkx as nx
+
+from BoardTables import graph_from_mask
+from SolidGrids import is_solid, mask_to_text, random_solid_grid
+from StrategyEngine import StrategyEngine
+
+"""Raised by CheckedEngine when a turn breaks one of the strategy's invariants"""
+class InvariantViolation(Exception):
+    def __init__(self, invariant, turn, detail):
+        super().__init__(f"{invariant} on turn {turn}: {detail}")
+        self.invariant = invariant
+        self.turn = turn
+        self.detail = detail
+
+"""Robber that stays where it is"""
+def lazy_robber(engine):
+    return engine.robber_node
+
+"""Robber that moves to the neighbouring node furthest from the nearest cop, ties are broken at random"""
+def evasive_robber(engine):
+    distances = [nx.single_source_shortest_path_length(engine.graph, cop) for cop in engine.cop_nodes]
+    options = [engine.robber_node] + sorted(engine.graph.neighbors(engine.robber_node))
+    scores = [min(distance[node] for distance in distances) for node in options]
+    best = max(scores)
+    return engine.rng.choice([node for node, score in zip(options, scores) if score == best])
+
+# None keeps the engine's own random robber
+ROBBER_POLICIES = {"random": None, "lazy": lazy_robber, "evasive": evasive_robber}
+
+"""Strategy engine that checks the guarding invariants after every cop move"""
+class CheckedEngine(StrategyEngine):
+    def reset_state(self):
+        super().reset_state()
+        # Whether the current Cop 2 has reached a guarding position, and the robber's region at the last swap
+        self.cop2_holding = False
+        self.robber_region = None
+
+    def move_cops(self):
+        cop2_pointer = self.cop2_pointer
+        swap_count = self.swap_count
+        super().move_cops()
+
+        if self.swap_count != swap_count:
+            # Cop 1 guarded the target column path without moving, so the new Cop 2 starts out guarding it
+            self.cop2_holding = self.guards(self.cop2_pointer)
+            if not self.cop2_holding:
+                self.violation("cop 2 guard", f"new cop 2 at {self.cop_nodes[self.cop2_pointer]} does not guard its column path")
+        else:
+            guarded = self.guards(cop2_pointer)
+            if self.cop2_holding and not guarded:
+                self.violation("cop 2 guard", f"cop 2 at {self.cop_nodes[cop2_pointer]} stopped guarding "
+                                              f"its column path, robber at {self.robber_node}")
+            self.cop2_holding = guarded
+
+    def swap_roles(self):
+        # Swaps run before the capture check, a robber stepping onto a guarded path is caught on this move
+        if self.robber_node in self.cop_nodes:
+            super().swap_roles()
+            return
+
+        guarded_path = self.target_column_path
+        region = nx.node_connected_component(
+            self.graph.subgraph(set(self.graph.nodes) - set(guarded_path)), self.robber_node)
+        if self.robber_region is not None and not region < self.robber_region:
+            self.violation("region shrink", f"robber's region went from {len(self.robber_region)} "
+                                            f"to {len(region)} nodes")
+        self.robber_region = region
+
+        super().swap_roles()
+        # The next target column path is never the guarded one, so an unchanged target means no adjacent node was found
+        if self.target_column_path == guarded_path:
+            self.violation("adjacent path node", f"no node beside the column path at {guarded_path[0]} "
+                                                 f"in the robber's region")
+
+    """Checks the Cop 2 guard condition for the cop at cop_pointer on the column path it is on"""
+    def guards(self, cop_pointer):
+        cop = self.cop_nodes[cop_pointer]
+        robber_target, robber_target_path = self.shortest_path_to_column_path(self.robber_node, self.find_column_path(cop))
+        return nx.shortest_path_length(self.graph, cop, robber_target) < len(robber_target_path)
+
+    """Stops the game with an InvariantViolation for the current turn"""
+    def violation(self, invariant, detail):
+        raise InvariantViolation(invariant, self.turn_count, detail)
+
+"""Plays one checked game, returns None if it passes or a description of the first failure"""
+def check_game(mask, seed, policy="random", max_turns=2000):
+    engine = CheckedEngine(graph_from_mask(mask), seed=seed, robber_policy=ROBBER_POLICIES[policy])
+    try:
+        engine.play_game(max_turns)
+    except InvariantViolation as error:
+        return {"invariant": error.invariant, "turn": error.turn, "detail": error.detail, "seed": seed}
+    except Exception as error:
+        # Crashes are failures too, grouped by exception type
+        return {"invariant": type(error).__name__, "turn": engine.turn_count, "detail": str(error), "seed": seed}
+    return None
+
+"""Mask with empty rows and columns around the board removed"""
+def crop(mask):
+    rows = np.flatnonzero(mask.any(axis=1))
+    cols = np.flatnonzero(mask.any(axis=0))
+    return mask[rows[0]:rows[-1] + 1, cols[0]:cols[-1] + 1].copy()
+
+"""Solid boards one step smaller than mask, whole edge rows and columns first and then single border nodes"""
+def smaller_boards(mask):
+    rows, cols = mask.shape
+    candidates = []
+    if rows > 1:
+        candidates += [mask[1:], mask[:-1]]
+    if cols > 1:
+        candidates += [mask[:, 1:], mask[:, :-1]]
+    for y, x in np.argwhere(mask).tolist():
+        candidate = mask.copy()
+        candidate[y, x] = False
+        candidates.append(candidate)
+    for candidate in candidates:
+        # A board needs room for both cops and the robber
+        if candidate.sum() >= 3 and is_solid(candidate):
+            yield crop(candidate)
+
+"""First failure of the given invariant over a few seeds starting at seed, None if none of them fail"""
+def find_failure(mask, invariant, policy, seed, max_turns, seed_tries):
+    for game_seed in range(seed, seed + seed_tries):
+        failure = check_game(mask, game_seed, policy, max_turns)
+        if failure is not None and failure["invariant"] == invariant:
+            return failure
+    return None
+
+"""Greedily shrinks a failing board while the same invariant still fails, returns the smallest board and its failure"""
+def shrink_board(mask, failure, policy, max_turns=2000, seed_tries=10):
+    mask = crop(mask)
+    shrinking = True
+    while shrinking:
+        shrinking = False
+        for candidate in smaller_boards(mask):
+            smaller_failure = find_failure(candidate, failure["invariant"], policy, failure["seed"], max_turns, seed_tries)
+            if smaller_failure is not None:
+                mask, failure = candidate, smaller_failure
+                shrinking = True
+                break
+    return mask, failure
+
+"""Fuzzes one random board in a worker process, returns None or a report with the shrunk board"""
+def run_trial(task):
+    trial_seed, max_size, policy, games, max_turns = task
+    rng = random.Random(trial_seed)
+    mask = random_solid_grid(rng.randint(2, max_size), rng.randint(2, max_size), rng)
+    if mask.sum() < 3:
+        return None
+
+    for game in range(games):
+        failure = check_game(mask, trial_seed * 1000 + game, policy, max_turns)
+        if failure is not None:
+            small_mask, small_failure = shrink_board(mask, failure, policy, max_turns)
+            return {"trial_seed": trial_seed, "policy": policy, "board": mask, "failure": failure,
+                    "shrunk_board": small_mask, "shrunk_failure": small_failure}
+    return None
+
+"""Fuzzes random boards on a process pool, yields None for a passing board or a failure report"""
+def fuzz(trials, max_size=12, policies=tuple(ROBBER_POLICIES), games=5, processes=None, seed=0, max_turns=2000):
+    tasks = [(seed * 1000003 + trial, max_size, policies[trial % len(policies)], games, max_turns)
+             for trial in range(trials)]
+    with multiprocessing.Pool(processes) as pool:
+        for report in pool.imap_unordered(run_trial, tasks):
+            yield report
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fuzz the cop strategy's invariants on random solid grids")
+    parser.add_argument("--trials", type=int, default=500)
+    parser.add_argument("--max-size", type=int, default=12)
+    parser.add_argument("--games", type=int, default=5, help="Games played on each board")
+    parser.add_argument("--policy", choices=list(ROBBER_POLICIES), action="append",
+                        help="Robber policy to fuzz with, may be given more than once, defaults to all of them")
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    failures = 0
+    for report in fuzz(args.trials, args.max_size, tuple(args.policy or ROBBER_POLICIES), args.games,
+                       args.processes, args.seed):
+        if report is None:
+            continue
+        failures += 1
+        failure = report["shrunk_failure"]
+        print(f"Trial seed {report['trial_seed']}, {report['policy']} robber: {failure['invariant']} "
+              f"on turn {failure['turn']} with game seed {failure['seed']}, {failure['detail']}")
+        print(mask_to_text(report["shrunk_board"]) + "\n")
+    print(f"{args.trials} boards fuzzed, {failures} failed")
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,194 @@
+import argparse
+import asyncio
+import http.client
+import json
+import socket
+import time
+from collections import deque
+import numpy as np
+import networkx as nx
+
+from BoardTables import board_hash, graph_from_mask, mask_from_graph
+from GameSave import decode_state
+from StrategyCache import DecisionCache
+from StrategyEngine import STATE_FIELDS, StrategyEngine, copy_state, restore_state
+
+"""Local HTTP service answering cop moves for one board, the engine and its caches stay warm between requests
+
+POST /moves with {"states": [...]} plays the cops' turn on each state made by copy_state and returns the states
+after the move, GET /metrics returns throughput, latency and cache statistics. Connections are kept alive
+"""
+class StrategyService:
+    def __init__(self, graph, cache_size=100000, latency_window=10000):
+        self.graph = graph
+        self.board_hash = board_hash(mask_from_graph(graph))
+        self.cache = DecisionCache(cache_size)
+        self.engine = StrategyEngine(graph, decision_cache=self.cache)
+
+        # Metrics, latencies are kept per state for the last latency_window states
+        self.started = time.time()
+        self.requests = 0
+        self.states = 0
+        self.errors = 0
+        self.open_connections = 0
+        self.busy_time = 0.0
+        self.latencies = deque(maxlen=latency_window)
+
+    """Plays the cops' turn on every state and returns the states after it, fields a state leaves out start as new"""
+    def cop_moves(self, states):
+        # Every state is checked before any is played, so only STATE_FIELDS are ever set on the shared engine
+        for state in states:
+            if not isinstance(state, dict):
+                raise ValueError("Each state must be an object")
+            unknown = set(state) - set(STATE_FIELDS)
+            if unknown:
+                raise ValueError(f"Unknown state fields {sorted(unknown)}")
+        results = []
+        for state in states:
+            start = time.perf_counter()
+            self.engine.reset_state()
+            restore_state(self.engine, decode_state(state))
+            self.engine.cop_strategy()
+            results.append(copy_state(self.engine))
+            self.latencies.append(time.perf_counter() - start)
+        self.states += len(states)
+        return results
+
+    """Throughput, latency and cache statistics"""
+    def metrics(self):
+        latencies = np.array(self.latencies) * 1000
+        latency = {"mean": 0.0, "p50": 0.0, "p99": 0.0, "max": 0.0}
+        if len(latencies):
+            latency = {"mean": float(latencies.mean()), "p50": float(np.percentile(latencies, 50)),
+                       "p99": float(np.percentile(latencies, 99)), "max": float(latencies.max())}
+        return {"board_hash": self.board_hash, "nodes": self.graph.number_of_nodes(),
+                "uptime": time.time() - self.started, "requests": self.requests, "states": self.states,
+                "errors": self.errors, "open_connections": self.open_connections,
+                "states_per_second": self.states / self.busy_time if self.busy_time else 0.0,
+                "latency_ms": latency, "cache": self.cache.stats()}
+
+    """Status and JSON payload for one request"""
+    def respond(self, method, path, body):
+        self.requests += 1
+        if method == "GET" and path == "/metrics":
+            return "200 OK", self.metrics()
+        if method == "POST" and path == "/moves":
+            start = time.perf_counter()
+            try:
+                states = json.loads(body)["states"]
+                results = self.cop_moves(states)
+            except (ValueError, KeyError, TypeError, IndexError, nx.NetworkXException) as error:
+                self.errors += 1
+                return "400 Bad Request", {"error": f"{type(error).__name__}: {error}"}
+            except Exception as error:
+                # Anything else still gets an answer so the connection isn't dropped without one
+                self.errors += 1
+                return "500 Internal Server Error", {"error": f"{type(error).__name__}: {error}"}
+            finally:
+                self.busy_time += time.perf_counter() - start
+            return "200 OK", {"states": results}
+        self.errors += 1
+        return "404 Not Found", {"error": f"No endpoint {method} {path}"}
+
+    """Serves HTTP/1.1 requests on one connection until the client closes it or asks to"""
+    async def handle_connection(self, reader, writer):
+        self.open_connections += 1
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                    request_line, *header_lines = head.decode("latin-1").rstrip("\r\n").split("\r\n")
+                    method, path, version = request_line.split(" ")
+                    headers = dict(line.split(":", 1) for line in header_lines)
+                    headers = {name.strip().lower(): value.strip() for name, value in headers.items()}
+                    body = await reader.readexactly(int(headers.get("content-length", 0)))
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+                except ValueError:
+                    await self.send(writer, "400 Bad Request", {"error": "Malformed request"}, False)
+                    break
+
+                keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+                await self.send(writer, *self.respond(method, path, body), keep_alive)
+                if not keep_alive:
+                    break
+        finally:
+            self.open_connections -= 1
+            writer.close()
+
+    """Writes a JSON response"""
+    async def send(self, writer, status, payload, keep_alive):
+        data = json.dumps(payload).encode()
+        writer.write(f"HTTP/1.1 {status}\r\nContent-Type: application/json\r\nContent-Length: {len(data)}\r\n"
+                     f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + data)
+        await writer.drain()
+
+"""Runs the service on a localhost port, or on a Unix socket when unix_path is given"""
+async def serve(service, host="127.0.0.1", port=8765, unix_path=None):
+    if unix_path is not None:
+        server = await asyncio.start_unix_server(service.handle_connection, unix_path)
+    else:
+        server = await asyncio.start_server(service.handle_connection, host, port)
+    async with server:
+        await server.serve_forever()
+
+"""HTTP connection over a Unix socket, for a service started with unix_path"""
+class UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, unix_path):
+        super().__init__("localhost")
+        self.unix_path = unix_path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(self.unix_path)
+
+"""Client for a StrategyService on a localhost port, or on a Unix socket when unix_path is given
+
+One connection is kept alive for every request
+"""
+class StrategyClient:
+    def __init__(self, host="127.0.0.1", port=8765, unix_path=None):
+        if unix_path is not None:
+            self.connection = UnixHTTPConnection(unix_path)
+        else:
+            self.connection = http.client.HTTPConnection(host, port)
+
+    """States after the cops' turn for a batch of states made by copy_state"""
+    def cop_moves(self, states):
+        return [decode_state(state) for state in self.request("POST", "/moves", {"states": states})["states"]]
+
+    """The service's metrics"""
+    def metrics(self):
+        return self.request("GET", "/metrics")
+
+    """Sends one request and returns the decoded JSON reply, errors from the service raise ValueError"""
+    def request(self, method, path, payload=None):
+        body = None if payload is None else json.dumps(payload)
+        self.connection.request(method, path, body, {"Content-Type": "application/json"})
+        response = self.connection.getresponse()
+        reply = json.loads(response.read())
+        if response.status != 200:
+            raise ValueError(reply["error"])
+        return reply
+
+    def close(self):
+        self.connection.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve cop moves for one board over localhost HTTP")
+    parser.add_argument("--rows", type=int, default=10)
+    parser.add_argument("--cols", type=int, default=10)
+    parser.add_argument("--mask", help="Boolean .npy mask of the board, used instead of --rows and --cols")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="Unix socket path to serve on instead of a port")
+    args = parser.parse_args()
+
+    graph = graph_from_mask(np.load(args.mask)) if args.mask else nx.grid_2d_graph(args.rows, args.cols)
+    service = StrategyService(graph)
+    print(f"Serving board {service.board_hash[:12]} ({graph.number_of_nodes()} nodes) on "
+          f"{args.unix or f'{args.host}:{args.port}'}")
+    try:
+        asyncio.run(serve(service, args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,26 @@
+import random
+import numpy as np
+
+from SolidGrids import random_solid_grid
+
+"""Random solid grids with room for both cops and the robber, the same ones on every run"""
+def solid_boards(count, max_size=9, seed=0):
+    rng = random.Random(seed)
+    boards = []
+    while len(boards) < count:
+        mask = random_solid_grid(rng.randint(3, max_size), rng.randint(3, max_size), rng)
+        if mask.sum() >= 3:
+            boards.append(mask)
+    return boards
+
+"""Random generator for StrategyEngine which makes the same draws as a one game BatchSimulator.run with the same seed
+
+The batch picks the robber's start from the free nodes in row major order, which is the order graph_from_mask lists
+them in, and each move from stay, down, up, right and left, the order of the engine's potential moves
+"""
+class BatchRng:
+    def __init__(self, seed):
+        self.rng = np.random.default_rng(seed)
+
+    def choice(self, options):
+        return options[int(self.rng.integers(len(options), size=1)[0])]
@@ -0,0 +1,45 @@
+import os
+import numpy as np
+import pytest
+
+from helpers import BatchRng, solid_boards
+from BatchSimulator import BatchSimulator
+from BoardTables import BoardTables, graph_from_mask
+from StrategyEngine import StrategyEngine
+
+BOARDS = solid_boards(12)
+
+@pytest.mark.parametrize("mask", BOARDS)
+def test_batch_games_match_the_engine_move_for_move(mask):
+    graph = graph_from_mask(mask)
+    simulator = BatchSimulator(graph, BoardTables(graph))
+    for seed in range(10):
+        engine = StrategyEngine(graph)
+        engine.rng = BatchRng(seed)
+        capture_turn = engine.play_game(2000)
+        result = simulator.run(1, seed=seed, max_turns=2000)
+        assert int(result["capture_turn"][0]) == (-1 if capture_turn is None else capture_turn)
+        if capture_turn is not None:
+            assert int(result["swap_count"][0]) == engine.swap_count
+
+@pytest.mark.parametrize("mask", BOARDS)
+def test_tables_order_column_paths_like_the_engine(mask):
+    graph = graph_from_mask(mask)
+    tables = BoardTables(graph)
+    engine = StrategyEngine(graph)
+    for node in graph.nodes:
+        head = tables.path_head[tables.node_id(node)]
+        assert engine.find_column_path(node) == [tables.node_of(i) for i in tables.ordered_column_path(head).tolist()]
+
+@pytest.mark.parametrize("mask", BOARDS[:4])
+def test_engine_column_paths_match_the_gui(mask):
+    pytest.importorskip("PyQt5")
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from types import SimpleNamespace
+    from GraphVisualiser import StrategyWindow
+
+    graph = graph_from_mask(mask)
+    engine = StrategyEngine(graph)
+    window = SimpleNamespace(graph=graph)
+    for node in graph.nodes:
+        assert engine.find_column_path(node) == StrategyWindow.find_column_path(window, node)
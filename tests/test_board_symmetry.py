@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+
+from helpers import solid_boards
+from BoardSymmetry import TRANSFORMS, SymmetricCache, canonical_hash, transform_mask
+from BoardTables import BoardTables, graph_from_mask
+
+@pytest.mark.parametrize("mask", solid_boards(6, seed=5))
+def test_canonical_hash_is_the_same_for_every_transform(mask):
+    hashes = {canonical_hash(transform_mask(mask, transform)) for transform in range(len(TRANSFORMS))}
+    # Padding the board moves it without changing its canonical form
+    hashes.add(canonical_hash(np.pad(mask, ((2, 0), (0, 3)))))
+    assert len(hashes) == 1
+
+@pytest.mark.parametrize("mask", solid_boards(6, seed=6))
+def test_cached_distances_match_the_distances_of_every_transform(mask):
+    cache = SymmetricCache(node_axes=2)
+    cache.put(mask, BoardTables(graph_from_mask(mask)).distances)
+    for transform in range(len(TRANSFORMS)):
+        turned = np.ascontiguousarray(transform_mask(mask, transform))
+        cached = cache.get(turned)
+        assert cached is not None
+        assert np.array_equal(cached, BoardTables(graph_from_mask(turned)).distances)
+    assert cache.misses == 0
+
+def test_other_boards_miss():
+    cache = SymmetricCache()
+    cache.put(np.ones((3, 4), dtype=bool), np.arange(12))
+    assert cache.get(np.ones((4, 3), dtype=bool)) is not None
+    assert cache.get(np.ones((3, 3), dtype=bool)) is None
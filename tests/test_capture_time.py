@@ -0,0 +1,25 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from helpers import solid_boards
+from BatchSimulator import BatchSimulator
+from BoardTables import graph_from_mask
+from CaptureTime import expected_capture_time
+
+@pytest.mark.parametrize("graph", [nx.grid_2d_graph(3, 4), graph_from_mask(solid_boards(1, max_size=5, seed=8)[0])])
+def test_exact_mean_agrees_with_monte_carlo(graph):
+    exact = expected_capture_time(graph, variance=True)
+    turns = BatchSimulator(graph).run(20000, seed=0)["capture_turn"]
+    assert np.all(turns >= 0)
+
+    # Well within 5 standard errors of the simulated mean, and the variances agree to a few percent
+    assert abs(turns.mean() - exact["mean"]) < 5 * np.sqrt(exact["variance"] / len(turns))
+    assert turns.var(ddof=1) == pytest.approx(exact["variance"], rel=0.1)
+
+def test_mean_is_the_average_over_robber_starts():
+    graph = nx.grid_2d_graph(4, 4)
+    exact = expected_capture_time(graph)
+    assert len(exact["per_start"]) == graph.number_of_nodes() - 2
+    assert exact["mean"] == pytest.approx(np.mean(list(exact["per_start"].values())))
+    assert min(exact["per_start"].values()) >= 1
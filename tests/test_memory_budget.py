@@ -0,0 +1,47 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+import BoardTables as board_tables
+from BoardTables import BoardTables, RowCache, set_memory_budget, table_mode
+
+@pytest.fixture
+def budget():
+    yield set_memory_budget
+    set_memory_budget(None)
+
+@pytest.mark.parametrize("limit", [0, 64 * 2 ** 10, 256 * 2 ** 10])
+def test_lookups_under_a_budget_match_the_full_tables(budget, limit):
+    graph = nx.grid_2d_graph(20, 24)
+    full = BoardTables(graph)
+    budget(limit)
+    tables = BoardTables(graph)
+    assert table_mode(tables.distances) != "matrix"
+
+    rng = np.random.default_rng(limit)
+    rows = rng.integers(tables.node_count, size=(50, 3))
+    cols = rng.integers(tables.node_count, size=(50, 3))
+    assert np.array_equal(tables.distances[rows, cols], full.distances[rows, cols])
+    paths = rng.integers(len(tables.column_paths), size=50)
+    assert np.array_equal(tables.component_of[paths, cols[:, 0]], full.component_of[paths, cols[:, 0]])
+
+@pytest.mark.parametrize("limit", [64 * 2 ** 10, 2 ** 20, 4 * 2 ** 20])
+def test_tables_stay_within_the_budget(budget, limit):
+    budget(limit)
+    tables = BoardTables(nx.grid_2d_graph(30, 30))
+    used = 0
+    for table in (tables.distances, tables.component_of):
+        if isinstance(table, RowCache):
+            # Fill the table to its capacity before counting it
+            table[np.arange(table.shape[0]), 0]
+            used += table.max_bytes
+        else:
+            used += board_tables.TABLE_OVERHEAD_BYTES + table.nbytes
+    assert used <= limit
+    assert not board_tables.distance_cache.entries
+
+def test_lifting_the_budget_builds_full_matrices_again(budget):
+    budget(0)
+    assert table_mode(BoardTables(nx.grid_2d_graph(6, 6)).distances) == "bfs"
+    budget(None)
+    assert table_mode(BoardTables(nx.grid_2d_graph(6, 6)).distances) == "matrix"
@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from helpers import solid_boards
+from BoardTables import graph_from_mask
+from ParameterSweep import play_cell, run_cell
+from StrategyEngine import StrategyEngine
+
+@pytest.mark.parametrize("mask", [np.ones((1, 1), dtype=bool), np.ones((1, 2), dtype=bool)])
+def test_boards_too_small_to_play_are_marked(mask):
+    result = play_cell(mask, "random", 0, 5, 100)
+    assert not result["playable"]
+    assert result["capture_turns"] == []
+
+def test_engine_refuses_a_board_with_no_free_node():
+    engine = StrategyEngine(graph_from_mask(np.ones((1, 2), dtype=bool)), seed=0)
+    with pytest.raises(ValueError):
+        engine.play_game(10)
+
+@pytest.mark.parametrize("policy", ["random", "lazy", "evasive"])
+def test_cells_play_every_game(policy):
+    result = play_cell(solid_boards(1, seed=10)[0], policy, 3, 4, 2000)
+    assert result["playable"]
+    assert len(result["capture_turns"]) == len(result["swap_counts"]) == 4
+
+def test_cell_results_are_read_back_from_disk(tmp_path):
+    cell = {"shape": "full", "rows": 4, "cols": 5, "policy": "random", "seed": 1}
+    _, first, cached = run_cell((cell, 3, 500, str(tmp_path)))
+    assert not cached
+    _, second, cached = run_cell((cell, 3, 500, str(tmp_path)))
+    assert cached
+    assert second == first
+
+@pytest.mark.parametrize("seed", range(20))
+def test_small_random_cells_never_fail(seed, tmp_path):
+    cell = {"shape": "random", "rows": 2, "cols": 2, "policy": "random", "seed": seed}
+    _, result, _ = run_cell((cell, 2, 200, str(tmp_path)))
+    assert result["playable"] == (result["nodes"] >= 3)
@@ -0,0 +1,31 @@
+import pytest
+
+from helpers import solid_boards
+from BoardTables import graph_from_mask
+from PolicyTable import PolicyTable, save_policy
+from StrategyEngine import StrategyEngine
+
+@pytest.mark.parametrize("mask", solid_boards(5, seed=3))
+def test_every_cop_move_is_in_the_table_and_matches_the_engine(mask, tmp_path):
+    graph = graph_from_mask(mask)
+    save_policy(graph, str(tmp_path))
+    table = PolicyTable.find(graph, str(tmp_path))
+    assert table is not None
+
+    for seed in range(6):
+        engine = StrategyEngine(graph, seed=seed)
+        engine.cop_strategy()
+        while not engine.is_game_over and engine.turn_count < 2000:
+            engine.robber_strategy()
+            if engine.is_game_over:
+                break
+            response = table.lookup(engine)
+            assert response is not None
+            engine.cop_strategy()
+            assert table.matches(engine, response)
+
+def test_tables_are_only_found_for_their_own_board(tmp_path):
+    first, second = (graph_from_mask(mask) for mask in solid_boards(2, seed=4))
+    save_policy(first, str(tmp_path))
+    assert PolicyTable.find(first, str(tmp_path)) is not None
+    assert PolicyTable.find(second, str(tmp_path)) is None
@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+
+from ResultsSink import ResultsReader, ResultsWriter
+
+def test_records_read_back_in_order_across_chunks(tmp_path):
+    with ResultsWriter(str(tmp_path), chunk_rows=3) as writer:
+        for game in range(5):
+            writer.append({"game": game, "capture_turn": game * 10})
+        writer.append_columns({"game": np.arange(5, 12), "capture_turn": 7})
+
+    reader = ResultsReader(str(tmp_path))
+    assert len(reader) == 12
+    assert np.array_equal(reader.column("game"), np.arange(12))
+    assert reader.column("capture_turn").tolist() == [0, 10, 20, 30, 40] + [7] * 7
+    assert list(reader)[4] == {"game": 4, "capture_turn": 40}
+
+def test_writing_again_carries_on_after_the_existing_chunks(tmp_path):
+    for start in (0, 4):
+        with ResultsWriter(str(tmp_path), chunk_rows=3) as writer:
+            writer.append_columns({"game": np.arange(start, start + 4)})
+    assert np.array_equal(ResultsReader(str(tmp_path)).column("game"), np.arange(8))
+
+@pytest.mark.parametrize("record", [{"game": 1}, {"game": 1, "seed": 2, "extra": 3}, {"game": 1, "other": 2}])
+def test_records_with_other_columns_are_rejected_whole(tmp_path, record):
+    with ResultsWriter(str(tmp_path)) as writer:
+        writer.append({"game": 0, "seed": 0})
+        with pytest.raises(ValueError):
+            writer.append(record)
+        with pytest.raises(ValueError):
+            writer.append_columns({name: np.arange(3) for name in record})
+        assert writer.rows == 1
+    assert list(ResultsReader(str(tmp_path))) == [{"game": 0, "seed": 0}]
@@ -0,0 +1,37 @@
+import networkx as nx
+import pytest
+
+from helpers import solid_boards
+from BoardTables import graph_from_mask
+from RobberTerritory import RobberTerritory
+from StrategyEngine import StrategyEngine
+
+"""Territory found directly, the robber's component of G-P with P the guarded column path, and the paths left in it"""
+def brute_force_territory(engine):
+    guarded = engine.find_column_path(engine.cop_nodes[engine.cop2_pointer])
+    if engine.robber_node in guarded:
+        return 0, 0
+    rest = engine.graph.subgraph(set(engine.graph.nodes) - set(guarded))
+    nodes = nx.node_connected_component(rest, engine.robber_node)
+    tops = {min(engine.find_column_path(node)) for node in nodes}
+    # A column path counts when all of it lies in the territory
+    paths_left = sum(1 for top in tops if set(engine.find_column_path(top)) <= nodes)
+    return len(nodes), paths_left
+
+@pytest.mark.parametrize("mask", solid_boards(6, seed=9))
+def test_territory_matches_a_fresh_search_every_turn(mask):
+    graph = graph_from_mask(mask)
+    for seed in range(4):
+        engine = StrategyEngine(graph, seed=seed, track_territory=True)
+        engine.cop_strategy()
+        while not engine.is_game_over and engine.turn_count < 2000:
+            engine.robber_strategy()
+            assert engine.territory_stats[-1][1:] == brute_force_territory(engine)
+            if not engine.is_game_over:
+                engine.cop_strategy()
+                assert engine.territory_stats[-1][1:] == brute_force_territory(engine)
+
+def test_column_paths_are_listed_top_to_bottom():
+    territory = RobberTerritory(nx.grid_2d_graph(3, 2))
+    assert territory.column_path((1, 1)) == ((0, 1), (1, 1), (2, 1))
+    assert territory.is_path_top((0, 1)) and not territory.is_path_top((2, 1))
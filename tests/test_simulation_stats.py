@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+from SimulationStats import RunningStats
+
+def test_chunks_add_up_to_the_statistics_of_all_games():
+    rng = np.random.default_rng(0)
+    chunks = [rng.integers(-1, 300, size=size) for size in (1, 50, 0, 400, 7)]
+    stats = RunningStats(bin_count=8)
+    for chunk in chunks:
+        stats.add_many(chunk)
+
+    games = np.concatenate(chunks)
+    finished = games[games >= 0]
+    assert stats.count == len(finished)
+    assert stats.unfinished == np.count_nonzero(games < 0)
+    assert stats.mean == pytest.approx(finished.mean())
+    assert stats.variance() == pytest.approx(finished.var(ddof=1))
+    assert (stats.min, stats.max) == (finished.min(), finished.max())
+
+    # Every finished game lands in the bin its capture turn falls in
+    assert stats.histogram.sum() == len(finished)
+    expected = np.bincount(finished // stats.bin_width, minlength=len(stats.histogram))
+    assert np.array_equal(stats.histogram, expected)
+    assert stats.max < stats.bin_width * len(stats.histogram)
+
+def test_unfinished_games_only_are_counted_apart():
+    stats = RunningStats()
+    stats.add_many([-1, -1])
+    assert (stats.count, stats.unfinished, stats.min, stats.variance()) == (0, 2, None, 0.0)
+
+@pytest.mark.parametrize("bin_count", [0, 1, 7, 51])
+def test_bin_count_must_be_even(bin_count):
+    with pytest.raises(ValueError):
+        RunningStats(bin_count)
@@ -0,0 +1,25 @@
+from collections import Counter
+
+from BoardSymmetry import canonical_hash
+from SolidEnumeration import enumerate_solid_grids, fixed_polyominoes
+from SolidGrids import is_solid
+
+# Fixed polyominoes by cell count, OEIS A001168
+FIXED_COUNTS = [1, 2, 6, 19, 63, 216, 760, 2725]
+# Polyominoes without holes up to rotation and reflection, OEIS A000104
+SOLID_COUNTS = [1, 1, 2, 5, 12, 35, 107, 363]
+
+def test_fixed_polyomino_counts():
+    counts = Counter(len(cells) for cells in fixed_polyominoes(len(FIXED_COUNTS)))
+    assert [counts[size] for size in range(1, len(FIXED_COUNTS) + 1)] == FIXED_COUNTS
+
+def test_solid_grid_counts_match_hole_free_polyominoes():
+    boards = list(enumerate_solid_grids(len(SOLID_COUNTS)))
+    counts = Counter(int(mask.sum()) for mask in boards)
+    assert [counts[size] for size in range(1, len(SOLID_COUNTS) + 1)] == SOLID_COUNTS
+    assert all(is_solid(mask) for mask in boards)
+    # Each board is found once up to rotation and reflection
+    assert len({canonical_hash(mask) for mask in boards}) == len(boards)
+
+def test_min_cells_skips_smaller_boards():
+    assert Counter(int(mask.sum()) for mask in enumerate_solid_grids(5, min_cells=4)) == {4: 5, 5: 12}
@@ -0,0 +1,36 @@
+import pytest
+
+from helpers import solid_boards
+from BoardTables import graph_from_mask
+from StrategyCache import DecisionCache
+from StrategyEngine import StrategyEngine
+
+@pytest.mark.parametrize("mask", solid_boards(6, seed=1))
+def test_cached_games_match_uncached_ones(mask):
+    graph = graph_from_mask(mask)
+    cache = DecisionCache()
+    for seed in range(8):
+        plain = StrategyEngine(graph, seed=seed)
+        cached = StrategyEngine(graph, seed=seed, decision_cache=cache)
+        assert cached.play_game(2000) == plain.play_game(2000)
+        assert cached.swap_count == plain.swap_count
+    assert cache.hits > 0
+
+def test_guarded_and_unguarded_states_get_different_keys():
+    engine = StrategyEngine(graph_from_mask(solid_boards(1)[0]), seed=0)
+    cache = DecisionCache()
+    cache.set_board(engine.graph)
+    engine.cop_strategy()
+    engine.robber_strategy()
+    engine.cop1_guarded = False
+    unguarded = cache.pack_state(engine)
+    engine.cop1_guarded = True
+    assert cache.pack_state(engine) != unguarded
+
+def test_a_different_board_drops_cached_decisions():
+    first, second = (graph_from_mask(mask) for mask in solid_boards(2, seed=2))
+    cache = DecisionCache()
+    StrategyEngine(first, seed=0, decision_cache=cache).play_game(2000)
+    assert cache.stats()["size"] > 0
+    StrategyEngine(second, seed=0, decision_cache=cache)
+    assert cache.stats()["size"] == 0
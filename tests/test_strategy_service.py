@@ -0,0 +1,57 @@
+import json
+
+import pytest
+
+from helpers import solid_boards
+from BoardTables import graph_from_mask
+from StrategyEngine import StrategyEngine, copy_state
+from StrategyService import StrategyService
+
+"""States at every cop turn of a few engine games, with the states the engine moved to from them"""
+def engine_turns(graph, games=3):
+    turns = []
+    for seed in range(games):
+        engine = StrategyEngine(graph, seed=seed)
+        engine.cop_strategy()
+        while not engine.is_game_over and engine.turn_count < 2000:
+            engine.robber_strategy()
+            if engine.is_game_over:
+                break
+            before = copy_state(engine)
+            engine.cop_strategy()
+            turns.append((before, copy_state(engine)))
+    return turns
+
+@pytest.mark.parametrize("mask", solid_boards(3, seed=11))
+def test_service_moves_match_the_engine(mask):
+    graph = graph_from_mask(mask)
+    service = StrategyService(graph)
+    turns = engine_turns(graph)
+    body = json.dumps({"states": [before for before, _ in turns]})
+    status, payload = service.respond("POST", "/moves", body)
+    assert status == "200 OK"
+    assert payload["states"] == [after for _, after in turns]
+    assert service.errors == 0
+
+@pytest.mark.parametrize("body", ["not json", "{}", '{"states": [1]}', '{"states": [{"unknown": 1}]}'])
+def test_bad_requests_get_400(body):
+    service = StrategyService(graph_from_mask(solid_boards(1)[0]))
+    status, payload = service.respond("POST", "/moves", body)
+    assert status == "400 Bad Request"
+    assert "error" in payload
+    assert service.errors == 1
+
+def test_unexpected_errors_get_500(monkeypatch):
+    service = StrategyService(graph_from_mask(solid_boards(1)[0]))
+    def fail(states):
+        raise RuntimeError("broken")
+    monkeypatch.setattr(service, "cop_moves", fail)
+    status, payload = service.respond("POST", "/moves", '{"states": []}')
+    assert status == "500 Internal Server Error"
+    assert payload["error"] == "RuntimeError: broken"
+    assert service.errors == 1
+    assert service.respond("GET", "/metrics", b"")[1]["errors"] == 1
+
+def test_unknown_endpoints_get_404():
+    service = StrategyService(graph_from_mask(solid_boards(1)[0]))
+    assert service.respond("GET", "/moves", b"")[0] == "404 Not Found"